@@ -3,6 +3,7 @@ from typing import Any, Dict
 async def create_poi(manager, payload: Dict[str, Any]) -> bool:
     try:
         await manager.state_manager.poi_db.create(payload)
+        manager.state_manager.refresh_canvas_for_poi(str(payload.get("id") or ""))
         return True
     except Exception as e:
         print(f"Error creating POI: {e}")
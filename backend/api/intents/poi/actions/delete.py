@@ -5,7 +5,10 @@ async def delete_poi(manager, payload: Dict[str, Any]) -> bool:
     if not poi_id:
         return False
     try:
-        return await manager.state_manager.poi_db.delete(poi_id)
+        deleted = await manager.state_manager.poi_db.delete(poi_id)
+        if deleted:
+            manager.state_manager.refresh_canvas_for_poi(poi_id)
+        return deleted
     except Exception as e:
         print(f"Error deleting POI: {e}")
         return False
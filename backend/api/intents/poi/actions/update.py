@@ -6,6 +6,8 @@ async def update_poi(manager, payload: Dict[str, Any]) -> bool:
         return False
     try:
         updated = await manager.state_manager.poi_db.update(poi_id, payload)
+        if updated:
+            manager.state_manager.refresh_canvas_for_poi(poi_id)
         return bool(updated)
     except Exception as e:
         print(f"Error updating POI: {e}")
@@ -10,7 +10,4 @@ async def update_fixture_target(manager, payload: Dict[str, Any]) -> bool:
         return False
 
     res = await manager.state_manager.update_fixture_poi_target(fixture_id, poi_id, pan, tilt)
-    if res.get("ok"):
-        manager.state_manager.canvas_dirty = True
-        return True
-    return False
+    return bool(res.get("ok"))
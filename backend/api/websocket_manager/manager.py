@@ -54,6 +54,11 @@ class WebSocketManager:
         target_fps = 60.0
         frame_interval = 1.0 / target_fps
         next_tick = time.perf_counter()
+        # The ticker runs faster than the canvas FPS; a tick that lands on the frame already
+        # sent skips the universe copy and Art-Net write. The key also carries the Art-Net
+        # output version, so a live channel edit since the last write is overwritten by the
+        # canvas frame instead of sticking until the frame changes.
+        sent_key = None
 
         while self._playback_task_running:
             next_tick += frame_interval
@@ -65,13 +70,17 @@ class WebSocketManager:
                 next_tick = now
 
             if not await self.state_manager.get_is_playing():
+                sent_key = None
                 continue
 
-            await self.state_manager.advance_timecode(frame_interval)
+            output_frame = await self.state_manager.advance_timecode(frame_interval)
             if not await self.state_manager.get_is_playing():
+                sent_key = None
                 continue
-            universe = await self.state_manager.get_output_universe()
-            await self.artnet_service.update_universe(universe)
+            if output_frame is None or (output_frame, self.artnet_service.output_version) != sent_key:
+                universe = await self.state_manager.get_output_universe()
+                await self.artnet_service.update_universe(universe)
+                sent_key = (output_frame, self.artnet_service.output_version)
             await self._schedule_broadcast()
 
     async def connect(self, websocket: WebSocket):
@@ -5,13 +5,26 @@ from .responses import fail, ok
 
 def register_canvas_tools(mcp, runtime) -> None:
     @mcp.tool()
-    async def render_dmx_canvas():
+    async def render_dmx_canvas(compact: bool = False):
+        """
+        Re-render the current song's DMX canvas and export it as a `.dmx` show file.
+        With compact=true the show is written as a run/delta `.compact.dmx` (DMXP version 2),
+        which the standalone dmx_player plays like the full file.
+        """
         ws_manager = runtime.require_ws_manager()
-        result = await ws_manager.state_manager.rerender_dmx_canvas()
+        result = await ws_manager.state_manager.rerender_dmx_canvas(compact=bool(compact))
         if not result.get("ok"):
             return fail("dmx_render_failed", "Could not render DMX canvas", result)
         return ok(result)
 
+    @mcp.tool()
+    async def profile_dmx_canvas():
+        ws_manager = runtime.require_ws_manager()
+        result = await ws_manager.state_manager.profile_dmx_canvas()
+        if not result.get("ok"):
+            return fail("dmx_profile_failed", "Could not profile DMX canvas render", result)
+        return ok(result)
+
     @mcp.tool()
     async def read_fixture_output_window(
         fixture_id: str,
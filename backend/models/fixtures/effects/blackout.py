@@ -1,5 +1,5 @@
-from typing import Any, Dict
-from .registry import Effect, REGISTRY
+from typing import Any, Dict, List
+from .registry import Effect, REGISTRY, carry_column
 
 class BlackoutEffect(Effect):
     @property
@@ -31,6 +31,26 @@ class BlackoutEffect(Effect):
         meta = getattr(fixture, "meta_channels", {})
         return any(k in meta for k in ["dim", "shutter", "rgb"])
 
+    def _start_values(self, fixture: Any) -> Dict[str, Any]:
+        meta = getattr(fixture, "meta_channels", {})
+        values: Dict[str, Any] = {}
+
+        # If it has a dimmer or shutter, zero it out
+        for key in ["dim", "shutter"]:
+            if key in meta:
+                channel = meta[key].channel
+                if channel and channel in fixture.channels:
+                    values[channel] = 0
+        
+        # Also zero out rgb mapping if present, assuming no independent dimmer
+        if "rgb" in meta:
+            channels = meta["rgb"].channels
+            if channels:
+                for channel in channels:
+                    if channel in fixture.channels:
+                        values[channel] = 0
+        return values
+
     def render(
         self,
         fixture: Any,
@@ -46,21 +66,26 @@ class BlackoutEffect(Effect):
         if frame_index != start_frame:
             return  # Only fire on the exact start frame
 
-        meta = getattr(fixture, "meta_channels", {})
+        for channel, value in self._start_values(fixture).items():
+            fixture._write_channel(universe, channel, value)
 
-        # If it has a dimmer or shutter, zero it out
-        for key in ["dim", "shutter"]:
-            if key in meta:
-                channel = meta[key].channel
-                if channel and channel in fixture.channels:
-                    fixture._write_channel(universe, channel, 0)
-        
-        # Also zero out rgb mapping if present, assuming no independent dimmer
-        if "rgb" in meta:
-            channels = meta["rgb"].channels
-            if channels:
-                for channel in channels:
-                    if channel in fixture.channels:
-                        fixture._write_channel(universe, channel, 0)
+    def render_span(
+        self,
+        fixture: Any,
+        universe: bytearray,
+        *,
+        first_frame: int,
+        last_frame: int,
+        start_frame: int,
+        end_frame: int,
+        fps: int,
+        data: Dict[str, Any],
+        render_state: Dict[str, Any],
+    ) -> Dict[str, List[int]]:
+        frames = range(first_frame, last_frame + 1)
+        return {
+            channel: carry_column(universe, fixture, channel, [value if frame == start_frame else None for frame in frames])
+            for channel, value in self._start_values(fixture).items()
+        }
 
 REGISTRY.register(BlackoutEffect())
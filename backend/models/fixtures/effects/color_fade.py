@@ -1,8 +1,8 @@
-from typing import Any, Dict
+from typing import Any, Dict, List
 from colorsys import rgb_to_hsv, hsv_to_rgb
-from .registry import Effect, REGISTRY
+from .registry import Effect, REGISTRY, carry_column
 from .easing import apply_easing
-from .fade_in import _get_rgb_channels
+from .fade_in import _get_rgb_channels, _span_progress
 from ..rgb_utils import resolve_rgb_value
 
 class ColorFadeEffect(Effect):
@@ -39,34 +39,7 @@ class ColorFadeEffect(Effect):
         meta = getattr(fixture, "meta_channels", {})
         return "rgb" in meta
 
-    def render(
-        self,
-        fixture: Any,
-        universe: bytearray,
-        *,
-        frame_index: int,
-        start_frame: int,
-        end_frame: int,
-        fps: int,
-        data: Dict[str, Any],
-        render_state: Dict[str, Any],
-    ) -> None:
-        payload = data or {}
-        easing_type = payload.get("easing", "linear")
-
-        duration_frames = max(1, end_frame - start_frame)
-        raw_progress = (frame_index - start_frame) / float(duration_frames)
-        if end_frame <= start_frame:
-            raw_progress = 1.0
-            if frame_index != start_frame:
-                return
-
-        progress = apply_easing(raw_progress, easing_type)
-
-        rgb_chs = _get_rgb_channels(fixture)
-        if not rgb_chs or len(rgb_chs) < 3:
-            return  # Needs exact red, green, blue mapping structurally.
-
+    def _fade_state(self, fixture: Any, universe: bytearray, payload: Dict[str, Any], rgb_chs: List[str], render_state: Dict[str, Any]) -> Dict[str, float]:
         if "fade_state" not in render_state:
             mapping = fixture.template.mappings.get("color") if hasattr(fixture.template, "mappings") else {}
             
@@ -101,8 +74,10 @@ class ColorFadeEffect(Effect):
                 "dh": dh, "ds": s2 - s1, "dv": v2 - v1
             }
 
-        state = render_state["fade_state"]
-        
+        return render_state["fade_state"]
+
+    @staticmethod
+    def _rgb_at(state: Dict[str, float], progress: float) -> tuple:
         # Interpolate
         cur_h = (state["h1"] + state["dh"] * progress) % 1.0
         if cur_h < 0:
@@ -113,12 +88,67 @@ class ColorFadeEffect(Effect):
         # Convert back
         cr, cg, cb = hsv_to_rgb(cur_h, cur_s, cur_v)
         ir, ig, ib = int(round(cr * 255)), int(round(cg * 255)), int(round(cb * 255))
+        return max(0, min(255, ir)), max(0, min(255, ig)), max(0, min(255, ib))
+
+    def render(
+        self,
+        fixture: Any,
+        universe: bytearray,
+        *,
+        frame_index: int,
+        start_frame: int,
+        end_frame: int,
+        fps: int,
+        data: Dict[str, Any],
+        render_state: Dict[str, Any],
+    ) -> None:
+        payload = data or {}
+        easing_type = payload.get("easing", "linear")
+
+        duration_frames = max(1, end_frame - start_frame)
+        raw_progress = (frame_index - start_frame) / float(duration_frames)
+        if end_frame <= start_frame:
+            raw_progress = 1.0
+            if frame_index != start_frame:
+                return
+
+        progress = apply_easing(raw_progress, easing_type)
+
+        rgb_chs = _get_rgb_channels(fixture)
+        if not rgb_chs or len(rgb_chs) < 3:
+            return  # Needs exact red, green, blue mapping structurally.
+
+        state = self._fade_state(fixture, universe, payload, rgb_chs, render_state)
+        rgb = self._rgb_at(state, progress)
+        for index in range(3):
+            if rgb_chs[index] in fixture.channels:
+                fixture._write_channel(universe, rgb_chs[index], rgb[index])
+
+    def render_span(
+        self,
+        fixture: Any,
+        universe: bytearray,
+        *,
+        first_frame: int,
+        last_frame: int,
+        start_frame: int,
+        end_frame: int,
+        fps: int,
+        data: Dict[str, Any],
+        render_state: Dict[str, Any],
+    ) -> Dict[str, List[int]]:
+        payload = data or {}
+        progress = _span_progress(first_frame, last_frame, start_frame, end_frame, payload.get("easing", "linear"))
+        rgb_chs = _get_rgb_channels(fixture)
+        if all(value is None for value in progress) or not rgb_chs or len(rgb_chs) < 3:
+            return {}
 
-        if rgb_chs[0] in fixture.channels:
-            fixture._write_channel(universe, rgb_chs[0], max(0, min(255, ir)))
-        if rgb_chs[1] in fixture.channels:
-            fixture._write_channel(universe, rgb_chs[1], max(0, min(255, ig)))
-        if rgb_chs[2] in fixture.channels:
-            fixture._write_channel(universe, rgb_chs[2], max(0, min(255, ib)))
+        state = self._fade_state(fixture, universe, payload, rgb_chs, render_state)
+        rgb_by_frame = [None if value is None else self._rgb_at(state, value) for value in progress]
+        return {
+            rgb_chs[index]: carry_column(universe, fixture, rgb_chs[index], [None if rgb is None else rgb[index] for rgb in rgb_by_frame])
+            for index in range(3)
+            if rgb_chs[index] in fixture.channels
+        }
 
 REGISTRY.register(ColorFadeEffect())
@@ -1,5 +1,5 @@
-from typing import Any, Dict
-from .registry import Effect, REGISTRY
+from typing import Any, Dict, List, Optional
+from .registry import Effect, REGISTRY, carry_column
 from .easing import apply_easing
 from ..rgb_utils import resolve_rgb_value
 
@@ -15,6 +15,30 @@ def _get_dim_channel(fixture: Any) -> str | None:
         return meta["dim"].channel
     return None
 
+def _span_progress(first_frame: int, last_frame: int, start_frame: int, end_frame: int, easing_type: Any) -> List[Optional[float]]:
+    """Eased progress per frame of a span; None where a zero-length fade writes nothing."""
+    if end_frame <= start_frame:
+        return [apply_easing(1.0, easing_type) if frame == start_frame else None for frame in range(first_frame, last_frame + 1)]
+    duration_frames = max(1, end_frame - start_frame)
+    return [apply_easing((frame - start_frame) / float(duration_frames), easing_type) for frame in range(first_frame, last_frame + 1)]
+
+def _span_fade_columns(
+    fixture: Any,
+    universe: bytearray,
+    levels: Dict[str, tuple],
+    progress: List[Optional[float]],
+) -> Dict[str, List[int]]:
+    """Per-channel span columns for (start, target) level pairs interpolated by progress."""
+    return {
+        ch: carry_column(
+            universe,
+            fixture,
+            ch,
+            [None if value is None else int(round(start_val + (target_val - start_val) * value)) for value in progress],
+        )
+        for ch, (start_val, target_val) in levels.items()
+    }
+
 class FadeInEffect(Effect):
     @property
     def id(self) -> str:
@@ -47,31 +71,7 @@ class FadeInEffect(Effect):
         meta = getattr(fixture, "meta_channels", {})
         return any(k in meta for k in ["dim", "rgb"])
 
-    def render(
-        self,
-        fixture: Any,
-        universe: bytearray,
-        *,
-        frame_index: int,
-        start_frame: int,
-        end_frame: int,
-        fps: int,
-        data: Dict[str, Any],
-        render_state: Dict[str, Any],
-    ) -> None:
-        payload = data or {}
-        easing_type = payload.get("easing", "linear")
-
-        duration_frames = max(1, end_frame - start_frame)
-        raw_progress = (frame_index - start_frame) / float(duration_frames)
-        # For fade_in (duration=0), snap immediately
-        if end_frame <= start_frame:
-            raw_progress = 1.0
-            if frame_index != start_frame:
-                return
-
-        progress = apply_easing(raw_progress, easing_type)
-
+    def _start_state(self, fixture: Any, universe: bytearray, payload: Dict[str, Any], render_state: Dict[str, Any]) -> Dict[str, int]:
         dim_ch = _get_dim_channel(fixture)
         rgb_chs = _get_rgb_channels(fixture)
 
@@ -104,7 +104,12 @@ class FadeInEffect(Effect):
 
             render_state["start_state"] = start_state
 
-        start_state = render_state["start_state"]
+        return render_state["start_state"]
+
+    def _levels(self, fixture: Any, payload: Dict[str, Any], start_state: Dict[str, int]) -> Dict[str, tuple]:
+        """(start, target) level per channel, in write order."""
+        dim_ch = _get_dim_channel(fixture)
+        levels: Dict[str, tuple] = {}
 
         if dim_ch and dim_ch in start_state:
             start_val = start_state[dim_ch]
@@ -114,11 +119,9 @@ class FadeInEffect(Effect):
             if legacy_target is not None:
                 target_val = int(legacy_target * 255 if isinstance(legacy_target, float) and legacy_target <= 1.0 else legacy_target)
 
-            target_val = max(0, min(255, target_val))
-            cur_val = int(round(start_val + (target_val - start_val) * progress))
-            fixture._write_channel(universe, dim_ch, cur_val)
+            levels[dim_ch] = (start_val, max(0, min(255, target_val)))
         
-        for ch in rgb_chs:
+        for ch in _get_rgb_channels(fixture):
             if ch in start_state:
                 start_val = start_state[ch]
                 target_val = 255 # fade_in target
@@ -130,16 +133,75 @@ class FadeInEffect(Effect):
                     else:
                         target_val = int(override_target)
                 
-                target_val = max(0, min(255, target_val))
-                cur_val = int(round(start_val + (target_val - start_val) * progress))
-                fixture._write_channel(universe, ch, cur_val)
+                levels[ch] = (start_val, max(0, min(255, target_val)))
+        return levels
 
+    def _shutter_open(self, fixture: Any) -> tuple:
         # Open shutter if present
         meta = getattr(fixture, "meta_channels", {})
-        if "shutter" in meta and dim_ch:
+        if "shutter" in meta and _get_dim_channel(fixture):
             channel = meta["shutter"].channel
             if channel and channel in fixture.channels:
-                open_val = getattr(meta["shutter"], "open_value", 255) or 255
-                fixture._write_channel(universe, channel, open_val)
+                return channel, getattr(meta["shutter"], "open_value", 255) or 255
+        return None, None
+
+    def render(
+        self,
+        fixture: Any,
+        universe: bytearray,
+        *,
+        frame_index: int,
+        start_frame: int,
+        end_frame: int,
+        fps: int,
+        data: Dict[str, Any],
+        render_state: Dict[str, Any],
+    ) -> None:
+        payload = data or {}
+        easing_type = payload.get("easing", "linear")
+
+        duration_frames = max(1, end_frame - start_frame)
+        raw_progress = (frame_index - start_frame) / float(duration_frames)
+        # For fade_in (duration=0), snap immediately
+        if end_frame <= start_frame:
+            raw_progress = 1.0
+            if frame_index != start_frame:
+                return
+
+        progress = apply_easing(raw_progress, easing_type)
+
+        start_state = self._start_state(fixture, universe, payload, render_state)
+        for ch, (start_val, target_val) in self._levels(fixture, payload, start_state).items():
+            cur_val = int(round(start_val + (target_val - start_val) * progress))
+            fixture._write_channel(universe, ch, cur_val)
+
+        shutter_ch, open_val = self._shutter_open(fixture)
+        if shutter_ch:
+            fixture._write_channel(universe, shutter_ch, open_val)
+
+    def render_span(
+        self,
+        fixture: Any,
+        universe: bytearray,
+        *,
+        first_frame: int,
+        last_frame: int,
+        start_frame: int,
+        end_frame: int,
+        fps: int,
+        data: Dict[str, Any],
+        render_state: Dict[str, Any],
+    ) -> Dict[str, List[int]]:
+        payload = data or {}
+        progress = _span_progress(first_frame, last_frame, start_frame, end_frame, payload.get("easing", "linear"))
+        if all(value is None for value in progress):
+            return {}
+
+        start_state = self._start_state(fixture, universe, payload, render_state)
+        columns = _span_fade_columns(fixture, universe, self._levels(fixture, payload, start_state), progress)
+        shutter_ch, open_val = self._shutter_open(fixture)
+        if shutter_ch:
+            columns[shutter_ch] = carry_column(universe, fixture, shutter_ch, [None if value is None else open_val for value in progress])
+        return columns
 
 REGISTRY.register(FadeInEffect())
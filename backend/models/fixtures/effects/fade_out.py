@@ -1,7 +1,7 @@
-from typing import Any, Dict
+from typing import Any, Dict, List
 from .registry import Effect, REGISTRY
 from .easing import apply_easing
-from .fade_in import _get_rgb_channels, _get_dim_channel
+from .fade_in import _get_rgb_channels, _get_dim_channel, _span_fade_columns, _span_progress
 
 class FadeOutEffect(Effect):
     @property
@@ -35,30 +35,7 @@ class FadeOutEffect(Effect):
         meta = getattr(fixture, "meta_channels", {})
         return any(k in meta for k in ["dim", "rgb"])
 
-    def render(
-        self,
-        fixture: Any,
-        universe: bytearray,
-        *,
-        frame_index: int,
-        start_frame: int,
-        end_frame: int,
-        fps: int,
-        data: Dict[str, Any],
-        render_state: Dict[str, Any],
-    ) -> None:
-        payload = data or {}
-        easing_type = payload.get("easing", "linear")
-
-        duration_frames = max(1, end_frame - start_frame)
-        raw_progress = (frame_index - start_frame) / float(duration_frames)
-        if end_frame <= start_frame:
-            raw_progress = 1.0
-            if frame_index != start_frame:
-                return
-
-        progress = apply_easing(raw_progress, easing_type)
-
+    def _start_state(self, fixture: Any, universe: bytearray, payload: Dict[str, Any], render_state: Dict[str, Any]) -> Dict[str, int]:
         dim_ch = _get_dim_channel(fixture)
         rgb_chs = _get_rgb_channels(fixture)
 
@@ -97,19 +74,67 @@ class FadeOutEffect(Effect):
 
             render_state["start_state"] = start_state
 
-        start_state = render_state["start_state"]
+        return render_state["start_state"]
 
+    def _levels(self, fixture: Any, start_state: Dict[str, int]) -> Dict[str, tuple]:
+        """(start, target) level per channel, in write order; fade_out always targets 0."""
+        dim_ch = _get_dim_channel(fixture)
+        levels: Dict[str, tuple] = {}
         if dim_ch and dim_ch in start_state:
-            start_val = start_state[dim_ch]
-            target_val = 0
-            cur_val = int(round(start_val + (target_val - start_val) * progress))
-            fixture._write_channel(universe, dim_ch, cur_val)
-        
-        for ch in rgb_chs:
+            levels[dim_ch] = (start_state[dim_ch], 0)
+        for ch in _get_rgb_channels(fixture):
             if ch in start_state:
-                start_val = start_state[ch]
-                target_val = 0 
-                cur_val = int(round(start_val + (target_val - start_val) * progress))
-                fixture._write_channel(universe, ch, cur_val)
+                levels[ch] = (start_state[ch], 0)
+        return levels
+
+    def render(
+        self,
+        fixture: Any,
+        universe: bytearray,
+        *,
+        frame_index: int,
+        start_frame: int,
+        end_frame: int,
+        fps: int,
+        data: Dict[str, Any],
+        render_state: Dict[str, Any],
+    ) -> None:
+        payload = data or {}
+        easing_type = payload.get("easing", "linear")
+
+        duration_frames = max(1, end_frame - start_frame)
+        raw_progress = (frame_index - start_frame) / float(duration_frames)
+        if end_frame <= start_frame:
+            raw_progress = 1.0
+            if frame_index != start_frame:
+                return
+
+        progress = apply_easing(raw_progress, easing_type)
+
+        start_state = self._start_state(fixture, universe, payload, render_state)
+        for ch, (start_val, target_val) in self._levels(fixture, start_state).items():
+            cur_val = int(round(start_val + (target_val - start_val) * progress))
+            fixture._write_channel(universe, ch, cur_val)
+
+    def render_span(
+        self,
+        fixture: Any,
+        universe: bytearray,
+        *,
+        first_frame: int,
+        last_frame: int,
+        start_frame: int,
+        end_frame: int,
+        fps: int,
+        data: Dict[str, Any],
+        render_state: Dict[str, Any],
+    ) -> Dict[str, List[int]]:
+        payload = data or {}
+        progress = _span_progress(first_frame, last_frame, start_frame, end_frame, payload.get("easing", "linear"))
+        if all(value is None for value in progress):
+            return {}
+
+        start_state = self._start_state(fixture, universe, payload, render_state)
+        return _span_fade_columns(fixture, universe, self._levels(fixture, start_state), progress)
 
 REGISTRY.register(FadeOutEffect())
@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, List
 from .registry import Effect, REGISTRY
 from .fade_in import _get_rgb_channels, _get_dim_channel
 
@@ -33,6 +33,17 @@ class FlashEffect(Effect):
         meta = getattr(fixture, "meta_channels", {})
         return any(k in meta for k in ["dim", "rgb"])
 
+    def _resolve_target_rgb(self, fixture: Any, payload: Dict[str, Any]) -> tuple:
+        from ..rgb_utils import resolve_rgb_value
+
+        target_rgb = (255, 255, 255)
+        if "color" in payload:
+            mapping = fixture.template.mappings.get("color") if hasattr(fixture.template, "mappings") else {}
+            resolved = resolve_rgb_value(payload["color"], mapping)
+            if resolved and len(resolved) >= 3:
+                target_rgb = tuple(resolved[:3])
+        return target_rgb
+
     def render(
         self,
         fixture: Any,
@@ -70,15 +81,8 @@ class FlashEffect(Effect):
                     open_val = getattr(meta["shutter"], "open_value", 255) or 255
                     fixture._write_channel(universe, shutter_ch, open_val)
 
-        from ..rgb_utils import resolve_rgb_value
         rgb_chs = _get_rgb_channels(fixture)
-        
-        target_rgb = (255, 255, 255)
-        if "color" in payload:
-            mapping = fixture.template.mappings.get("color") if hasattr(fixture.template, "mappings") else {}
-            resolved = resolve_rgb_value(payload["color"], mapping)
-            if resolved and len(resolved) >= 3:
-                target_rgb = tuple(resolved[:3])
+        target_rgb = self._resolve_target_rgb(fixture, payload)
 
         # If we have a dimmer, we can just set the color and let the dimmer handle the fade.
         # If we do NOT have a dimmer, we fade the color channels themselves.
@@ -90,4 +94,47 @@ class FlashEffect(Effect):
                     c_level = int(round(c_level * (1.0 - progress)))
                 fixture._write_channel(universe, ch, c_level)
 
+    def render_span(
+        self,
+        fixture: Any,
+        universe: bytearray,
+        *,
+        first_frame: int,
+        last_frame: int,
+        start_frame: int,
+        end_frame: int,
+        fps: int,
+        data: Dict[str, Any],
+        render_state: Dict[str, Any],
+    ) -> Dict[str, List[int]]:
+        duration_frames = max(1, end_frame - start_frame)
+        progress = [max(0.0, min(1.0, (frame - start_frame) / float(duration_frames))) for frame in range(first_frame, last_frame + 1)]
+        levels = [int(round(255 * (1.0 - value))) for value in progress]
+
+        payload = data or {}
+        custom_channels = payload.get("channels")
+        if isinstance(custom_channels, list):
+            return {ch: levels for ch in (str(x) for x in custom_channels) if ch in fixture.channels}
+
+        columns: Dict[str, List[int]] = {}
+        dim_ch = _get_dim_channel(fixture)
+        if dim_ch and dim_ch in fixture.channels:
+            columns[dim_ch] = levels
+            meta = getattr(fixture, "meta_channels", {})
+            if "shutter" in meta:
+                shutter_ch = meta["shutter"].channel
+                if shutter_ch and shutter_ch in fixture.channels:
+                    open_val = getattr(meta["shutter"], "open_value", 255) or 255
+                    columns[shutter_ch] = [open_val] * len(levels)
+
+        target_rgb = self._resolve_target_rgb(fixture, payload)
+        fade_color = not bool(dim_ch and dim_ch in fixture.channels)
+        for i, ch in enumerate(_get_rgb_channels(fixture)):
+            if i < 3 and ch in fixture.channels:
+                if fade_color:
+                    columns[ch] = [int(round(target_rgb[i] * (1.0 - value))) for value in progress]
+                else:
+                    columns[ch] = [target_rgb[i]] * len(levels)
+        return columns
+
 REGISTRY.register(FlashEffect())
@@ -1,5 +1,5 @@
-from typing import Any, Dict
-from .registry import Effect, REGISTRY
+from typing import Any, Dict, List
+from .registry import Effect, REGISTRY, carry_column
 
 class FullEffect(Effect):
     @property
@@ -30,36 +30,22 @@ class FullEffect(Effect):
         meta = getattr(fixture, "meta_channels", {})
         return any(k in meta for k in ["dim", "shutter", "rgb"])
 
-    def render(
-        self,
-        fixture: Any,
-        universe: bytearray,
-        *,
-        frame_index: int,
-        start_frame: int,
-        end_frame: int,
-        fps: int,
-        data: Dict[str, Any],
-        render_state: Dict[str, Any],
-    ) -> None:
-        if frame_index != start_frame:
-            return  # Only fire on the exact start frame
-
+    def _start_values(self, fixture: Any) -> Dict[str, Any]:
         meta = getattr(fixture, "meta_channels", {})
+        values: Dict[str, Any] = {}
 
         # Max out dimmer
         if "dim" in meta:
             channel = meta["dim"].channel
             if channel and channel in fixture.channels:
-                fixture._write_channel(universe, channel, 255)
+                values[channel] = 255
         
         # Open shutter
         if "shutter" in meta:
             channel = meta["shutter"].channel
             if channel and channel in fixture.channels:
                 # Assuming shutter open is 255
-                open_val = getattr(meta["shutter"], "open_value", 255) or 255
-                fixture._write_channel(universe, channel, open_val)
+                values[channel] = getattr(meta["shutter"], "open_value", 255) or 255
         
         # Max out rgb mapping if present
         if "rgb" in meta:
@@ -67,6 +53,44 @@ class FullEffect(Effect):
             if channels:
                 for channel in channels:
                     if channel in fixture.channels:
-                        fixture._write_channel(universe, channel, 255)
+                        values[channel] = 255
+        return values
+
+    def render(
+        self,
+        fixture: Any,
+        universe: bytearray,
+        *,
+        frame_index: int,
+        start_frame: int,
+        end_frame: int,
+        fps: int,
+        data: Dict[str, Any],
+        render_state: Dict[str, Any],
+    ) -> None:
+        if frame_index != start_frame:
+            return  # Only fire on the exact start frame
+
+        for channel, value in self._start_values(fixture).items():
+            fixture._write_channel(universe, channel, value)
+
+    def render_span(
+        self,
+        fixture: Any,
+        universe: bytearray,
+        *,
+        first_frame: int,
+        last_frame: int,
+        start_frame: int,
+        end_frame: int,
+        fps: int,
+        data: Dict[str, Any],
+        render_state: Dict[str, Any],
+    ) -> Dict[str, List[int]]:
+        frames = range(first_frame, last_frame + 1)
+        return {
+            channel: carry_column(universe, fixture, channel, [value if frame == start_frame else None for frame in frames])
+            for channel, value in self._start_values(fixture).items()
+        }
 
 REGISTRY.register(FullEffect())
@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, List
 from ..effects.registry import Effect, REGISTRY
 
 
@@ -6,6 +6,11 @@ def _supports_pan_tilt(fixture: Any) -> bool:
     meta = getattr(fixture, "meta_channels", {})
     return "pan" in meta or "tilt" in meta
 
+def _trajectory_span(build: Any, fixture: Any, universe: bytearray, first_frame: int, last_frame: int, start_frame: int, end_frame: int, fps: int, data: Dict[str, Any], render_state: Dict[str, Any]) -> Dict[str, List[int]] | None:
+    from ..moving_heads.trajectory import cached_trajectory
+    trajectory = cached_trajectory(render_state, build, fixture, universe, first_frame, start_frame, end_frame, fps, data)
+    return None if trajectory is None else trajectory.columns(fixture, universe, first_frame, last_frame)
+
 class MoveToEffect(Effect):
     @property
     def id(self) -> str: return "move_to"
@@ -73,6 +78,9 @@ class CircleEffect(Effect):
     def render(self, fixture: Any, universe: bytearray, *, frame_index: int, start_frame: int, end_frame: int, fps: int, data: Dict[str, Any], render_state: Dict[str, Any]) -> None:
         from ..moving_heads.circle import handle
         handle(fixture, universe, frame_index, start_frame, end_frame, fps, data, render_state)
+    def render_span(self, fixture: Any, universe: bytearray, *, first_frame: int, last_frame: int, start_frame: int, end_frame: int, fps: int, data: Dict[str, Any], render_state: Dict[str, Any]) -> Dict[str, List[int]] | None:
+        from ..moving_heads.circle import circle_trajectory
+        return _trajectory_span(circle_trajectory, fixture, universe, first_frame, last_frame, start_frame, end_frame, fps, data, render_state)
 
 class OrbitEffect(Effect):
     @property
@@ -101,6 +109,9 @@ class OrbitEffect(Effect):
     def render(self, fixture: Any, universe: bytearray, *, frame_index: int, start_frame: int, end_frame: int, fps: int, data: Dict[str, Any], render_state: Dict[str, Any]) -> None:
         from ..moving_heads.orbit import handle
         handle(fixture, universe, frame_index, start_frame, end_frame, fps, data, render_state)
+    def render_span(self, fixture: Any, universe: bytearray, *, first_frame: int, last_frame: int, start_frame: int, end_frame: int, fps: int, data: Dict[str, Any], render_state: Dict[str, Any]) -> Dict[str, List[int]] | None:
+        from ..moving_heads.orbit_motion import orbit_in_trajectory
+        return _trajectory_span(orbit_in_trajectory, fixture, universe, first_frame, last_frame, start_frame, end_frame, fps, data, render_state)
 
 class OrbitOutEffect(Effect):
     @property
@@ -129,6 +140,9 @@ class OrbitOutEffect(Effect):
     def render(self, fixture: Any, universe: bytearray, *, frame_index: int, start_frame: int, end_frame: int, fps: int, data: Dict[str, Any], render_state: Dict[str, Any]) -> None:
         from ..moving_heads.orbit_out import handle
         handle(fixture, universe, frame_index, start_frame, end_frame, fps, data, render_state)
+    def render_span(self, fixture: Any, universe: bytearray, *, first_frame: int, last_frame: int, start_frame: int, end_frame: int, fps: int, data: Dict[str, Any], render_state: Dict[str, Any]) -> Dict[str, List[int]] | None:
+        from ..moving_heads.orbit_motion import orbit_out_trajectory
+        return _trajectory_span(orbit_out_trajectory, fixture, universe, first_frame, last_frame, start_frame, end_frame, fps, data, render_state)
 
 class SweepEffect(Effect):
     @property
@@ -146,6 +160,9 @@ class SweepEffect(Effect):
     def render(self, fixture: Any, universe: bytearray, *, frame_index: int, start_frame: int, end_frame: int, fps: int, data: Dict[str, Any], render_state: Dict[str, Any]) -> None:
         from ..moving_heads.sweep import handle
         handle(fixture, universe, frame_index, start_frame, end_frame, fps, data, render_state)
+    def render_span(self, fixture: Any, universe: bytearray, *, first_frame: int, last_frame: int, start_frame: int, end_frame: int, fps: int, data: Dict[str, Any], render_state: Dict[str, Any]) -> Dict[str, List[int]] | None:
+        from ..moving_heads.sweep import sweep_trajectory
+        return _trajectory_span(sweep_trajectory, fixture, universe, first_frame, last_frame, start_frame, end_frame, fps, data, render_state)
 
 REGISTRY.register(MoveToEffect())
 REGISTRY.register(MoveToPoiEffect())
@@ -1,5 +1,5 @@
 import abc
-from typing import Any, Dict, List, Sequence, Set
+from typing import Any, Dict, List, Optional, Sequence, Set
 
 EFFECT_TAG_VOCABULARY: Set[str] = {
     "accent",
@@ -88,6 +88,40 @@ class Effect(abc.ABC):
         """Render the effect into the universe for the given frame index."""
         pass
 
+    def render_span(
+        self,
+        fixture: Any,
+        universe: bytearray,
+        *,
+        first_frame: int,
+        last_frame: int,
+        start_frame: int,
+        end_frame: int,
+        fps: int,
+        data: Dict[str, Any],
+        render_state: Dict[str, Any],
+    ) -> Dict[str, List[int]] | None:
+        """Render frames first_frame..last_frame (inclusive) of one cue in a single call.
+
+        Returns, per written channel name, the value the channel holds after each frame of
+        the span, exactly as calling `render` once per frame would leave it when no other
+        cue touches the fixture. `universe` holds the values carried into first_frame and
+        is only read. Effects without a span kernel return None and render frame by frame.
+        """
+        return None
+
+
+def carry_column(universe: bytearray, fixture: Any, channel_name: str, writes: Sequence[Optional[int]]) -> List[int]:
+    """Per-frame channel values for a span where None marks frames the effect does not write."""
+    absolute_channel = fixture.absolute_channels.get(channel_name, 0)
+    value = int(universe[absolute_channel - 1]) if 1 <= absolute_channel <= len(universe) else 0
+    column = []
+    for written in writes:
+        if written is not None:
+            value = written
+        column.append(value)
+    return column
+
 class EffectRegistry:
     _effects: Dict[str, Effect] = {}
 
@@ -1,5 +1,5 @@
-from typing import Any, Dict
-from .registry import Effect, REGISTRY
+from typing import Any, Dict, List
+from .registry import Effect, REGISTRY, carry_column
 from .fade_in import _get_rgb_channels, _get_dim_channel
 
 def _speed_to_rate_hz(speed: Any) -> float:
@@ -42,20 +42,7 @@ class StrobeEffect(Effect):
         meta = getattr(fixture, "meta_channels", {})
         return any(k in meta for k in ["dim", "rgb"])
 
-    def render(
-        self,
-        fixture: Any,
-        universe: bytearray,
-        *,
-        frame_index: int,
-        start_frame: int,
-        end_frame: int,
-        fps: int,
-        data: Dict[str, Any],
-        render_state: Dict[str, Any],
-    ) -> None:
-        payload = data or {}
-        
+    def _rate_hz(self, payload: Dict[str, Any]) -> float:
         if "rate" in payload:
             try:
                 rate_hz = float(payload.get("rate") or 0.0)
@@ -66,10 +53,9 @@ class StrobeEffect(Effect):
             
         if rate_hz <= 0.0:
             rate_hz = 10.0
+        return rate_hz
 
-        dim_ch = _get_dim_channel(fixture)
-        rgb_chs = _get_rgb_channels(fixture)
-
+    def _on_state(self, fixture: Any, universe: bytearray, rgb_chs: List[str], render_state: Dict[str, Any]) -> Dict[str, int]:
         if "on_state" not in render_state:
             state = {}
             if rgb_chs:
@@ -77,8 +63,34 @@ class StrobeEffect(Effect):
                     if ch in fixture.channels:
                         state[ch] = int(universe[fixture.absolute_channels[ch] - 1])
             render_state["on_state"] = state
+        return render_state.get("on_state", {})
 
-        on_state = render_state.get("on_state", {})
+    def _shutter_open(self, fixture: Any) -> tuple:
+        meta = getattr(fixture, "meta_channels", {})
+        if "shutter" in meta:
+            shutter_ch = meta["shutter"].channel
+            if shutter_ch and shutter_ch in fixture.channels:
+                return shutter_ch, getattr(meta["shutter"], "open_value", 255) or 255
+        return None, None
+
+    def render(
+        self,
+        fixture: Any,
+        universe: bytearray,
+        *,
+        frame_index: int,
+        start_frame: int,
+        end_frame: int,
+        fps: int,
+        data: Dict[str, Any],
+        render_state: Dict[str, Any],
+    ) -> None:
+        payload = data or {}
+        rate_hz = self._rate_hz(payload)
+
+        dim_ch = _get_dim_channel(fixture)
+        rgb_chs = _get_rgb_channels(fixture)
+        on_state = self._on_state(fixture, universe, rgb_chs, render_state)
 
         # Return to original or zero on end frame
         if frame_index >= end_frame:
@@ -97,15 +109,51 @@ class StrobeEffect(Effect):
         # Typically software strobe ignores hardware strobe channel for direct control, as implemented previously.
         if dim_ch and dim_ch in fixture.channels:
             fixture._write_channel(universe, dim_ch, 255 if is_on else 0)
-            meta = getattr(fixture, "meta_channels", {})
-            if "shutter" in meta:
-                shutter_ch = meta["shutter"].channel
-                if shutter_ch and shutter_ch in fixture.channels:
-                    open_val = getattr(meta["shutter"], "open_value", 255) or 255
-                    fixture._write_channel(universe, shutter_ch, open_val)
+            shutter_ch, open_val = self._shutter_open(fixture)
+            if shutter_ch:
+                fixture._write_channel(universe, shutter_ch, open_val)
         else:
             for ch in rgb_chs:
                 if ch in fixture.channels:
                     fixture._write_channel(universe, ch, int(on_state.get(ch, 255)) if is_on else 0)
 
+    def render_span(
+        self,
+        fixture: Any,
+        universe: bytearray,
+        *,
+        first_frame: int,
+        last_frame: int,
+        start_frame: int,
+        end_frame: int,
+        fps: int,
+        data: Dict[str, Any],
+        render_state: Dict[str, Any],
+    ) -> Dict[str, List[int]]:
+        rate_hz = self._rate_hz(data or {})
+        dim_ch = _get_dim_channel(fixture)
+        rgb_chs = _get_rgb_channels(fixture)
+        on_state = self._on_state(fixture, universe, rgb_chs, render_state)
+
+        half_period_frames = max(1, int(round(float(fps) / (float(rate_hz) * 2.0))))
+        frames = range(first_frame, last_frame + 1)
+        # None past the end frame, otherwise whether the strobe is in its on half-period.
+        phases = [None if frame >= end_frame else ((max(0, frame - start_frame) // half_period_frames) % 2) == 0 for frame in frames]
+
+        columns: Dict[str, List[int]] = {}
+        if dim_ch and dim_ch in fixture.channels:
+            columns[dim_ch] = [255 if is_on else 0 for is_on in phases]
+            shutter_ch, open_val = self._shutter_open(fixture)
+            if shutter_ch:
+                columns[shutter_ch] = carry_column(universe, fixture, shutter_ch, [None if is_on is None else open_val for is_on in phases])
+            for ch in rgb_chs:
+                if ch in fixture.channels:
+                    columns[ch] = carry_column(universe, fixture, ch, [int(on_state.get(ch, 0)) if is_on is None else None for is_on in phases])
+        else:
+            for ch in rgb_chs:
+                if ch in fixture.channels:
+                    on_value = int(on_state.get(ch, 255))
+                    columns[ch] = [int(on_state.get(ch, 0)) if is_on is None else (on_value if is_on else 0) for is_on in phases]
+        return columns
+
 REGISTRY.register(StrobeEffect())
@@ -8,6 +8,8 @@ class Fixture(BaseModel, ABC):
     id: str
     name: str
     base_channel: int
+    # 0-based DMX universe; absolute channels count across universes (universe n starts at n * 512 + 1).
+    universe: int = 0
     template: FixtureTemplate
     current_values: Dict[str, Any] = {}
     presets: List[Dict[str, Any]] = []
@@ -25,8 +27,9 @@ class Fixture(BaseModel, ABC):
 
     @property
     def absolute_channels(self) -> Dict[str, int]:
-        """Returns absolute 1-based DMX channels."""
-        return {name: self.base_channel + offset for name, offset in self.channels.items()}
+        """Returns absolute 1-based DMX channels (frame channels across universes)."""
+        first = self.universe * 512 + self.base_channel
+        return {name: first + offset for name, offset in self.channels.items()}
 
     @property
     def meta_channels(self) -> Dict[str, MetaChannel]:
@@ -61,11 +64,22 @@ class Fixture(BaseModel, ABC):
             return 0
         return max(0, min(255, iv))
 
+    def _absolute_channel(self, channel_name: str) -> Optional[int]:
+        """Absolute 1-based DMX channel for one channel name, without building the full map."""
+        offset = self.template.channels.get(channel_name)
+        return None if offset is None else self.universe * 512 + self.base_channel + offset
+
+    def _frame_offset(self, channel_name: str) -> Optional[int]:
+        """0-based frame offset of a channel, or None when it falls outside the fixture's universe."""
+        offset = self.template.channels.get(channel_name)
+        if offset is None or not 1 <= self.base_channel + offset <= 512:
+            return None
+        return self.universe * 512 + self.base_channel + offset - 1
+
     def _write_channel(self, universe: bytearray, channel_name: str, value: Any) -> None:
-        if channel_name in self.absolute_channels:
-            abs_ch = self.absolute_channels[channel_name]
-            if 1 <= abs_ch <= 512:
-                universe[abs_ch - 1] = self._clamp_byte(value)
+        offset = self._frame_offset(channel_name)
+        if offset is not None and offset < len(universe):
+            universe[offset] = self._clamp_byte(value)
 
     def _render_set_channels(
         self,
@@ -82,6 +96,14 @@ class Fixture(BaseModel, ABC):
             if channel_name in self.channels:
                 self._write_channel(universe, channel_name, value)
 
+    def resolve_effect_handler(self, effect_id: str) -> Any:
+        """Registry effect handling effect_id on this fixture, or None for fixture-specific fallbacks."""
+        # Local import: the effect modules import fixture subclasses.
+        from .effects import REGISTRY
+
+        handler = REGISTRY.get(effect_id)
+        return handler if handler and handler.supports(self) else None
+
     def render_effect(
         self,
         universe: bytearray,
@@ -95,13 +117,9 @@ class Fixture(BaseModel, ABC):
         render_state: Dict[str, Any],
     ) -> None:
         """Render a cue effect into the provided DMX universe for the given frame."""
-        # Optional: local imports to avoid circular deps with Fixture logic if needed, 
-        # though standard imports generally work since registry.py doesn't strictly import Fixture class
-        from .effects import REGISTRY
-        
         effect_id = (effect or "").lower().strip()
-        handler = REGISTRY.get(effect_id)
-        if handler and handler.supports(self):
+        handler = self.resolve_effect_handler(effect_id)
+        if handler:
             handler.render(self, universe, frame_index=frame_index, start_frame=start_frame, end_frame=end_frame, fps=fps, data=data, render_state=render_state)
             return
             
@@ -117,6 +135,58 @@ class Fixture(BaseModel, ABC):
             render_state=render_state
         )
 
+    def render_effect_span(
+        self,
+        universe: bytearray,
+        *,
+        effect: str,
+        first_frame: int,
+        last_frame: int,
+        start_frame: int,
+        end_frame: int,
+        fps: int,
+        data: Dict[str, Any],
+        render_state: Dict[str, Any],
+    ) -> Optional[Dict[int, bytes]]:
+        """Render a cue over frames first_frame..last_frame in one call.
+
+        Returns 0-based universe offset -> per-frame values for every channel the effect
+        writes, or None when the effect has no span kernel for this fixture and has to be
+        rendered frame by frame. The universe is only read.
+        """
+        handler = self.resolve_effect_handler((effect or "").lower().strip())
+        if not handler:
+            return None
+        columns = handler.render_span(
+            self,
+            universe,
+            first_frame=first_frame,
+            last_frame=last_frame,
+            start_frame=start_frame,
+            end_frame=end_frame,
+            fps=fps,
+            data=data,
+            render_state=render_state,
+        )
+        return None if columns is None else self._span_columns_by_offset(columns)
+
+    def _span_columns_by_offset(self, columns: Dict[str, Any], offsets: Optional[Dict[str, int]] = None) -> Dict[int, bytes]:
+        """Span kernel columns keyed by 0-based frame offset, dropping channels outside the fixture's universe.
+
+        offsets maps channel names to universe offsets when the caller already has them
+        (compiled render ops do); otherwise they are looked up per channel.
+        """
+        rendered: Dict[int, bytes] = {}
+        for channel_name, values in columns.items():
+            offset = offsets.get(channel_name) if offsets is not None else self._frame_offset(channel_name)
+            if offset is None:
+                continue
+            try:
+                rendered[offset] = bytes(values)
+            except (TypeError, ValueError):
+                rendered[offset] = bytes(self._clamp_byte(value) for value in values)
+        return rendered
+
     def _fallback_render_effect(
         self,
         universe: bytearray,
@@ -38,8 +38,8 @@ class MovingHead(Fixture):
         if not self._has_axis_16bit(axis):
             return None
         mc = self.meta_channels[axis]
-        msb_ch = self.absolute_channels[mc.channels[0]]
-        lsb_ch = self.absolute_channels[mc.channels[1]]
+        msb_ch = self._absolute_channel(mc.channels[0])
+        lsb_ch = self._absolute_channel(mc.channels[1])
         msb = int(universe[msb_ch - 1])
         lsb = int(universe[lsb_ch - 1])
         return (msb << 8) | lsb
@@ -56,7 +56,7 @@ class MovingHead(Fixture):
         dmx: Dict[int, int] = {}
         for name, offset in self.template.channels.items():
             val = int(self.current_values.get(name, 0) or 0)
-            dmx[self.base_channel + offset] = max(0, min(255, val))
+            dmx[self.universe * 512 + self.base_channel + offset] = max(0, min(255, val))
         return dmx
 
     def apply_preset(self, preset: Dict[str, Any]) -> None:
@@ -94,57 +94,19 @@ class MovingHead(Fixture):
                 continue
         return None
 
-    def _find_poi_target_values(self, poi_key: Any) -> Optional[Dict[str, Any]]:
+    def _resolve_poi_pan_tilt_u16(self, poi_key: Any) -> Tuple[Optional[int], Optional[int]]:
         if poi_key is None:
-            return None
-
-        needle = str(poi_key).strip().lower()
-        if not needle:
-            return None
+            return None, None
 
         from store.pois import PoiStore
         poi_db = PoiStore.get_instance()
-        if poi_db:
-            return poi_db.get_fixture_target_sync(needle, self.id)
-
-        return None
-
-    def _resolve_poi_pan_tilt_u16(self, poi_key: Any) -> Tuple[Optional[int], Optional[int]]:
-        poi_values = self._find_poi_target_values(poi_key) or {}
-        return (
-            self._parse_axis_target_u16("pan", poi_values),
-            self._parse_axis_target_u16("tilt", poi_values),
-        )
+        if not poi_db:
+            return None, None
+        return poi_db.get_fixture_pan_tilt_u16(poi_key, self.id)
 
     def _parse_axis_target_u16(self, axis: str, payload: Dict[str, Any]) -> Optional[int]:
-        if not isinstance(payload, dict):
-            return None
-
-        # Direct MSB/LSB.
-        msb_key = f"{axis}_msb"
-        lsb_key = f"{axis}_lsb"
-        if msb_key in payload or lsb_key in payload:
-            msb = payload.get(msb_key, 0)
-            lsb = payload.get(lsb_key, 0)
-            return self._combine_u16(msb, lsb)
-
-        # Packed u16 in `pan`/`tilt`.
-        if axis in payload:
-            raw = payload.get(axis, 0)
-            try:
-                iv = int(raw)
-            except (TypeError, ValueError):
-                return None
-
-            # If a fine component exists, treat axis as MSB byte.
-            fine_key = f"{axis}_fine"
-            if fine_key in payload:
-                return self._combine_u16(iv, payload.get(fine_key, 0))
-
-            # Otherwise interpret as u16 (0..65535).
-            return self._clamp_u16(iv)
-
-        return None
+        from store.poi_targets import parse_axis_target_u16
+        return parse_axis_target_u16(axis, payload)
 
     def _parse_pan_tilt_targets_u16(self, data: Dict[str, Any]) -> Tuple[Optional[int], Optional[int]]:
         payload: Dict[str, Any] = data or {}
@@ -14,5 +14,4 @@ def handle(self, universe: bytearray, frame_index: int, start_frame: int, end_fr
         data,
         render_state,
         outward=True,
-        state_prefix="orbit_out",
     )
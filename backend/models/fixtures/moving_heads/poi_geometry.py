@@ -15,16 +15,14 @@ def resolve_poi_location(poi_key: Any) -> Optional[dict[str, float]]:
     if not poi_db:
         return None
 
-    for poi in poi_db.pois:
-        if str(poi.get("id") or "").strip().lower() != needle:
-            continue
-        location = poi.get("location") or {}
-        return {
-            "x": clamp_unit(parse_float(location.get("x"), 0.0)),
-            "y": clamp_unit(parse_float(location.get("y"), 0.0)),
-            "z": clamp_unit(parse_float(location.get("z"), 0.0)),
-        }
-    return None
+    location = poi_db.get_location_sync(needle)
+    if location is None:
+        return None
+    return {
+        "x": clamp_unit(parse_float(location.get("x"), 0.0)),
+        "y": clamp_unit(parse_float(location.get("y"), 0.0)),
+        "z": clamp_unit(parse_float(location.get("z"), 0.0)),
+    }
 
 
 def estimate_pan_tilt_from_location(fixture, location: dict[str, float]) -> Tuple[Optional[int], Optional[int]]:
@@ -39,23 +37,12 @@ def estimate_pan_tilt_from_location(fixture, location: dict[str, float]) -> Tupl
     pan_total = 0.0
     tilt_total = 0.0
 
-    for poi in poi_db.pois:
-        poi_id = str(poi.get("id") or "").strip().lower()
-        if not poi_id.startswith("ref_"):
-            continue
-        fixtures = poi.get("fixtures") or {}
-        fixture_values = next(
-            (values for fixture_id, values in fixtures.items() if str(fixture_id).strip().lower() == fixture.id.lower()),
-            None,
-        )
-        if not isinstance(fixture_values, dict):
-            continue
-        pan_u16 = fixture._parse_axis_target_u16("pan", fixture_values)
-        tilt_u16 = fixture._parse_axis_target_u16("tilt", fixture_values)
+    for poi_id in poi_db.reference_poi_ids():
+        pan_u16, tilt_u16 = poi_db.get_fixture_pan_tilt_u16(poi_id, fixture.id)
         if pan_u16 is None or tilt_u16 is None:
             continue
 
-        point = poi.get("location") or {}
+        point = poi_db.get_location_sync(poi_id) or {}
         point_x = clamp_unit(parse_float(point.get("x"), 0.0))
         point_y = clamp_unit(parse_float(point.get("y"), 0.0))
         point_z = clamp_unit(parse_float(point.get("z"), 0.0))
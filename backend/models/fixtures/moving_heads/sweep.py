@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 from .sweep_helpers import (
     apply_dimmer_envelope,
@@ -9,29 +9,28 @@ from .sweep_helpers import (
     max_dim_to_byte,
     parse_float,
 )
+from .trajectory import MovementTrajectory, cached_trajectory
 from .travel_helpers import EFFECT_SETTLE_SECONDS, limit_axis_step, max_axis_step_per_frame
 
 
-def handle(
+def sweep_trajectory(
     fixture,
     universe: bytearray,
-    frame_index: int,
+    first_frame: int,
     start_frame: int,
     end_frame: int,
     fps: int,
-    data: Dict[str, Any],
-    render_state: Dict[str, Any],
-) -> None:
-    payload = data or {}
+    payload: Dict[str, Any],
+) -> Optional[MovementTrajectory]:
     subject_poi = str(payload.get("subject_POI") or "").strip()
     start_poi = str(payload.get("start_POI") or "").strip()
     if not subject_poi or not start_poi:
-        return
+        return None
 
     subject_pan, subject_tilt = fixture._resolve_poi_pan_tilt_u16(subject_poi)
     start_pan, start_tilt = fixture._resolve_poi_pan_tilt_u16(start_poi)
     if subject_pan is None or subject_tilt is None or start_pan is None or start_tilt is None:
-        return
+        return None
 
     mirrored_pan = fixture._clamp_u16((2 * int(subject_pan)) - int(start_pan))
     mirrored_tilt = fixture._clamp_u16((2 * int(subject_tilt)) - int(start_tilt))
@@ -45,89 +44,100 @@ def handle(
         opposite_pan = mirrored_pan
         opposite_tilt = mirrored_tilt
 
-    duration_seconds = parse_float(payload.get("duration"), 0.0)
-    if duration_seconds <= 0.0:
-        duration_seconds = max(1.0 / max(1, fps), (end_frame - start_frame) / float(max(1, fps)))
-
     preroll_frames = max(0, int((payload.get("__sweep_preroll_frames") or 0)))
     settle_frames = min(max(0, int(round(EFFECT_SETTLE_SECONDS * max(1, fps)))), preroll_frames)
     move_frames = max(0, preroll_frames - settle_frames)
     visible_start_frame = start_frame + preroll_frames
     visible_duration_frames = max(1, end_frame - visible_start_frame)
-    motion_progress = (frame_index - visible_start_frame) / float(visible_duration_frames)
-    motion_progress = max(0.0, min(1.0, motion_progress))
 
     easing_seconds = parse_float(payload.get("easing"), 0.0)
     arc_strength = parse_float(payload.get("arc_strength"), 0.015)
     dimmer_easing = parse_float(payload.get("dimmer_easing"), 0.0)
     visible_duration_seconds = max(1.0 / max(1, fps), visible_duration_frames / float(max(1, fps)))
     leg_duration_seconds = visible_duration_seconds * 0.5
+    max_dim_byte = max_dim_to_byte(payload.get("max_dim", 1.0))
 
-    if "sweep_initial_pan_u16" not in render_state or "sweep_initial_tilt_u16" not in render_state:
-        render_state["sweep_initial_pan_u16"] = int(fixture._read_axis_u16_from_universe(universe, "pan") or 0)
-        render_state["sweep_initial_tilt_u16"] = int(fixture._read_axis_u16_from_universe(universe, "tilt") or 0)
-    if "sweep_last_pan_u16" not in render_state or "sweep_last_tilt_u16" not in render_state:
-        render_state["sweep_last_pan_u16"] = int(render_state.get("sweep_initial_pan_u16", 0))
-        render_state["sweep_last_tilt_u16"] = int(render_state.get("sweep_initial_tilt_u16", 0))
-
-    initial_pan = int(render_state.get("sweep_initial_pan_u16", 0))
-    initial_tilt = int(render_state.get("sweep_initial_tilt_u16", 0))
-    last_pan = int(render_state.get("sweep_last_pan_u16", initial_pan))
-    last_tilt = int(render_state.get("sweep_last_tilt_u16", initial_tilt))
+    initial_pan = int(fixture._read_axis_u16_from_universe(universe, "pan") or 0)
+    initial_tilt = int(fixture._read_axis_u16_from_universe(universe, "tilt") or 0)
+    last_pan = initial_pan
+    last_tilt = initial_tilt
     max_pan_step, max_tilt_step = max_axis_step_per_frame(fixture, fps)
 
-    if frame_index < start_frame + move_frames:
-        move_progress = (frame_index - start_frame) / float(max(1, move_frames))
-        target_pan = round(initial_pan + ((int(start_pan) - initial_pan) * move_progress))
-        target_tilt = round(initial_tilt + ((int(start_tilt) - initial_tilt) * move_progress))
-        pan_u16 = fixture._clamp_u16(limit_axis_step(last_pan, target_pan, max_pan_step))
-        tilt_u16 = fixture._clamp_u16(limit_axis_step(last_tilt, target_tilt, max_tilt_step))
-        dim_factor = 0.0
-    elif frame_index < visible_start_frame:
-        pan_u16 = fixture._clamp_u16(start_pan)
-        tilt_u16 = fixture._clamp_u16(start_tilt)
-        dim_factor = 0.0
-    elif motion_progress <= 0.5:
-        leg_progress = apply_leg_easing(motion_progress * 2.0, easing_seconds, leg_duration_seconds, ease_in=False)
-        pan_next, tilt_next = circular_lerp_u16(
-            start_pan=start_pan,
-            start_tilt=start_tilt,
-            end_pan=subject_pan,
-            end_tilt=subject_tilt,
-            t=leg_progress,
-            arc_strength=arc_strength,
-        )
-        pan_u16 = fixture._clamp_u16(limit_axis_step(last_pan, pan_next, max_pan_step))
-        tilt_u16 = fixture._clamp_u16(limit_axis_step(last_tilt, tilt_next, max_tilt_step))
-        dim_factor = apply_dimmer_envelope(motion_progress, dimmer_easing)
-    else:
-        leg_progress = apply_leg_easing((motion_progress - 0.5) * 2.0, easing_seconds, leg_duration_seconds, ease_in=True)
-        pan_next, tilt_next = circular_lerp_u16(
-            start_pan=subject_pan,
-            start_tilt=subject_tilt,
-            end_pan=opposite_pan,
-            end_tilt=opposite_tilt,
-            t=leg_progress,
-            arc_strength=arc_strength,
-        )
-        pan_u16 = fixture._clamp_u16(limit_axis_step(last_pan, pan_next, max_pan_step))
-        tilt_u16 = fixture._clamp_u16(limit_axis_step(last_tilt, tilt_next, max_tilt_step))
-        dim_factor = apply_dimmer_envelope(motion_progress, dimmer_easing)
-
-    if pan_u16 == subject_pan and tilt_u16 == subject_tilt:
-        dim_factor = 1.0
-
-    max_dim_byte = max_dim_to_byte(payload.get("max_dim", 1.0))
-    intensity = clamp_byte(round(max_dim_byte * max(0.0, min(1.0, dim_factor))))
-
-    fixture._write_axis_u16_to_universe(universe, "pan", pan_u16)
-    fixture._write_axis_u16_to_universe(universe, "tilt", tilt_u16)
-    render_state["sweep_last_pan_u16"] = int(pan_u16)
-    render_state["sweep_last_tilt_u16"] = int(tilt_u16)
+    pans: List[Optional[int]] = []
+    tilts: List[Optional[int]] = []
+    intensities: List[int] = []
+    for frame_index in range(first_frame, max(first_frame, end_frame) + 1):
+        motion_progress = (frame_index - visible_start_frame) / float(visible_duration_frames)
+        motion_progress = max(0.0, min(1.0, motion_progress))
+
+        if frame_index < start_frame + move_frames:
+            move_progress = (frame_index - start_frame) / float(max(1, move_frames))
+            target_pan = round(initial_pan + ((int(start_pan) - initial_pan) * move_progress))
+            target_tilt = round(initial_tilt + ((int(start_tilt) - initial_tilt) * move_progress))
+            pan_u16 = fixture._clamp_u16(limit_axis_step(last_pan, target_pan, max_pan_step))
+            tilt_u16 = fixture._clamp_u16(limit_axis_step(last_tilt, target_tilt, max_tilt_step))
+            dim_factor = 0.0
+        elif frame_index < visible_start_frame:
+            pan_u16 = fixture._clamp_u16(start_pan)
+            tilt_u16 = fixture._clamp_u16(start_tilt)
+            dim_factor = 0.0
+        elif motion_progress <= 0.5:
+            leg_progress = apply_leg_easing(motion_progress * 2.0, easing_seconds, leg_duration_seconds, ease_in=False)
+            pan_next, tilt_next = circular_lerp_u16(
+                start_pan=start_pan,
+                start_tilt=start_tilt,
+                end_pan=subject_pan,
+                end_tilt=subject_tilt,
+                t=leg_progress,
+                arc_strength=arc_strength,
+            )
+            pan_u16 = fixture._clamp_u16(limit_axis_step(last_pan, pan_next, max_pan_step))
+            tilt_u16 = fixture._clamp_u16(limit_axis_step(last_tilt, tilt_next, max_tilt_step))
+            dim_factor = apply_dimmer_envelope(motion_progress, dimmer_easing)
+        else:
+            leg_progress = apply_leg_easing((motion_progress - 0.5) * 2.0, easing_seconds, leg_duration_seconds, ease_in=True)
+            pan_next, tilt_next = circular_lerp_u16(
+                start_pan=subject_pan,
+                start_tilt=subject_tilt,
+                end_pan=opposite_pan,
+                end_tilt=opposite_tilt,
+                t=leg_progress,
+                arc_strength=arc_strength,
+            )
+            pan_u16 = fixture._clamp_u16(limit_axis_step(last_pan, pan_next, max_pan_step))
+            tilt_u16 = fixture._clamp_u16(limit_axis_step(last_tilt, tilt_next, max_tilt_step))
+            dim_factor = apply_dimmer_envelope(motion_progress, dimmer_easing)
+
+        if pan_u16 == subject_pan and tilt_u16 == subject_tilt:
+            dim_factor = 1.0
+
+        pans.append(int(pan_u16))
+        tilts.append(int(tilt_u16))
+        intensities.append(clamp_byte(round(max_dim_byte * max(0.0, min(1.0, dim_factor)))))
+        last_pan = int(pan_u16)
+        last_tilt = int(tilt_u16)
 
     intensity_key = find_intensity_channel_key(fixture)
-    if intensity_key:
-        fixture._write_channel(universe, intensity_key, intensity)
+    return MovementTrajectory(
+        first_frame,
+        pans,
+        tilts,
+        intensities if intensity_key else None,
+        intensity_key,
+        shutter="shutter" in (fixture.channels or {}),
+    )
 
-    if "shutter" in (fixture.channels or {}):
-        fixture._write_channel(universe, "shutter", 255)
+
+def handle(
+    fixture,
+    universe: bytearray,
+    frame_index: int,
+    start_frame: int,
+    end_frame: int,
+    fps: int,
+    data: Dict[str, Any],
+    render_state: Dict[str, Any],
+) -> None:
+    trajectory = cached_trajectory(render_state, sweep_trajectory, fixture, universe, frame_index, start_frame, end_frame, fps, data)
+    if trajectory is not None:
+        trajectory.write(fixture, universe, frame_index)
@@ -0,0 +1,111 @@
+from typing import Any, Callable, Dict, List, Optional
+
+from ..effects.registry import carry_column
+
+
+class MovementTrajectory:
+    """Per-frame pan/tilt u16 (and intensity byte) of one movement cue, from its first rendered frame.
+
+    Built once per cue, with pre-roll and travel-speed limiting already applied, then indexed
+    by frame. A None pan/tilt marks a frame the effect leaves untouched. Immutable, so
+    render checkpoints share it instead of copying it.
+    """
+
+    __slots__ = ("first_frame", "pan", "tilt", "intensity", "intensity_key", "shutter")
+
+    def __init__(
+        self,
+        first_frame: int,
+        pan: List[Optional[int]],
+        tilt: List[Optional[int]],
+        intensity: Optional[List[int]] = None,
+        intensity_key: Optional[str] = None,
+        shutter: bool = False,
+    ):
+        self.first_frame = first_frame
+        self.pan = pan
+        self.tilt = tilt
+        self.intensity = intensity
+        self.intensity_key = intensity_key if intensity is not None else None
+        self.shutter = shutter
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "MovementTrajectory":
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MovementTrajectory):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    @property
+    def last_frame(self) -> int:
+        return self.first_frame + len(self.pan) - 1
+
+    def pan_tilt_at(self, frame_index: int) -> Optional[tuple[int, int]]:
+        position = frame_index - self.first_frame
+        if not 0 <= position < len(self.pan) or self.pan[position] is None:
+            return None
+        return self.pan[position], self.tilt[position]
+
+    def write(self, fixture, universe: bytearray, frame_index: int) -> None:
+        """Write one frame of the trajectory into the universe."""
+        position = frame_index - self.first_frame
+        if not 0 <= position < len(self.pan) or self.pan[position] is None:
+            return
+        if self.intensity_key:
+            fixture._write_channel(universe, self.intensity_key, self.intensity[position])
+        fixture._write_axis_u16_to_universe(universe, "pan", self.pan[position])
+        fixture._write_axis_u16_to_universe(universe, "tilt", self.tilt[position])
+        if self.shutter:
+            fixture._write_channel(universe, "shutter", 255)
+
+    def columns(self, fixture, universe: bytearray, first_frame: int, last_frame: int) -> Dict[str, List[int]]:
+        """Span kernel columns for frames first_frame..last_frame (see Effect.render_span)."""
+        positions = range(first_frame - self.first_frame, last_frame - self.first_frame + 1)
+        length = len(self.pan)
+        pan = [self.pan[position] if 0 <= position < length else None for position in positions]
+        tilt = [self.tilt[position] if 0 <= position < length else None for position in positions]
+        written = [value is not None for value in pan]
+
+        writes: Dict[str, List[Optional[int]]] = {}
+        if self.intensity_key:
+            writes[self.intensity_key] = [
+                self.intensity[position] if is_written else None for position, is_written in zip(positions, written)
+            ]
+        for axis, values in (("pan", pan), ("tilt", tilt)):
+            if not fixture._has_axis_16bit(axis):
+                continue
+            msb_channel, lsb_channel = fixture.meta_channels[axis].channels[:2]
+            writes[msb_channel] = [None if value is None else (value >> 8) & 0xFF for value in values]
+            writes[lsb_channel] = [None if value is None else value & 0xFF for value in values]
+        if self.shutter:
+            writes["shutter"] = [255 if is_written else None for is_written in written]
+        return {
+            channel: carry_column(universe, fixture, channel, values)
+            for channel, values in writes.items()
+            if channel in fixture.channels
+        }
+
+
+def cached_trajectory(
+    render_state: Dict[str, Any],
+    build: Callable[..., Optional[MovementTrajectory]],
+    fixture,
+    universe: bytearray,
+    first_frame: int,
+    start_frame: int,
+    end_frame: int,
+    fps: int,
+    data: Dict[str, Any],
+) -> Optional[MovementTrajectory]:
+    """The cue's trajectory, built from the universe at its first rendered frame.
+
+    A cue whose targets do not resolve builds nothing and is retried on the next frame,
+    like the per-frame handlers it replaces.
+    """
+    trajectory = render_state.get("trajectory")
+    if trajectory is None:
+        trajectory = build(fixture, universe, first_frame, start_frame, end_frame, fps, data or {})
+        if trajectory is not None:
+            render_state["trajectory"] = trajectory
+    return trajectory
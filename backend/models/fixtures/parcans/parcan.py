@@ -14,7 +14,7 @@ class Parcan(Fixture):
         dmx: Dict[int, int] = {}
         for name, offset in self.template.channels.items():
             val = int(self.current_values.get(name, 0) or 0)
-            dmx[self.base_channel + offset] = max(0, min(255, val))
+            dmx[self.universe * 512 + self.base_channel + offset] = max(0, min(255, val))
         return dmx
 
     def apply_preset(self, preset: Dict[str, Any]) -> None:
@@ -1,8 +1,9 @@
 import asyncio
+import os
 import socket
 from pathlib import Path
 from time import perf_counter
-from typing import Iterable, Optional, Union
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
 
 ARTNET_IP = "192.168.10.221"
 ARTNET_PORT = 6454
@@ -10,13 +11,96 @@ ARTNET_UNIVERSE = 0
 DMX_CHANNELS = 512
 SEND_FPS = 30
 
+# ArtDMX packet: 18-byte header (ID, OpCode, protocol version, sequence, physical, universe,
+# big-endian data length) followed by the 512 DMX channels.
+ARTDMX_HEADER_SIZE = 18
+ARTDMX_SEQUENCE_OFFSET = 12
+# ArtSync: ID, OpCode 0x5200, protocol version 14, two aux bytes. Nodes that receive it hold
+# ArtDMX data until the next ArtSync, so every universe of a frame latches at once.
+ARTSYNC_PACKET = b"Art-Net\x00" + bytes((0x00, 0x52, 0x00, 0x0E, 0x00, 0x00))
+
 UniverseLike = Union[bytes, bytearray, memoryview, Iterable[int]]
 
+
+def build_artdmx_packet(universe: int) -> bytearray:
+    """Preallocated ArtDMX packet for one universe; channel data starts at ARTDMX_HEADER_SIZE."""
+    packet = bytearray(ARTDMX_HEADER_SIZE + DMX_CHANNELS)
+    packet[0:8] = b'Art-Net\x00'  # ID
+    packet[8:10] = (0x00, 0x50)  # OpCode: ArtDMX (little-endian)
+    packet[10:12] = (0x00, 0x0e)  # Protocol version 14
+    packet[12:14] = (0x00, 0x00)  # Sequence (filled per send) + Physical
+    packet[14:16] = (universe & 0xFF, (universe >> 8) & 0xFF)  # Universe (SubUni, Net)
+    packet[16:18] = ((DMX_CHANNELS >> 8) & 0xFF, DMX_CHANNELS & 0xFF)  # Data length = 512
+    return packet
+
+
+def parse_artnet_outputs(spec: str) -> List[Tuple[str, int]]:
+    """(node ip, Art-Net universe) per output universe from "ip:universe,ip:universe".
+
+    A bare ip takes the universe after the previous entry's; empty means one universe,
+    ARTNET_UNIVERSE on ARTNET_IP.
+    """
+    outputs: List[Tuple[str, int]] = []
+    for item in str(spec or "").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        ip, _, universe = item.partition(":")
+        outputs.append((ip.strip(), int(universe) if universe.strip() else (outputs[-1][1] + 1 if outputs else ARTNET_UNIVERSE)))
+    return outputs or [(ARTNET_IP, ARTNET_UNIVERSE)]
+
+
+class ArtNetOutput:
+    """One output universe: its node address and preallocated ArtDMX packet."""
+
+    __slots__ = ("address", "universe", "packet", "data", "version", "sent_version", "sequence")
+
+    def __init__(self, ip: str, universe: int):
+        self.address = (ip, ARTNET_PORT)
+        self.universe = universe
+        # The universe lives inside the preallocated packet, so sending copies nothing.
+        self.packet = build_artdmx_packet(universe)
+        self.data = memoryview(self.packet)[ARTDMX_HEADER_SIZE:]
+        # Bumped on every write that changes a byte; the universe is sent when its version differs
+        # from the last sent one.
+        self.version = 0
+        self.sent_version = 0
+        self.sequence = 0
+
+    def write(self, universe: Union[bytes, bytearray, memoryview]) -> None:
+        if self.data != universe:
+            self.data[:] = universe
+            self.version += 1
+
+
 class ArtNetService:
-    def __init__(self, debug: bool = False, debug_file: Optional[str] = None):
-        self.dmx_universe: bytearray = bytearray(DMX_CHANNELS)
+    """Art-Net output of one or more 512-channel universes, each routed to its node.
+
+    Output universe i is bytes i*512..(i+1)*512 of a frame passed to update_universe. Every send tick
+    sends the universes written since their last send (each tracked on its own); with more than one output
+    (or ARTNET_SYNC=1) an ArtSync follows each batch so all nodes latch the frame together.
+    Canvas frames and the live output universe hold every rig universe back to back, so fixture
+    universe i is sent on output i.
+    """
+
+    def __init__(
+        self,
+        debug: bool = False,
+        debug_file: Optional[str] = None,
+        outputs: Optional[Sequence[Tuple[str, int]]] = None,
+        sync: Optional[bool] = None,
+    ):
+        if outputs is None:
+            outputs = parse_artnet_outputs(os.environ.get("ARTNET_OUTPUTS", ""))
+        self.outputs: List[ArtNetOutput] = [ArtNetOutput(ip, universe) for ip, universe in outputs]
+        if not self.outputs:
+            raise ValueError("ArtNetService needs at least one output")
+        if sync is None:
+            sync_setting = os.environ.get("ARTNET_SYNC", "auto").strip().lower()
+            sync = len(self.outputs) > 1 if sync_setting == "auto" else sync_setting in {"1", "true", "yes", "on"}
+        self.sync = bool(sync)
+        self.sync_addresses = list(dict.fromkeys(output.address for output in self.outputs))
         self.last_send = 0.0
-        self.last_packet: bytes = bytes(DMX_CHANNELS)
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         self.running = False
@@ -26,6 +110,15 @@ class ArtNetService:
         if self.debug_file_path is not None:
             self.debug_file_path.parent.mkdir(parents=True, exist_ok=True)
 
+    @property
+    def universe_count(self) -> int:
+        return len(self.outputs)
+
+    @property
+    def output_version(self) -> int:
+        """Grows whenever any output universe's bytes change (frame writes and set_channel alike)."""
+        return sum(output.version for output in self.outputs)
+
     async def start(self):
         self.running = True
         asyncio.create_task(self.send_loop())
@@ -37,21 +130,17 @@ class ArtNetService:
     async def set_continuous_send(self, continuous: bool):
         self.continuous_send = bool(continuous)
 
+    def _write_universes(self, frame: Union[bytes, bytearray, memoryview]) -> None:
+        """Write a frame of one or more consecutive universes, starting at output 0."""
+        if not frame or len(frame) % DMX_CHANNELS:
+            raise ValueError(f"universe must be a multiple of {DMX_CHANNELS} bytes")
+        view = memoryview(frame)
+        for index, output in enumerate(self.outputs[: len(frame) // DMX_CHANNELS]):
+            output.write(view[index * DMX_CHANNELS : (index + 1) * DMX_CHANNELS])
+
     async def update_universe(self, universe: UniverseLike):
-        if isinstance(universe, memoryview):
-            if len(universe) != DMX_CHANNELS:
-                raise ValueError(f"universe must be {DMX_CHANNELS} bytes")
-            self.dmx_universe[:] = universe
-            return
-        if isinstance(universe, bytes):
-            if len(universe) != DMX_CHANNELS:
-                raise ValueError(f"universe must be {DMX_CHANNELS} bytes")
-            self.dmx_universe[:] = universe
-            return
-        if isinstance(universe, bytearray):
-            if len(universe) != DMX_CHANNELS:
-                raise ValueError(f"universe must be {DMX_CHANNELS} bytes")
-            self.dmx_universe[:] = universe
+        if isinstance(universe, (bytes, bytearray, memoryview)):
+            self._write_universes(universe)
             return
 
         # Fallback: iterable of ints
@@ -62,7 +151,7 @@ class ArtNetService:
                 break
             vals[i] = max(0, min(255, int(v)))
             i += 1
-        self.dmx_universe[:] = vals
+        self._write_universes(vals)
 
     async def send_loop(self):
         frame_interval = 1.0 / SEND_FPS
@@ -79,34 +168,38 @@ class ArtNetService:
             self.last_send = perf_counter()
 
     async def send_artnet(self):
-        current_packet = bytes(self.dmx_universe)
-        if not self.continuous_send and current_packet == self.last_packet:
-            return  # Don't send if not continuous and no change
-
-        # Build packet
-        packet = bytearray()
-        packet.extend(b'Art-Net\x00')  # ID
-        packet.extend((0x00, 0x50))  # OpCode: ArtDMX
-        packet.extend((0x00, 0x0e))  # Protocol version
-        packet.extend((0x00, 0x00))  # Sequence + Physical
-        packet.extend((ARTNET_UNIVERSE & 0xFF, (ARTNET_UNIVERSE >> 8) & 0xFF))  # Universe
-        packet.extend((0x02, 0x00))  # Data length = 512
-        packet.extend(self.dmx_universe)
-
-        if self.debug:
-            await self._debug_dump(current_packet)
-
-        try:
-            self.sock.sendto(packet, (ARTNET_IP, ARTNET_PORT))
-        except Exception as e:
-            print(f"Art-Net send error: {e}")
-
-        self.last_packet = current_packet
-
-    async def _debug_dump(self, universe_bytes: bytes):
+        sent = False
+        for output in self.outputs:
+            if not self.continuous_send and output.version == output.sent_version:
+                continue  # Don't send if not continuous and no change
+
+            # Sequence runs 1..255 (0 would tell receivers not to reorder).
+            output.sequence = output.sequence % 255 + 1
+            output.packet[ARTDMX_SEQUENCE_OFFSET] = output.sequence
+
+            if self.debug:
+                await self._debug_dump(bytes(output.data), output.universe if len(self.outputs) > 1 else None)
+
+            try:
+                self.sock.sendto(output.packet, output.address)
+                sent = True
+            except Exception as e:
+                print(f"Art-Net send error: {e}")
+
+            output.sent_version = output.version
+
+        if sent and self.sync:
+            for address in self.sync_addresses:
+                try:
+                    self.sock.sendto(ARTSYNC_PACKET, address)
+                except Exception as e:
+                    print(f"Art-Net sync error: {e}")
+
+    async def _debug_dump(self, universe_bytes: bytes, universe: Optional[int] = None):
         timestamp = perf_counter()
         dmx_hex = '.'.join(f"{value:02X}" for value in universe_bytes)
-        line = f"[{timestamp:.3f}] artnet dmx {dmx_hex}\n"
+        label = "" if universe is None else f"u{universe} "
+        line = f"[{timestamp:.3f}] artnet dmx {label}{dmx_hex}\n"
 
         print(line, end="")
 
@@ -118,8 +211,13 @@ class ArtNetService:
                 print(f"Art-Net debug write error: {e}")
 
     async def set_channel(self, channel: int, value: int):
-        if 1 <= channel <= DMX_CHANNELS and 0 <= value <= 255:
-            self.dmx_universe[channel - 1] = value
+        """Set a 1-based channel; channels past 512 address the following output universes."""
+        if 1 <= channel <= DMX_CHANNELS * len(self.outputs) and 0 <= value <= 255:
+            output = self.outputs[(channel - 1) // DMX_CHANNELS]
+            offset = (channel - 1) % DMX_CHANNELS
+            if output.data[offset] != value:
+                output.data[offset] = value
+                output.version += 1
 
     async def arm_fixture(self, fixture):
         # Use meta_channels to apply arm values
@@ -134,12 +232,12 @@ class ArtNetService:
                     await self.set_channel(fixture.absolute_channels[mc.channel], mc.arm)
 
     async def blackout(self, send_once: bool = True) -> None:
-        """Immediately set the entire DMX universe to zero and optionally send one Art-Net packet.
+        """Immediately set every DMX universe to zero and optionally send one Art-Net batch.
 
         This is intended to be called during shutdown to ensure fixtures go dark before sockets close.
         """
-        # Zero the universe
-        self.dmx_universe = bytearray(DMX_CHANNELS)
+        # Zero the universes
+        self._write_universes(bytes(DMX_CHANNELS * len(self.outputs)))
         # Send one packet immediately so lights receive the blackout
         if send_once:
             try:
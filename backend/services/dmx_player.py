@@ -0,0 +1,230 @@
+"""Standalone playback of exported `.dmx` show files over Art-Net.
+
+Plays a `DMXP` file (docs/dmx_player/dmx_file_specification.md) straight from a read-only
+memory mapping, or a compact (version 2) file decoded into its runs' frames: no cue sheet,
+fixtures, render pipeline, pydantic models or MCP are loaded, so a stripped-down show
+machine can run the final show from exported files.
+
+    cd backend && python -m services.dmx_player ../data/shows/{song}.{show}.dmx
+
+Only the standard library and `services.artnet` are imported; the format constants are
+repeated here rather than imported from `store.services.canvas_binary` and
+`store.services.canvas_binary_compact`, whose canvas module pulls in NumPy when it is installed.
+"""
+
+import argparse
+import asyncio
+import mmap
+from bisect import bisect_right
+from pathlib import Path
+from struct import Struct, error as struct_error
+from time import perf_counter
+from typing import Any, Optional
+
+from services.artnet import DMX_CHANNELS, ArtNetService
+
+DMXP_MAGIC = b"DMXP"
+DMXP_VERSION = 1
+DMXP_HEADER = Struct("<4sHHII16s")
+DMXP_TIMESTAMP = Struct("<I")
+DMXP_COMPACT_VERSION = 2
+DMXP_RUN_COUNT = Struct("<I")
+DMXP_RUN = Struct("<IH")
+DMXP_DELTA = Struct("<HB")
+
+
+def _read_header(buffer: Any, version: int) -> tuple[int, int, int]:
+    """(total frames, fps, universes) of a DMXP header that must carry version."""
+    if len(buffer) < DMXP_HEADER.size:
+        raise ValueError("truncated DMXP header")
+    magic, file_version, universes, total_frames, fps, _reserved = DMXP_HEADER.unpack_from(buffer)
+    if magic != DMXP_MAGIC or file_version != version or universes < 1:
+        raise ValueError("unsupported DMXP file")
+    if total_frames <= 0 or fps <= 0:
+        raise ValueError("DMXP file has no frames")
+    return total_frames, fps, universes
+
+
+class _ShowFrames:
+    """Timestamp lookups shared by both show file layouts."""
+
+    total_frames: int
+
+    def timestamp_ms(self, frame_index: int) -> int:
+        raise NotImplementedError
+
+    def frame_at_ms(self, time_ms: float) -> int:
+        """Last frame whose timestamp is at or before time_ms (0 before the first frame)."""
+        index = bisect_right(range(self.total_frames), time_ms, key=self.timestamp_ms) - 1
+        return max(0, index)
+
+    @property
+    def duration_ms(self) -> int:
+        return self.timestamp_ms(self.total_frames - 1)
+
+
+class DmxShowFile(_ShowFrames):
+    """Read-only mapping of a DMXP show file; timestamps and frames (all universes) are read in place."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path, "rb") as handle:
+            try:
+                self._mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as exc:  # empty file
+                raise ValueError("truncated DMXP header") from exc
+        try:
+            self.total_frames, self.fps, self.universe_count = self._read_layout()
+        except ValueError:
+            self._mapped.close()
+            raise
+        self._view = memoryview(self._mapped)
+
+    def _read_layout(self) -> tuple[int, int, int]:
+        total_frames, fps, universes = _read_header(self._mapped, DMXP_VERSION)
+        self.frame_size = DMX_CHANNELS * universes
+        self.record_size = DMXP_TIMESTAMP.size + self.frame_size
+        if len(self._mapped) != DMXP_HEADER.size + total_frames * self.record_size:
+            raise ValueError("DMXP size does not match its frame count")
+        return total_frames, fps, universes
+
+    def timestamp_ms(self, frame_index: int) -> int:
+        return DMXP_TIMESTAMP.unpack_from(self._mapped, DMXP_HEADER.size + frame_index * self.record_size)[0]
+
+    def frame_view(self, frame_index: int) -> memoryview:
+        start = DMXP_HEADER.size + frame_index * self.record_size + DMXP_TIMESTAMP.size
+        return self._view[start : start + self.frame_size]
+
+    def close(self) -> None:
+        self._view.release()
+        self._mapped.close()
+
+
+class CompactDmxShowFile(_ShowFrames):
+    """A compact (version 2) DMXP show file, decoded at open into one frame per run.
+
+    Timestamps are not stored in this layout; they follow from the frame index and fps
+    exactly as the full layout writes them.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        data = memoryview(self.path.read_bytes())
+        self.total_frames, self.fps, self.universe_count = _read_header(data, DMXP_COMPACT_VERSION)
+        self.frame_size = DMX_CHANNELS * self.universe_count
+        self._run_starts, self._run_frames = self._read_runs(data)
+
+    def _read_runs(self, data: memoryview) -> tuple[list[int], list[memoryview]]:
+        frame = bytearray(self.frame_size)
+        starts: list[int] = []
+        frames: list[memoryview] = []
+        try:
+            (run_count,) = DMXP_RUN_COUNT.unpack_from(data, DMXP_HEADER.size)
+            offset = DMXP_HEADER.size + DMXP_RUN_COUNT.size
+            for _run in range(run_count):
+                first_frame, delta_count = DMXP_RUN.unpack_from(data, offset)
+                offset += DMXP_RUN.size
+                for channel, value in DMXP_DELTA.iter_unpack(data[offset : offset + delta_count * DMXP_DELTA.size]):
+                    frame[channel] = value
+                offset += delta_count * DMXP_DELTA.size
+                starts.append(first_frame)
+                frames.append(memoryview(bytes(frame)))
+        except (struct_error, IndexError) as exc:
+            raise ValueError("truncated compact DMXP file") from exc
+        if offset != len(data) or not starts or starts[0] != 0 or starts != sorted(set(starts)) or starts[-1] >= self.total_frames:
+            raise ValueError("corrupt compact DMXP run table")
+        return starts, frames
+
+    def timestamp_ms(self, frame_index: int) -> int:
+        return int(round((frame_index * 1000.0) / float(self.fps)))
+
+    def frame_view(self, frame_index: int) -> memoryview:
+        return self._run_frames[bisect_right(self._run_starts, frame_index) - 1]
+
+    def close(self) -> None:
+        self._run_frames = []
+
+
+def open_show_file(path: Path) -> DmxShowFile | CompactDmxShowFile:
+    """Open a show file in whichever DMXP layout its header names."""
+    with open(path, "rb") as handle:
+        header = handle.read(DMXP_HEADER.size)
+    if len(header) == DMXP_HEADER.size and DMXP_HEADER.unpack(header)[1] == DMXP_COMPACT_VERSION:
+        return CompactDmxShowFile(path)
+    return DmxShowFile(path)
+
+
+class DmxShowPlayer:
+    """Drives ArtNetService universes from a show file's frame timestamps.
+
+    Sleeps until each frame is due; frames that are already late when the player wakes are
+    skipped, so output stays on the wall clock instead of drifting behind it. `stop()` is
+    final: `running` only covers the current pass, `stopped` also ends a `--loop`.
+    """
+
+    def __init__(self, show: DmxShowFile | CompactDmxShowFile, artnet_service: Any):
+        self.show = show
+        self.artnet_service = artnet_service
+        self.running = False
+        self.stopped = False
+        self.frames_sent = 0
+
+    async def play(self, start_seconds: float = 0.0) -> None:
+        show = self.show
+        started = perf_counter() - max(0.0, float(start_seconds))
+        frame_index = show.frame_at_ms(max(0.0, float(start_seconds)) * 1000.0)
+        self.running = True
+        try:
+            while self.running and not self.stopped and frame_index < show.total_frames:
+                delay = started + show.timestamp_ms(frame_index) / 1000.0 - perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                else:
+                    frame_index = max(frame_index, show.frame_at_ms((perf_counter() - started) * 1000.0))
+                await self.artnet_service.update_universe(show.frame_view(frame_index))
+                self.frames_sent += 1
+                frame_index += 1
+        finally:
+            self.running = False
+
+    def stop(self) -> None:
+        self.stopped = True
+        self.running = False
+
+
+async def play_show_file(path: Path, *, start_seconds: float = 0.0, loop: bool = False, artnet_service: Optional[Any] = None) -> None:
+    """Play a show file (optionally looping) on an Art-Net service, then black out."""
+    show = open_show_file(path)
+    artnet = artnet_service or ArtNetService()
+    print(
+        f"[DMX PLAYER] playing '{show.path.name}' — frames={show.total_frames} fps={show.fps} universes={show.universe_count}",
+        flush=True,
+    )
+    if show.universe_count > artnet.universe_count:
+        print(f"[DMX PLAYER] only the first {artnet.universe_count} universe(s) have an Art-Net output (ARTNET_OUTPUTS)", flush=True)
+    await artnet.start()
+    try:
+        player = DmxShowPlayer(show, artnet)
+        await player.play(start_seconds)
+        while loop and not player.stopped:
+            await player.play()
+    finally:
+        await artnet.blackout()
+        await artnet.stop()
+        show.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Play an exported .dmx show file over Art-Net.")
+    parser.add_argument("path", type=Path, help="DMXP show file ({song}.{show}.dmx), full or compact")
+    parser.add_argument("--start", type=float, default=0.0, help="start position in seconds")
+    parser.add_argument("--loop", action="store_true", help="restart the show when it ends")
+    args = parser.parse_args()
+    try:
+        asyncio.run(play_show_file(args.path, start_seconds=args.start, loop=args.loop))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,17 @@
 from typing import Dict, Any, Callable, List
+from .parametric import DynamicWaveRender
 from .wave import dynamic_wave_generator
 
 # Registry for dynamic generator lookup
 # This allows the expansion engine to resolve generator_id to a function
 GENERATORS: Dict[str, Callable[[Dict[str, Any]], List[Dict[str, Any]]]] = {
     "dynamic_wave_generator": dynamic_wave_generator,
-}
\ No newline at end of file
+}
+
+# Generators the canvas renderer draws natively (one parametric cue per fixture) instead of
+# expanding them into GENERATORS' step rows; chaser preview and apply still use the rows.
+PARAMETRIC_RENDERERS: Dict[str, Any] = {
+    "dynamic_wave_generator": DynamicWaveRender(),
+}
+# Render cue effect id -> handler, for the compiled render ops.
+PARAMETRIC_EFFECTS: Dict[str, Any] = {renderer.effect_id: renderer for renderer in PARAMETRIC_RENDERERS.values()}
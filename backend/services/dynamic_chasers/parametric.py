@@ -0,0 +1,226 @@
+"""Native render ops for dynamic chasers.
+
+A generator listed in PARAMETRIC_RENDERERS renders a chaser cue as one cue per fixture
+whose handler evaluates the generator math per frame, instead of the generator's
+one-`set_channels`-row-per-fixture-per-step expansion. Handlers follow the effect handler
+interface (`render` / `render_span`) so compiled render ops call them like registry effects.
+
+Like the rows they replace, steps only write on their start frame and the universe carries
+the color until the next step. Steps that start while another cue runs on the same channels
+are handed back as their set_channels rows (`split_contested`), so they keep the render
+order of their own step time against that cue.
+"""
+
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from models.cues import CueEntry
+from services.cue_helpers.timing import beatToTimeMs
+
+from .wave import WaveParams, wave_params, wave_rgb, wave_step_beats
+
+_WAVE_CHANNELS = ("red", "green", "blue")
+
+
+@lru_cache(maxsize=64)
+def _wave_step_schedule(
+    time: float,
+    bpm: float,
+    fps: int,
+    total_beats: float,
+    resolution: float,
+    cycle_beats: float,
+    repetitions: int,
+) -> Tuple[Tuple[int, float, float], ...]:
+    """(start frame, time, in-cycle beat) of every wave step, in the generator's row order.
+
+    Step times match the expanded chaser rows (cycle offset plus the step beat rounded to
+    3 places).
+    """
+    step_beats = wave_step_beats(total_beats, resolution)
+    steps = []
+    for cycle in range(repetitions):
+        cycle_offset_beats = cycle * cycle_beats
+        for curr_beat in step_beats:
+            step_time = float(time) + beatToTimeMs(cycle_offset_beats + round(curr_beat, 3), bpm) / 1000.0
+            steps.append((int(round(step_time * fps)), step_time, curr_beat))
+    return tuple(steps)
+
+
+def _in_ranges(frame_index: int, ranges: Sequence[Sequence[int]]) -> bool:
+    return any(low <= frame_index <= high for low, high in ranges)
+
+
+class _WavePlan:
+    """Per-cue step frames and colors; immutable, so render checkpoints share it instead of copying."""
+
+    __slots__ = ("frames", "colors")
+
+    def __init__(self, frames: Tuple[int, ...], colors: List[Tuple[int, int, int]]):
+        self.frames = frames
+        self.colors = colors
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "_WavePlan":
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, _WavePlan):
+            return NotImplemented
+        return self.frames == other.frames and self.colors == other.colors
+
+    def color_starting_at(self, frame_index: int) -> Optional[Tuple[int, int, int]]:
+        """Color of the last step starting on frame_index, None when no step starts there."""
+        step = bisect_right(self.frames, frame_index) - 1
+        return self.colors[step] if step >= 0 and self.frames[step] == frame_index else None
+
+
+class DynamicWaveRender:
+    """Per-frame render of `dynamic_wave_generator` for one fixture of the wave."""
+
+    effect_id = "dynamic_wave"
+
+    def render_entries(
+        self,
+        entry: CueEntry,
+        params: Dict[str, Any],
+        *,
+        cycle_beats: float,
+        repetitions: int,
+        bpm: float,
+        fps: int,
+    ) -> List[CueEntry]:
+        """One render cue per wave fixture, spanning the first through the last step frame."""
+        wave = wave_params(params)
+        steps = self._schedule(wave, entry.time, bpm, fps, cycle_beats, repetitions)
+        if not steps:
+            return []
+        duration = max(0.0, max(step[0] for step in steps) / fps - float(entry.time))
+        return [
+            CueEntry(
+                time=entry.time,
+                fixture_id=fixture_id,
+                effect=self.effect_id,
+                duration=duration,
+                data={
+                    "params": params,
+                    "time": entry.time,
+                    "fixture_index": index,
+                    "bpm": bpm,
+                    "cycle_beats": cycle_beats,
+                    "repetitions": repetitions,
+                },
+                name=entry.name,
+                created_by=entry.created_by,
+            )
+            for index, fixture_id in enumerate(wave.fixtures)
+        ]
+
+    def split_contested(self, entry: CueEntry, contested: Sequence[Tuple[int, int]], fps: int) -> List[CueEntry]:
+        """entry without the steps starting in the contested frame ranges, then those steps as set_channels rows.
+
+        The native cue is dropped when every step is contested; rows follow in generator order.
+        """
+        data = entry.data or {}
+        wave = wave_params(data.get("params") or {})
+        steps = self._schedule(wave, data["time"], data["bpm"], fps, data["cycle_beats"], data["repetitions"])
+        index = int(data.get("fixture_index", 0))
+        duration = beatToTimeMs(wave.resolution, data["bpm"]) / 1000.0
+        rows = [
+            CueEntry(
+                time=step_time,
+                fixture_id=entry.fixture_id,
+                effect="set_channels",
+                duration=duration,
+                data=dict(zip(_WAVE_CHANNELS, wave_rgb(wave, index, curr_beat))),
+                name=entry.name,
+                created_by=entry.created_by,
+            )
+            for frame_index, step_time, curr_beat in steps
+            if _in_ranges(frame_index, contested)
+        ]
+        if len(rows) == len(steps):
+            return rows
+        native = CueEntry(
+            time=entry.time,
+            fixture_id=entry.fixture_id,
+            effect=entry.effect,
+            duration=entry.duration,
+            data={**data, "contested": [list(frame_range) for frame_range in contested]},
+            name=entry.name,
+            created_by=entry.created_by,
+        )
+        return [native, *rows]
+
+    @staticmethod
+    def _schedule(wave: WaveParams, time: float, bpm: float, fps: int, cycle_beats: float, repetitions: int):
+        return _wave_step_schedule(float(time), float(bpm), int(fps), wave.total_beats, wave.resolution, float(cycle_beats), int(repetitions))
+
+    def _plan(self, data: Dict[str, Any], fps: int, render_state: Dict[str, Any]) -> _WavePlan:
+        plan = render_state.get("wave_plan")
+        if plan is None:
+            wave = wave_params(data.get("params") or {})
+            steps = self._schedule(wave, data["time"], data["bpm"], fps, data["cycle_beats"], data["repetitions"])
+            contested = data.get("contested") or ()
+            # Steps sharing a start frame write in time order, so the latest one wins.
+            order = sorted(
+                (step for step in range(len(steps)) if not _in_ranges(steps[step][0], contested)),
+                key=lambda step: (steps[step][0], steps[step][1], step),
+            )
+            index = int(data.get("fixture_index", 0))
+            frames = tuple(steps[step][0] for step in order)
+            colors = [wave_rgb(wave, index, steps[step][2]) for step in order]
+            plan = render_state["wave_plan"] = _WavePlan(frames, colors)
+        return plan
+
+    def render(
+        self,
+        fixture: Any,
+        universe: bytearray,
+        *,
+        frame_index: int,
+        start_frame: int,
+        end_frame: int,
+        fps: int,
+        data: Dict[str, Any],
+        render_state: Dict[str, Any],
+    ) -> None:
+        color = self._plan(data, fps, render_state).color_starting_at(frame_index)
+        if color is None:
+            return
+        for channel_name, value in zip(_WAVE_CHANNELS, color):
+            if channel_name in fixture.channels:
+                fixture._write_channel(universe, channel_name, value)
+
+    def render_span(
+        self,
+        fixture: Any,
+        universe: bytearray,
+        *,
+        first_frame: int,
+        last_frame: int,
+        start_frame: int,
+        end_frame: int,
+        fps: int,
+        data: Dict[str, Any],
+        render_state: Dict[str, Any],
+    ) -> Dict[str, List[int]] | None:
+        plan = self._plan(data, fps, render_state)
+        first_step = bisect_left(plan.frames, first_frame)
+        last_step = bisect_right(plan.frames, last_frame)
+        columns: Dict[str, List[int]] = {}
+        for position, name in enumerate(_WAVE_CHANNELS):
+            if name not in fixture.channels:
+                continue
+            abs_ch = fixture._absolute_channel(name)
+            value = universe[abs_ch - 1] if 1 <= abs_ch <= len(universe) else 0
+            column: List[int] = []
+            frame_index = first_frame
+            # Hold the carried value until each step frame, then that step's color.
+            for step in range(first_step, last_step):
+                column.extend([value] * (plan.frames[step] - frame_index))
+                frame_index = plan.frames[step]
+                value = fixture._clamp_byte(plan.colors[step][position])
+            column.extend([value] * (last_frame + 1 - frame_index))
+            columns[name] = column
+        return columns
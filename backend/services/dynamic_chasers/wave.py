@@ -1,48 +1,79 @@
 import math
-from typing import Dict, List, Any
+from functools import lru_cache
+from typing import Dict, List, Any, NamedTuple, Tuple
 from .utils import hex_to_rgb, get_envelope
 
+
+class WaveParams(NamedTuple):
+    fixtures: List[str]
+    base_rgb: List[int]
+    accent_rgb: List[int]
+    total_beats: float
+    resolution: float
+    speed: float
+    fade_in: float
+    fade_out: float
+
+
+def wave_params(params: Dict[str, Any]) -> WaveParams:
+    return WaveParams(
+        fixtures=params.get("fixtures", ["parcan_pl", "parcan_l", "parcan_r", "parcan_pr"]),
+        base_rgb=hex_to_rgb(params.get("base_color", "#000814")),
+        accent_rgb=hex_to_rgb(params.get("accent_color", "#00F5FF")),
+        total_beats=params.get("duration_beats", 4.0),
+        resolution=params.get("step_size", 0.05),  # 20 steps per beat for smoothness
+        speed=params.get("speed", 1.0),
+        fade_in=params.get("fade_in_beats", 1.0),
+        fade_out=params.get("fade_out_beats", 1.0),
+    )
+
+
+@lru_cache(maxsize=64)
+def wave_step_beats(total_beats: float, resolution: float) -> Tuple[float, ...]:
+    """Beat of every wave step, accumulated exactly as the generator walks them."""
+    beats = []
+    curr_beat = 0.0
+    while curr_beat < total_beats:
+        beats.append(curr_beat)
+        curr_beat += resolution
+    return tuple(beats)
+
+
+def wave_rgb(wave: WaveParams, fixture_index: int, curr_beat: float) -> Tuple[int, int, int]:
+    """Wave color of one fixture at one step beat."""
+    envelope = get_envelope(curr_beat, wave.total_beats, wave.fade_in, wave.fade_out)
+
+    # Math: Spatial offset (based on fixture index) + Time offset (based on beat)
+    spatial_phase = (fixture_index / len(wave.fixtures)) * 2 * math.pi
+    time_phase = curr_beat * wave.speed * math.pi
+
+    modulation = (math.sin(spatial_phase - time_phase) + 1) / 2
+
+    # Interpolate colors and apply intensity envelope
+    base_rgb, accent_rgb = wave.base_rgb, wave.accent_rgb
+    r = int((base_rgb[0] + (accent_rgb[0] - base_rgb[0]) * modulation) * envelope)
+    g = int((base_rgb[1] + (accent_rgb[1] - base_rgb[1]) * modulation) * envelope)
+    b = int((base_rgb[2] + (accent_rgb[2] - base_rgb[2]) * modulation) * envelope)
+    return r, g, b
+
+
 def dynamic_wave_generator(params: Dict[str, Any]) -> List[Dict]:
     """
     Generates an organic, sine-modulated wave across fixtures.
     Supports: base_color, accent_color, speed, and fade envelopes.
     """
-    fixtures = params.get("fixtures", ["parcan_pl", "parcan_l", "parcan_r", "parcan_pr"])
-    base_rgb = hex_to_rgb(params.get("base_color", "#000814"))
-    accent_rgb = hex_to_rgb(params.get("accent_color", "#00F5FF"))
-    total_beats = params.get("duration_beats", 4.0)
-    resolution = params.get("step_size", 0.05)  # 20 steps per beat for smoothness
-    speed = params.get("speed", 1.0)
-    fade_in = params.get("fade_in_beats", 1.0)
-    fade_out = params.get("fade_out_beats", 1.0)
-    
+    wave = wave_params(params)
+
     effects = []
-    num_fixtures = len(fixtures)
-    
-    curr_beat = 0.0
-    while curr_beat < total_beats:
-        envelope = get_envelope(curr_beat, total_beats, fade_in, fade_out)
-        
-        for i, fixture_id in enumerate(fixtures):
-            # Math: Spatial offset (based on fixture index) + Time offset (based on beat)
-            spatial_phase = (i / num_fixtures) * 2 * math.pi
-            time_phase = curr_beat * speed * math.pi
-            
-            modulation = (math.sin(spatial_phase - time_phase) + 1) / 2
-            
-            # Interpolate colors and apply intensity envelope
-            r = int((base_rgb[0] + (accent_rgb[0] - base_rgb[0]) * modulation) * envelope)
-            g = int((base_rgb[1] + (accent_rgb[1] - base_rgb[1]) * modulation) * envelope)
-            b = int((base_rgb[2] + (accent_rgb[2] - base_rgb[2]) * modulation) * envelope)
-            
+    for curr_beat in wave_step_beats(wave.total_beats, wave.resolution):
+        for i, fixture_id in enumerate(wave.fixtures):
+            r, g, b = wave_rgb(wave, i, curr_beat)
             effects.append({
                 "beat": round(curr_beat, 3),
                 "fixture_id": fixture_id,
                 "effect": "set_channels",
-                "duration": resolution,
+                "duration": wave.resolution,
                 "data": {"red": r, "green": g, "blue": b}
             })
-        
-        curr_beat += resolution
-        
-    return effects
\ No newline at end of file
+
+    return effects
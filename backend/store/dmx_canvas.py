@@ -1,33 +1,97 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Final
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Final, List, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; array views are unavailable without it.
+    np = None
 
 
 DMX_CHANNELS: Final[int] = 512
 
 
+def rig_universe_count(fixtures: Any) -> int:
+    """Universes a frame needs to hold every fixture: one past the highest fixture universe."""
+    return max((int(getattr(fixture, "universe", 0)) for fixture in fixtures), default=0) + 1
+
+
 @dataclass
 class DMXCanvas:
     """Flat DMX frame buffer.
 
     Frames are stored sequentially in a single bytearray:
-      buffer[frame_index * 512 : (frame_index + 1) * 512]
+      buffer[frame_index * frame_size : (frame_index + 1) * frame_size]
+
+    A frame holds `universe_count` consecutive 512-byte universes (`frame_size` bytes), so
+    channel `universe * 512 + n` of a frame is channel n of that universe; `universe_view`
+    slices one universe out of a frame.
 
     This keeps memory overhead low compared to a Python list of per-frame objects.
+    `channel_view`/`frames_view` expose zero-copy slices of the same buffer; with NumPy
+    installed, `as_array()` views it as a `(total_frames, frame_size)` uint8 array.
+
+    The buffer may also be a read-only `mmap` of a `.dmx` show file (see
+    `canvas_binary.open_canvas_dmxp`), where frames sit `frame_stride` bytes apart after
+    a `frame_offset`-byte header. Such canvases are views only; `to_bytearray()` gives a
+    flat, writable copy.
     """
 
     fps: int
     total_frames: int
-    buffer: bytearray
+    buffer: Union[bytearray, Any]
+    # Render provenance (armed base universe, per-cue signatures, resumable render checkpoints)
+    # used by incremental re-renders.
+    base_universe: bytes = field(default=b"", repr=False, compare=False)
+    cue_signatures: List[Tuple[Any, ...]] = field(default_factory=list, repr=False, compare=False)
+    checkpoints: List[Any] = field(default_factory=list, repr=False, compare=False)
+    # Frame layout inside buffer: flat by default, DMXP frame records for mapped show files.
+    frame_offset: int = field(default=0, repr=False)
+    # A zero stride means flat frames (frame_size bytes apart).
+    frame_stride: int = field(default=0, repr=False)
+    universe_count: int = 1
+
+    def __post_init__(self) -> None:
+        if self.universe_count <= 0:
+            raise ValueError("universe_count must be > 0")
+        if not self.frame_stride:
+            self.frame_stride = self.frame_size
 
     @staticmethod
-    def allocate(*, fps: int, total_frames: int) -> "DMXCanvas":
+    def allocate(*, fps: int, total_frames: int, universe_count: int = 1) -> "DMXCanvas":
         if fps <= 0:
             raise ValueError("fps must be > 0")
         if total_frames <= 0:
             raise ValueError("total_frames must be > 0")
-        return DMXCanvas(fps=fps, total_frames=total_frames, buffer=bytearray(total_frames * DMX_CHANNELS))
+        return DMXCanvas(
+            fps=fps,
+            total_frames=total_frames,
+            buffer=bytearray(total_frames * DMX_CHANNELS * universe_count),
+            universe_count=universe_count,
+        )
+
+    @property
+    def frame_size(self) -> int:
+        return DMX_CHANNELS * self.universe_count
+
+    @property
+    def is_flat(self) -> bool:
+        return self.frame_offset == 0 and self.frame_stride == self.frame_size
+
+    def _frame_start(self, frame_index: int) -> int:
+        return self.frame_offset + frame_index * self.frame_stride
+
+    def to_bytearray(self) -> bytearray:
+        """Flat, writable copy of every frame."""
+        frame_size = self.frame_size
+        if self.is_flat:
+            return bytearray(self.buffer[: self.total_frames * frame_size])
+        flat = bytearray(self.total_frames * frame_size)
+        for frame_index in range(self.total_frames):
+            flat[frame_index * frame_size : (frame_index + 1) * frame_size] = self.frame_view(frame_index)
+        return flat
 
     def clamp_frame_index(self, frame_index: int) -> int:
         if frame_index < 0:
@@ -37,14 +101,129 @@ class DMXCanvas:
         return frame_index
 
     def frame_view(self, frame_index: int) -> memoryview:
-        idx = self.clamp_frame_index(frame_index)
-        start = idx * DMX_CHANNELS
-        end = start + DMX_CHANNELS
-        return memoryview(self.buffer)[start:end]
+        """Every universe of one frame (frame_size bytes)."""
+        start = self._frame_start(self.clamp_frame_index(frame_index))
+        return memoryview(self.buffer)[start : start + self.frame_size]
+
+    def universe_view(self, frame_index: int, universe: int) -> memoryview:
+        """One 512-byte universe (0-based) of one frame."""
+        if not 0 <= universe < self.universe_count:
+            raise ValueError(f"universe must be in 0..{self.universe_count - 1}")
+        start = self._frame_start(self.clamp_frame_index(frame_index)) + universe * DMX_CHANNELS
+        return memoryview(self.buffer)[start : start + DMX_CHANNELS]
+
+    def frames_view(self, first_frame: int, last_frame: int) -> memoryview:
+        """Contiguous view of an inclusive frame range (flat canvases only)."""
+        if not self.is_flat:
+            raise ValueError("frames_view needs a flat canvas; frames are not contiguous")
+        first = self.clamp_frame_index(first_frame)
+        last = self.clamp_frame_index(last_frame)
+        return memoryview(self.buffer)[first * self.frame_size : (last + 1) * self.frame_size]
+
+    def channel_view(self, channel: int, first_frame: int = 0, last_frame: int | None = None, step: int = 1) -> memoryview:
+        """Strided view of one 0-based frame channel over an inclusive frame range, every `step` frames."""
+        if not 0 <= channel < self.frame_size:
+            raise ValueError(f"channel must be in 0..{self.frame_size - 1}")
+        if step <= 0:
+            raise ValueError("step must be > 0")
+        first = self.clamp_frame_index(first_frame)
+        last = self.clamp_frame_index(self.total_frames - 1 if last_frame is None else last_frame)
+        start = self._frame_start(first) + channel
+        return memoryview(self.buffer)[start : self._frame_start(last) + channel + 1 : self.frame_stride * step]
+
+    def as_array(self) -> Any:
+        """`(total_frames, frame_size)` uint8 NumPy array sharing this canvas buffer."""
+        if np is None:
+            raise RuntimeError("numpy is not installed")
+        return np.ndarray(
+            (self.total_frames, self.frame_size),
+            dtype=np.uint8,
+            buffer=self.buffer,
+            offset=self.frame_offset,
+            strides=(self.frame_stride, 1),
+        )
 
     def set_frame(self, frame_index: int, universe: bytearray) -> None:
-        if len(universe) != DMX_CHANNELS:
-            raise ValueError(f"universe must be {DMX_CHANNELS} bytes")
-        idx = self.clamp_frame_index(frame_index)
-        start = idx * DMX_CHANNELS
-        self.buffer[start : start + DMX_CHANNELS] = universe
+        if len(universe) != self.frame_size:
+            raise ValueError(f"universe must be {self.frame_size} bytes")
+        start = self._frame_start(self.clamp_frame_index(frame_index))
+        self.buffer[start : start + self.frame_size] = universe
+
+
+@dataclass
+class RunLengthDMXCanvas:
+    """DMX canvas that stores each run of identical consecutive frames once.
+
+    `run_frames` packs one frame (`frame_size` bytes) per run and `run_index[frame]` names the run a
+    frame belongs to, so `frame_view` stays an O(1), zero-copy lookup. Static looks and
+    blackouts then cost four index bytes per frame instead of 512. Read-only; convert
+    with `from_canvas()` / `to_canvas()`.
+    """
+
+    fps: int
+    total_frames: int
+    run_frames: bytearray
+    run_index: array
+    universe_count: int = 1
+
+    @property
+    def frame_size(self) -> int:
+        return DMX_CHANNELS * self.universe_count
+
+    @staticmethod
+    def from_canvas(canvas: DMXCanvas) -> "RunLengthDMXCanvas":
+        run_frames = bytearray()
+        run_index = array("I", bytes(4 * canvas.total_frames))
+        previous = None
+        run = -1
+        for frame_index in range(canvas.total_frames):
+            frame = canvas.frame_view(frame_index)
+            if previous is None or frame != previous:
+                run_frames += frame
+                run += 1
+                previous = frame
+            run_index[frame_index] = run
+        return RunLengthDMXCanvas(
+            fps=canvas.fps,
+            total_frames=canvas.total_frames,
+            run_frames=run_frames,
+            run_index=run_index,
+            universe_count=canvas.universe_count,
+        )
+
+    @property
+    def run_count(self) -> int:
+        return len(self.run_frames) // self.frame_size
+
+    def run_starts(self) -> List[int]:
+        """First frame of every run, in order."""
+        starts = []
+        previous = -1
+        for frame_index, run in enumerate(self.run_index):
+            if run != previous:
+                starts.append(frame_index)
+                previous = run
+        return starts
+
+    def clamp_frame_index(self, frame_index: int) -> int:
+        if frame_index < 0:
+            return 0
+        if frame_index >= self.total_frames:
+            return self.total_frames - 1
+        return frame_index
+
+    def run_view(self, run: int) -> memoryview:
+        start = run * self.frame_size
+        return memoryview(self.run_frames)[start : start + self.frame_size]
+
+    def frame_view(self, frame_index: int) -> memoryview:
+        return self.run_view(self.run_index[self.clamp_frame_index(frame_index)])
+
+    def to_canvas(self) -> DMXCanvas:
+        canvas = DMXCanvas.allocate(fps=self.fps, total_frames=self.total_frames, universe_count=self.universe_count)
+        frame_size = self.frame_size
+        starts = self.run_starts()
+        for run, first_frame in enumerate(starts):
+            last_frame = starts[run + 1] if run + 1 < len(starts) else self.total_frames
+            canvas.buffer[first_frame * frame_size : last_frame * frame_size] = bytes(self.run_view(run)) * (last_frame - first_frame)
+        return canvas
@@ -0,0 +1,128 @@
+import asyncio
+import threading
+from contextlib import contextmanager
+from copy import deepcopy
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from store.poi_targets import PanTiltU16, parse_axis_target_u16
+
+_NO_TARGET: PanTiltU16 = (None, None)
+# Per-thread POI copy installed by IndexedPois.on_this_thread (canvas render threads).
+_thread_local = threading.local()
+
+
+def _normalize_key(value: Any) -> str:
+    return str(value).strip().lower()
+
+
+class _PoiIndex(NamedTuple):
+    targets: Dict[Tuple[str, str], Dict[str, Any]]
+    pan_tilt: Dict[Tuple[str, str], PanTiltU16]
+    records: Dict[str, Dict[str, Any]]
+    reference_ids: Tuple[str, ...]
+    memo: Dict[Tuple[Any, str], PanTiltU16]
+
+
+class IndexedPois:
+    """A POI list with an index for render-time lookups, and per-thread POI scoping.
+
+    `PoiDatabase` adds loading, saving and CRUD on top; every mutation rebuilds the index.
+    """
+
+    _instance: Optional["IndexedPois"] = None
+
+    @property
+    def pois(self) -> List[Dict[str, Any]]:
+        return self._pois
+
+    @pois.setter
+    def pois(self, pois: List[Dict[str, Any]]) -> None:
+        self._pois = pois
+        self._rebuild_index()
+
+    def _rebuild_index(self) -> None:
+        """Re-index POIs by normalized id and fixture targets by normalized (poi_id, fixture_id).
+
+        Call after mutating `pois` in place. Keeps the first match per key, like a scan in
+        list order. The index and the raw-key memo are swapped in as one tuple, so a render
+        thread never pairs a new index with a stale memo.
+        """
+        values: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        records: Dict[str, Dict[str, Any]] = {}
+        closed = set()
+        for poi in self.pois:
+            poi_key = _normalize_key(poi.get("id"))
+            if poi_key:
+                records.setdefault(poi_key, poi)
+            if not poi_key or poi_key in closed:
+                continue
+            fixtures = poi.get("fixtures", {})
+            if not isinstance(fixtures, dict):
+                closed.add(poi_key)
+                continue
+            for fixture_id, target in fixtures.items():
+                values.setdefault((poi_key, _normalize_key(fixture_id)), target)
+        pan_tilt = {
+            key: (parse_axis_target_u16("pan", target), parse_axis_target_u16("tilt", target))
+            for key, target in values.items()
+        }
+        reference_ids = tuple(poi_key for poi_key in records if poi_key.startswith("ref_"))
+        self._index = _PoiIndex(values, pan_tilt, records, reference_ids, {})
+
+    def get_fixture_target_sync(self, poi_id: str, fixture_id: str) -> Optional[Dict[str, Any]]:
+        return self._index.targets.get((_normalize_key(poi_id), _normalize_key(fixture_id)))
+
+    def get_fixture_pan_tilt_u16(self, poi_id: Any, fixture_id: str) -> PanTiltU16:
+        """Parsed (pan, tilt) u16 target of a fixture at a POI; (None, None) when unset.
+
+        Hot path for moving-head renders: ids are matched case-insensitively once per distinct
+        (poi_id, fixture_id) pair, then served from a memo keyed by the ids as passed.
+        """
+        index = self._index
+        key = (poi_id, fixture_id)
+        cached = index.memo.get(key) if isinstance(poi_id, str) else None
+        if cached is None:
+            cached = index.pan_tilt.get((_normalize_key(poi_id), _normalize_key(fixture_id)), _NO_TARGET)
+            if isinstance(poi_id, str):
+                index.memo[key] = cached
+        return cached
+
+    def get_location_sync(self, poi_id: Any) -> Optional[Dict[str, Any]]:
+        """Raw `location` of a POI (case-insensitive id); {} when it has none, None when unknown."""
+        poi = self._index.records.get(_normalize_key(poi_id))
+        if poi is None:
+            return None
+        return poi.get("location") or {}
+
+    def reference_poi_ids(self) -> Tuple[str, ...]:
+        """Normalized ids of the `ref_*` POIs that span the room reference cube."""
+        return self._index.reference_ids
+
+    @classmethod
+    def get_instance(cls) -> Optional['IndexedPois']:
+        """The POI copy installed on this thread by `on_this_thread`, else the singleton."""
+        instance = getattr(_thread_local, "instance", None)
+        return instance if instance is not None else cls._instance
+
+    @classmethod
+    def detached(cls, pois: List[Dict[str, Any]]) -> 'IndexedPois':
+        """An in-memory, never-saved POI copy that is not installed as the singleton."""
+        instance = cls.__new__(cls)
+        instance.filepath = None
+        instance.lock = asyncio.Lock()
+        instance.pois = deepcopy(pois)
+        return instance
+
+    @contextmanager
+    def on_this_thread(self) -> Iterator['IndexedPois']:
+        """Serve `get_instance()` from this database on the calling thread only.
+
+        Canvas renders read POIs through the singleton; a render thread working on a state
+        snapshot installs the snapshot's POIs here so live POI edits cannot reach it.
+        """
+        previous = getattr(_thread_local, "instance", None)
+        _thread_local.instance = self
+        try:
+            yield self
+        finally:
+            _thread_local.instance = previous
@@ -0,0 +1,48 @@
+from typing import Any, Dict, Optional, Tuple
+
+PanTiltU16 = Tuple[Optional[int], Optional[int]]
+
+
+def _clamp_byte(value: Any) -> int:
+    try:
+        iv = int(value)
+    except Exception:
+        return 0
+    return max(0, min(255, iv))
+
+
+def _clamp_u16(value: Any) -> int:
+    try:
+        iv = int(value)
+    except (ValueError, TypeError):
+        return 0
+    return max(0, min(65535, iv))
+
+
+def parse_axis_target_u16(axis: str, payload: Dict[str, Any]) -> Optional[int]:
+    """u16 target for `pan`/`tilt` from `{axis}_msb`/`{axis}_lsb`, `{axis}` + `{axis}_fine`, or a packed `{axis}`."""
+    if not isinstance(payload, dict):
+        return None
+
+    # Direct MSB/LSB.
+    msb_key = f"{axis}_msb"
+    lsb_key = f"{axis}_lsb"
+    if msb_key in payload or lsb_key in payload:
+        return _clamp_u16((_clamp_byte(payload.get(msb_key, 0)) << 8) | _clamp_byte(payload.get(lsb_key, 0)))
+
+    # Packed u16 in `pan`/`tilt`.
+    if axis in payload:
+        try:
+            iv = int(payload.get(axis, 0))
+        except (TypeError, ValueError):
+            return None
+
+        # If a fine component exists, treat axis as MSB byte.
+        fine_key = f"{axis}_fine"
+        if fine_key in payload:
+            return _clamp_u16((_clamp_byte(iv) << 8) | _clamp_byte(payload.get(fine_key, 0)))
+
+        # Otherwise interpret as u16 (0..65535).
+        return _clamp_u16(iv)
+
+    return None
@@ -4,13 +4,14 @@ from copy import deepcopy
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
-class PoiDatabase:
-    _instance: Optional['PoiDatabase'] = None
+from store.poi_index import IndexedPois
 
+
+class PoiDatabase(IndexedPois):
     def __init__(self, filepath: Path):
-        self.filepath = filepath
+        self.filepath: Optional[Path] = filepath
         self.lock = asyncio.Lock()
-        self.pois: List[Dict[str, Any]] = []
+        self.pois = []
         self._load_sync()
         PoiDatabase._instance = self
 
@@ -56,6 +57,7 @@ class PoiDatabase:
                 if poi.get("id") == poi_id:
                     raise ValueError(f"POI with id {poi_id} already exists")
             self.pois.append(poi_data)
+            self._rebuild_index()
             self._save_unlocked()
         return poi_data
 
@@ -65,6 +67,7 @@ class PoiDatabase:
                 if poi.get("id") == poi_id:
                     self.pois[i] = {**poi, **poi_data, "id": poi_id}
                     updated = self.pois[i]
+                    self._rebuild_index()
                     self._save_unlocked()
                     break
             else:
@@ -80,18 +83,6 @@ class PoiDatabase:
             self._save_unlocked()
         return True
 
-    def get_fixture_target_sync(self, poi_id: str, fixture_id: str) -> Optional[Dict[str, Any]]:
-        for poi in self.pois:
-            if str(poi.get("id")).strip().lower() == str(poi_id).strip().lower():
-                fixtures = poi.get("fixtures", {})
-                if not isinstance(fixtures, dict):
-                    return None
-                
-                for f_id, f_data in fixtures.items():
-                    if str(f_id).strip().lower() == str(fixture_id).strip().lower():
-                        return f_data
-        return None
-
     async def set_fixture_target(self, poi_id: str, fixture_id: str, channels: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         async with self.lock:
             for poi in self.pois:
@@ -101,14 +92,11 @@ class PoiDatabase:
                         fixtures = {}
                         poi["fixtures"] = fixtures
                     fixtures[fixture_id] = channels
+                    self._rebuild_index()
                     self._save_unlocked()
                     return channels
         return None
 
-    @classmethod
-    def get_instance(cls) -> Optional['PoiDatabase']:
-        return cls._instance
-
 
 # Compatibility alias while callers migrate.
 PoiStore = PoiDatabase
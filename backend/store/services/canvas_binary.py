@@ -0,0 +1,163 @@
+import mmap
+import os
+import sys
+from array import array
+from pathlib import Path
+from struct import Struct
+from typing import Any, BinaryIO, Callable, Tuple
+
+from store.dmx_canvas import DMX_CHANNELS, DMXCanvas, np
+
+
+# DMXP layout: header (magic, version, universes, total frames, fps, 16 reserved bytes),
+# then one record per frame: u32 timestamp in ms followed by the frame's 512-byte universes.
+DMXP_MAGIC = b"DMXP"
+DMXP_VERSION = 1
+DMXP_HEADER = Struct("<4sHHII16s")
+DMXP_TIMESTAMP = Struct("<I")
+DMXP_FRAME_RECORD = DMXP_TIMESTAMP.size + DMX_CHANNELS  # single-universe record; see dmxp_frame_record()
+# Frame records are packed and written this many at a time (~2 MB per write).
+DMXP_WRITE_CHUNK_FRAMES = 4096
+
+def dmxp_frame_record(universe_count: int = 1) -> int:
+    """Bytes per DMXP frame record: timestamp plus universe_count universes."""
+    return DMXP_TIMESTAMP.size + DMX_CHANNELS * universe_count
+
+
+def pack_dmxp_header(version: int, total_frames: int, fps: int, reserved: bytes, universe_count: int = 1) -> bytes:
+    """The 32-byte DMXP header shared by every version; reserved is padded or cut to 16 bytes."""
+    return DMXP_HEADER.pack(DMXP_MAGIC, version, int(universe_count), int(total_frames), int(fps), bytes(reserved[:16]).ljust(16, b"\x00"))
+
+
+def _dmxp_timestamps(first_frame: int, frame_count: int, fps: int) -> bytes:
+    """Little-endian u32 millisecond timestamps of frames first_frame.. (frame_count of them)."""
+    timestamps = array("I", (int(round((frame_index * 1000.0) / float(fps))) for frame_index in range(first_frame, first_frame + frame_count)))
+    if sys.byteorder == "big":
+        timestamps.byteswap()
+    return timestamps.tobytes()
+
+
+def pack_dmxp_records(canvas: DMXCanvas, first_frame: int, frame_count: int) -> Any:
+    """DMXP frame records (timestamp + universes) of frame_count frames from first_frame, in one buffer.
+
+    With NumPy the frames are copied as one strided block; without it, one slice copy per frame.
+    """
+    timestamps = _dmxp_timestamps(first_frame, frame_count, canvas.fps)
+    record_size = dmxp_frame_record(canvas.universe_count)
+    frame_size = canvas.frame_size
+    if np is not None:
+        records = np.empty((frame_count, record_size), dtype=np.uint8)
+        records[:, : DMXP_TIMESTAMP.size] = np.frombuffer(timestamps, dtype=np.uint8).reshape(frame_count, DMXP_TIMESTAMP.size)
+        records[:, DMXP_TIMESTAMP.size :] = canvas.as_array()[first_frame : first_frame + frame_count]
+        return memoryview(records).cast("B")
+
+    records = bytearray(frame_count * record_size)
+    for lane in range(DMXP_TIMESTAMP.size):
+        records[lane :: record_size] = timestamps[lane :: DMXP_TIMESTAMP.size]
+    view = memoryview(records)
+    source = memoryview(canvas.buffer)
+    start = canvas._frame_start(first_frame)
+    offset = DMXP_TIMESTAMP.size
+    for _frame in range(frame_count):
+        view[offset : offset + frame_size] = source[start : start + frame_size]
+        offset += record_size
+        start += canvas.frame_stride
+    return view
+
+
+def _dmxp_mapped_records(canvas: DMXCanvas) -> memoryview | None:
+    """The frame-record section of a canvas that is itself a mapped DMXP file, else None."""
+    record_size = dmxp_frame_record(canvas.universe_count)
+    if canvas.frame_stride != record_size or canvas.frame_offset != DMXP_HEADER.size + DMXP_TIMESTAMP.size:
+        return None
+    return memoryview(canvas.buffer)[DMXP_HEADER.size : DMXP_HEADER.size + canvas.total_frames * record_size]
+
+
+def write_canvas_dmxp(handle: BinaryIO, canvas: DMXCanvas, *, reserved: bytes = b"") -> None:
+    """Write canvas in the DMXP layout; reserved fills the header's 16 spare bytes.
+
+    Records are packed and written in DMXP_WRITE_CHUNK_FRAMES blocks; a canvas mapped from a
+    DMXP file streams its record section straight from the mapping.
+    """
+    handle.write(pack_dmxp_header(DMXP_VERSION, canvas.total_frames, canvas.fps, reserved, canvas.universe_count))
+    mapped = _dmxp_mapped_records(canvas)
+    chunk_bytes = DMXP_WRITE_CHUNK_FRAMES * dmxp_frame_record(canvas.universe_count)
+    if mapped is not None:
+        for start in range(0, len(mapped), chunk_bytes):
+            handle.write(mapped[start : start + chunk_bytes])
+        return
+    for first_frame in range(0, canvas.total_frames, DMXP_WRITE_CHUNK_FRAMES):
+        frame_count = min(DMXP_WRITE_CHUNK_FRAMES, canvas.total_frames - first_frame)
+        handle.write(pack_dmxp_records(canvas, first_frame, frame_count))
+
+
+def write_file_atomic(path: Path, write: Callable[[BinaryIO], None]) -> Path:
+    """Write a file through write(handle) into a temp file beside path, then rename it over path.
+
+    Readers (and the mapped cache) never see a half-written file.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(temp_path, "wb") as handle:
+            write(handle)
+        os.replace(temp_path, path)
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
+    return path
+
+
+def unpack_dmxp_header(buffer: Any, size: int, version: int) -> Tuple[int, int, int, bytes]:
+    """(total frames, fps, universes, reserved) of a DMXP header, which must carry version."""
+    if size < DMXP_HEADER.size:
+        raise ValueError("truncated DMXP header")
+    magic, file_version, universes, total_frames, fps, reserved = DMXP_HEADER.unpack_from(buffer)
+    if magic != DMXP_MAGIC or file_version != version or universes < 1:
+        raise ValueError("unsupported DMXP file")
+    if total_frames <= 0 or fps <= 0:
+        raise ValueError("DMXP file has no frames")
+    return total_frames, fps, universes, bytes(reserved)
+
+
+def _dmxp_canvas(buffer: Any, size: int) -> Tuple[DMXCanvas, bytes]:
+    total_frames, fps, universes, reserved = unpack_dmxp_header(buffer, size, DMXP_VERSION)
+    record_size = dmxp_frame_record(universes)
+    if size != DMXP_HEADER.size + total_frames * record_size:
+        raise ValueError("DMXP size does not match its frame count")
+    canvas = DMXCanvas(
+        fps=fps,
+        total_frames=total_frames,
+        buffer=buffer,
+        frame_offset=DMXP_HEADER.size + DMXP_TIMESTAMP.size,
+        frame_stride=record_size,
+        universe_count=universes,
+    )
+    return canvas, reserved
+
+
+def read_canvas_dmxp(data: bytes | memoryview) -> Tuple[DMXCanvas, bytes]:
+    """Parse a DMXP image into a flat canvas and its 16 reserved header bytes."""
+    records, reserved = _dmxp_canvas(data, len(data))
+    canvas = DMXCanvas(
+        fps=records.fps,
+        total_frames=records.total_frames,
+        buffer=records.to_bytearray(),
+        universe_count=records.universe_count,
+    )
+    return canvas, reserved
+
+
+def open_canvas_dmxp(path: Path) -> Tuple[DMXCanvas, bytes]:
+    """Map a DMXP file read-only as a canvas; frames are served straight from the page cache."""
+    with open(path, "rb") as handle:
+        try:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as exc:  # empty file
+            raise ValueError("truncated DMXP header") from exc
+    try:
+        return _dmxp_canvas(mapped, len(mapped))
+    except ValueError:
+        mapped.close()
+        raise
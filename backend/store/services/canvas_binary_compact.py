@@ -0,0 +1,75 @@
+from array import array
+from struct import Struct, error as struct_error
+from typing import BinaryIO, Tuple
+
+from store.dmx_canvas import DMX_CHANNELS, RunLengthDMXCanvas
+from store.services.canvas_binary import DMXP_HEADER, pack_dmxp_header, unpack_dmxp_header
+
+
+# Compact DMXP (version 2): same header, then a u32 run count and per run of identical
+# frames its first frame, a u16 change count and (u16 channel, u8 value) deltas from the
+# previous run's frame (the first run is diffed against an all-zero frame). Channels are
+# 0-based frame offsets, so later universes start at 512.
+DMXP_COMPACT_VERSION = 2
+DMXP_RUN_COUNT = Struct("<I")
+DMXP_RUN = Struct("<IH")
+DMXP_DELTA = Struct("<HB")
+
+
+def write_compact_canvas_dmxp(
+    handle: BinaryIO,
+    canvas: RunLengthDMXCanvas,
+    *,
+    reserved: bytes = b"",
+    channels: range | None = None,
+) -> None:
+    """Write a run-length canvas as compact DMXP: one delta record per run of identical frames.
+
+    `channels` (0-based frame offsets, default every channel) limits the dump to a channel
+    range; channels outside it read back as 0 and runs that change nothing inside it are
+    merged into the previous run.
+    """
+    if channels is None:
+        channels = range(canvas.frame_size)
+    records = []
+    previous = bytes(canvas.frame_size)
+    for run, first_frame in enumerate(canvas.run_starts()):
+        frame = bytes(canvas.run_view(run))
+        deltas = [channel for channel in channels if frame[channel] != previous[channel]]
+        if deltas or not records:
+            records.append(DMXP_RUN.pack(first_frame, len(deltas)) + b"".join(DMXP_DELTA.pack(channel, frame[channel]) for channel in deltas))
+        previous = frame
+    handle.write(pack_dmxp_header(DMXP_COMPACT_VERSION, canvas.total_frames, canvas.fps, reserved, canvas.universe_count))
+    handle.write(DMXP_RUN_COUNT.pack(len(records)))
+    handle.write(b"".join(records))
+
+
+def read_compact_canvas_dmxp(data: bytes | memoryview) -> Tuple[RunLengthDMXCanvas, bytes]:
+    """Parse a compact DMXP image into a run-length canvas and its 16 reserved header bytes."""
+    view = memoryview(data)
+    total_frames, fps, universes, reserved = unpack_dmxp_header(view, len(view), DMXP_COMPACT_VERSION)
+    try:
+        (run_count,) = DMXP_RUN_COUNT.unpack_from(view, DMXP_HEADER.size)
+        offset = DMXP_HEADER.size + DMXP_RUN_COUNT.size
+        frame = bytearray(DMX_CHANNELS * universes)
+        run_frames = bytearray()
+        starts = []
+        for _run in range(run_count):
+            first_frame, delta_count = DMXP_RUN.unpack_from(view, offset)
+            offset += DMXP_RUN.size
+            for channel, value in DMXP_DELTA.iter_unpack(view[offset : offset + delta_count * DMXP_DELTA.size]):
+                frame[channel] = value
+            offset += delta_count * DMXP_DELTA.size
+            run_frames += frame
+            starts.append(first_frame)
+    except (struct_error, IndexError) as exc:
+        raise ValueError("truncated compact DMXP file") from exc
+    if offset != len(view) or not starts or starts[0] != 0 or starts != sorted(set(starts)) or starts[-1] >= total_frames:
+        raise ValueError("corrupt compact DMXP run table")
+
+    run_index = array("I", bytes(4 * total_frames))
+    for run, first_frame in enumerate(starts):
+        last_frame = starts[run + 1] if run + 1 < len(starts) else total_frames
+        run_index[first_frame:last_frame] = array("I", [run]) * (last_frame - first_frame)
+    canvas = RunLengthDMXCanvas(fps=fps, total_frames=total_frames, run_frames=run_frames, run_index=run_index, universe_count=universes)
+    return canvas, reserved
@@ -0,0 +1,73 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Iterable
+
+from models.chasers import ChaserDefinition
+from models.cues import CueSheet
+from models.fixtures.fixture import Fixture
+from store.dmx_canvas import DMXCanvas
+from store.services.canvas_binary import open_canvas_dmxp, write_canvas_dmxp, write_file_atomic
+
+
+# Bump when renderer output changes for identical inputs, so stale cache files miss.
+CANVAS_CACHE_RENDER_VERSION = 2
+
+
+def _dump_model(value: Any) -> Any:
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    return value
+
+
+def canvas_render_key(
+    *,
+    fixtures: Iterable[Fixture],
+    cue_sheet: CueSheet | None,
+    chasers: Iterable[ChaserDefinition],
+    pois: Iterable[dict[str, Any]],
+    bpm: float,
+    song_length_seconds: float,
+    fps: int,
+    base_universe: bytes,
+) -> bytes:
+    """16-byte digest of every input the song canvas render depends on.
+
+    Fixtures are dumped whole (template, base channel, current values and POI targets),
+    so fixture, template and POI edits change the key along with cues and chasers.
+    """
+    payload = {
+        "render_version": CANVAS_CACHE_RENDER_VERSION,
+        "fixtures": [_dump_model(fixture) for fixture in fixtures],
+        "cue_sheet": _dump_model(cue_sheet),
+        "chasers": [_dump_model(chaser) for chaser in chasers],
+        "pois": list(pois),
+        "bpm": float(bpm),
+        "song_length_seconds": float(song_length_seconds),
+        "fps": int(fps),
+        "base_universe": bytes(base_universe).hex(),
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).digest()
+
+
+def build_canvas_cache_path(cache_dir: Path, song_filename: str) -> Path:
+    return Path(cache_dir) / f"{song_filename}.canvas.dmx"
+
+
+def load_cached_canvas(path: Path, key: bytes) -> DMXCanvas | None:
+    """Read-only, memory-mapped canvas stored at path when its DMXP header carries key, else None."""
+    try:
+        canvas, stored_key = open_canvas_dmxp(Path(path))
+    except (OSError, ValueError):
+        return None
+    if stored_key != key:
+        canvas.buffer.close()
+        return None
+    return canvas
+
+
+def store_cached_canvas(path: Path, key: bytes, canvas: DMXCanvas) -> Path:
+    """Write canvas to path with key in the DMXP header; replaces any older entry atomically."""
+    return write_file_atomic(path, lambda handle: write_canvas_dmxp(handle, canvas, reserved=key))
+
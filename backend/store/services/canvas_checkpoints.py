@@ -0,0 +1,147 @@
+import copy
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Sequence, Set, Tuple
+
+
+# Periodic checkpoint spacing; section boundaries add extra checkpoints on top of this grid.
+CHECKPOINT_INTERVAL_SECONDS = 4.0
+
+
+@dataclass(frozen=True)
+class CanvasCheckpoint:
+    """Render state carried into `frame`.
+
+    The carried universe is not copied: it is canvas frame `frame - 1`, which the render
+    has already written. `active` pairs each running cue (an index into the canvas cue
+    signatures) with a private copy of its effect render state.
+    """
+
+    frame: int
+    active: Tuple[Tuple[int, Dict[str, Any]], ...]
+
+
+def checkpoint_frames(
+    *,
+    total_frames: int,
+    fps: int,
+    interval_seconds: float = CHECKPOINT_INTERVAL_SECONDS,
+    boundary_seconds: Iterable[float] = (),
+) -> List[int]:
+    frames = set()
+    if interval_seconds > 0:
+        step = max(1, int(round(interval_seconds * fps)))
+        frames.update(range(step, total_frames, step))
+    for seconds in boundary_seconds:
+        try:
+            frame = int(round(float(seconds) * fps))
+        except (TypeError, ValueError):
+            continue
+        if 0 < frame < total_frames:
+            frames.add(frame)
+    return sorted(frames)
+
+
+def capture_checkpoint(
+    frame: int,
+    active: Sequence[Tuple[int, int, Any]],
+    cue_index: Dict[int, int],
+    entry_render_state: Dict[int, Dict[str, Any]],
+) -> CanvasCheckpoint:
+    running = []
+    for _start, end, entry in active:
+        state = entry_render_state.get(id(entry))
+        # Cues without state never reached a fixture (unknown fixture id) and render nothing.
+        if end < frame or state is None:
+            continue
+        running.append((cue_index[id(entry)], copy.deepcopy(state)))
+    return CanvasCheckpoint(frame=frame, active=tuple(running))
+
+
+def restore_checkpoint(
+    checkpoint: CanvasCheckpoint,
+    cues: Sequence[Tuple[int, int, Any]],
+    cue_indices: Sequence[int],
+) -> Tuple[List[Tuple[int, int, Any]], Dict[int, Dict[str, Any]]]:
+    """Rebuild the active cue list and render state map for resuming at checkpoint.frame.
+
+    cue_indices gives the cue list index of each entry in cues; running cues outside that
+    subset (other fixture layers) are skipped.
+    """
+    position_by_index = {index: position for position, index in enumerate(cue_indices)}
+    active = []
+    entry_render_state: Dict[int, Dict[str, Any]] = {}
+    for index, state in sorted(checkpoint.active, key=lambda item: item[0]):
+        position = position_by_index.get(index)
+        if position is None:
+            continue
+        item = cues[position]
+        active.append(item)
+        entry_render_state[id(item[2])] = copy.deepcopy(state)
+    return active, entry_render_state
+
+
+def merge_layer_checkpoints(frames: Iterable[int], layer_checkpoints: Iterable[Iterable[CanvasCheckpoint]]) -> List[CanvasCheckpoint]:
+    """Combine per-fixture-layer checkpoints captured at the same frames into whole-rig checkpoints."""
+    merged: Dict[int, List[Tuple[int, Dict[str, Any]]]] = {frame: [] for frame in frames}
+    for checkpoints in layer_checkpoints:
+        for checkpoint in checkpoints:
+            merged[checkpoint.frame].extend(checkpoint.active)
+    return [CanvasCheckpoint(frame=frame, active=tuple(sorted(active, key=lambda item: item[0]))) for frame, active in sorted(merged.items())]
+
+
+def swap_layer_checkpoints(
+    checkpoint_active: Dict[int, List[Any]],
+    captured: List[CanvasCheckpoint],
+    layer_indices: Set[int],
+    last_frame: int,
+) -> None:
+    """Swap a re-rendered layer's share of each checkpoint inside its rendered window.
+
+    Frames after the converged last_frame were copied from the previous canvas, and so is
+    their state.
+    """
+    for checkpoint in captured:
+        if checkpoint.frame > last_frame or checkpoint.frame not in checkpoint_active:
+            continue
+        kept = [item for item in checkpoint_active[checkpoint.frame] if item[0] not in layer_indices]
+        checkpoint_active[checkpoint.frame] = kept + list(checkpoint.active)
+
+
+def nearest_checkpoint(checkpoints: Sequence[CanvasCheckpoint], frame_index: int) -> CanvasCheckpoint | None:
+    """Latest checkpoint at or before frame_index."""
+    position = bisect_right([checkpoint.frame for checkpoint in checkpoints], frame_index)
+    return checkpoints[position - 1] if position > 0 else None
+
+
+def remap_checkpoints(
+    checkpoints: Iterable[CanvasCheckpoint],
+    old_signatures: Sequence[Tuple[Any, ...]],
+    new_signatures: Sequence[Tuple[Any, ...]],
+) -> List[CanvasCheckpoint]:
+    """Re-point checkpoint cue indices at a new cue list, dropping cues that no longer exist.
+
+    Identical cues are matched by occurrence order so that duplicates keep their own state.
+    A dropped cue was a changed cue, so every frame it ran over is re-rendered (and its
+    fixture layer's share of the checkpoint recaptured) by the re-render that follows.
+    """
+    new_positions: Dict[Tuple[Any, ...], List[int]] = {}
+    for index, signature in enumerate(new_signatures):
+        new_positions.setdefault(signature, []).append(index)
+    old_rank: List[int] = []
+    seen: Dict[Tuple[Any, ...], int] = {}
+    for signature in old_signatures:
+        rank = seen.get(signature, 0)
+        old_rank.append(rank)
+        seen[signature] = rank + 1
+
+    remapped = []
+    for checkpoint in checkpoints:
+        active = []
+        for index, state in checkpoint.active:
+            positions = new_positions.get(old_signatures[index], [])
+            rank = old_rank[index]
+            if rank < len(positions):
+                active.append((positions[rank], state))
+        remapped.append(CanvasCheckpoint(frame=checkpoint.frame, active=tuple(sorted(active, key=lambda item: item[0]))))
+    return remapped
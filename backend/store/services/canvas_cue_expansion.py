@@ -0,0 +1,78 @@
+from typing import Dict, List
+
+from models.chasers import ChaserDefinition, get_chaser_by_id, get_chaser_cycle_beats
+from models.cues import CueEntry
+from services.cue_helpers.timing import beatToTimeMs
+from services.dynamic_chasers import PARAMETRIC_RENDERERS
+from store.services.canvas_profile import CUE_SOURCE_CHASER, CUE_SOURCE_DYNAMIC, CUE_SOURCE_USER
+from store.services.chaser_expansion import chaser_definition_hash, expand_chaser_cycle
+
+
+def expand_entry_for_render(
+    entry: CueEntry,
+    chasers: List[ChaserDefinition],
+    bpm: float,
+    fps: int,
+    definition_hashes: Dict[int, str] | None = None,
+) -> List[CueEntry]:
+    """Render rows of one cue: the cue itself, or a chaser cue's expanded step rows.
+
+    Dynamic chasers go through their parametric renderer. definition_hashes memoizes each
+    chaser's definition hash (the expansion cache key) across one cue sheet.
+    """
+    if not entry.is_chaser:
+        return [entry]
+    if bpm <= 0.0:
+        return []
+    chaser = get_chaser_by_id(chasers, entry.chaser_id or "")
+    if not chaser:
+        return []
+    try:
+        repetitions = int((entry.data or {}).get("repetitions", 1))
+    except (TypeError, ValueError):
+        repetitions = 1
+
+    definition_hash = None
+    if definition_hashes is not None:
+        definition_hash = definition_hashes.get(id(chaser))
+        if definition_hash is None:
+            definition_hash = definition_hashes[id(chaser)] = chaser_definition_hash(chaser)
+    # Per-cue data may override a dynamic chaser's default_params (excluding bookkeeping keys).
+    params = {k: v for k, v in (entry.data or {}).items() if k != "repetitions"}
+    renderer = PARAMETRIC_RENDERERS.get(chaser.generator_id or "") if chaser.type == "dynamic" else None
+    if renderer is not None:
+        return renderer.render_entries(
+            entry,
+            {**chaser.default_params, **params},
+            cycle_beats=get_chaser_cycle_beats(chaser),
+            repetitions=max(1, repetitions),
+            bpm=bpm,
+            fps=fps,
+        )
+    expansion = expand_chaser_cycle(chaser, params, bpm, definition_hash)
+    if expansion is None:
+        return []
+
+    expanded: List[CueEntry] = []
+    for cycle in range(max(1, repetitions)):
+        cycle_offset_beats = cycle * expansion.cycle_beats
+        for step in expansion.steps:
+            expanded.append(
+                CueEntry(
+                    time=float(entry.time) + beatToTimeMs(cycle_offset_beats + step.beat, bpm) / 1000.0,
+                    fixture_id=step.fixture_id,
+                    effect=step.effect,
+                    duration=step.duration_seconds,
+                    data=dict(step.data),
+                    name=entry.name,
+                    created_by=entry.created_by,
+                )
+            )
+    return expanded
+
+
+def cue_source(entry: CueEntry, chasers: List[ChaserDefinition]) -> str:
+    if not entry.is_chaser:
+        return CUE_SOURCE_USER
+    chaser = get_chaser_by_id(chasers, entry.chaser_id or "")
+    return CUE_SOURCE_DYNAMIC if chaser and chaser.type == "dynamic" else CUE_SOURCE_CHASER
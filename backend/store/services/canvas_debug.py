@@ -1,8 +1,38 @@
 from datetime import date
 from pathlib import Path
-from struct import pack
+from struct import Struct
+from typing import Tuple
 
-from store.dmx_canvas import DMX_CHANNELS, DMXCanvas
+from store.dmx_canvas import DMX_CHANNELS, DMXCanvas, RunLengthDMXCanvas
+from store.services.canvas_binary import write_canvas_dmxp, write_file_atomic
+from store.services.canvas_binary_compact import write_compact_canvas_dmxp
+
+
+# Binary debug dumps are compact DMXP files whose reserved header bytes hold the dumped
+# (first, last) 1-based channel range.
+DEBUG_CHANNEL_RANGE = Struct("<HH")
+
+
+def parse_debug_channel_range(spec: str, max_used_channel: int, channel_limit: int = DMX_CHANNELS) -> Tuple[int, int]:
+    """1-based inclusive channel range from "first-last" or "last"; empty means 1..max_used_channel.
+
+    Channels are frame-absolute, so channel_limit is the canvas frame size (512 per universe).
+    """
+    last_default = max(1, min(channel_limit, int(max_used_channel or channel_limit)))
+    text = str(spec or "").strip()
+    try:
+        if not text:
+            first, last = 1, last_default
+        elif "-" in text:
+            first_text, last_text = text.split("-", 1)
+            first, last = int(first_text), int(last_text)
+        else:
+            first, last = 1, int(text)
+    except ValueError:
+        print(f"[DMX CANVAS] ignoring invalid debug channel range '{spec}'", flush=True)
+        first, last = 1, last_default
+    first = max(1, min(channel_limit, first))
+    return first, max(first, min(channel_limit, last))
 
 
 def build_show_name(show_date: date | None = None) -> str:
@@ -10,8 +40,15 @@ def build_show_name(show_date: date | None = None) -> str:
     return f"show_{current_date.strftime('%Y%m%d')}"
 
 
-def build_named_canvas_binary_path(*, backend_path: Path, song_filename: str, show_date: date | None = None) -> Path:
-    return backend_path.parent / "data" / "shows" / f"{song_filename}.{build_show_name(show_date)}.dmx"
+def build_named_canvas_binary_path(
+    *,
+    backend_path: Path,
+    song_filename: str,
+    show_date: date | None = None,
+    compact: bool = False,
+) -> Path:
+    suffix = "compact.dmx" if compact else "dmx"
+    return backend_path.parent / "data" / "shows" / f"{song_filename}.{build_show_name(show_date)}.{suffix}"
 
 
 def dump_named_canvas_binary(
@@ -20,6 +57,7 @@ def dump_named_canvas_binary(
     song_filename: str,
     canvas: DMXCanvas | None,
     show_date: date | None = None,
+    compact: bool = False,
 ) -> Path | None:
     if not canvas:
         return None
@@ -28,55 +66,64 @@ def dump_named_canvas_binary(
         backend_path=backend_path,
         song_filename=song_filename,
         show_date=show_date,
+        compact=compact,
     )
-    binary_file.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(binary_file, "wb") as handle:
-        handle.write(
-            pack(
-                "<4sHHII16s",
-                b"DMXP",
-                1,
-                1,
-                int(canvas.total_frames),
-                int(canvas.fps),
-                b"\x00" * 16,
-            )
-        )
-        for frame_index in range(canvas.total_frames):
-            timestamp_ms = int(round((frame_index * 1000.0) / float(canvas.fps)))
-            handle.write(pack("<I", timestamp_ms))
-            handle.write(canvas.frame_view(frame_index))
+    if compact:
+        runs = RunLengthDMXCanvas.from_canvas(canvas)
+        write_file_atomic(binary_file, lambda handle: write_compact_canvas_dmxp(handle, runs))
+    else:
+        write_file_atomic(binary_file, lambda handle: write_canvas_dmxp(handle, canvas))
 
     print(f"[DMX CANVAS] dumped binary show '{binary_file}' — frames={canvas.total_frames}", flush=True)
     return binary_file
 
 
+def build_canvas_debug_path(*, backend_path: Path, file_stem: str, binary: bool = False) -> Path:
+    return backend_path / "cues" / f"{file_stem}.{'dmx.bin' if binary else 'dmx.log'}"
+
+
 def dump_named_canvas_debug(
     *,
     backend_path: Path,
     file_stem: str,
     canvas: DMXCanvas | None,
     max_used_channel: int,
+    first_channel: int = 1,
+    binary: bool = False,
 ) -> Path | None:
+    """Dump channels first_channel..max_used_channel (1-based) of every frame.
+
+    The text form writes one `[seconds] HH.HH...` line per frame with a non-zero channel in
+    range; the binary form writes a compact DMXP of the range (see DEBUG_CHANNEL_RANGE).
+    """
     if not canvas:
         return None
 
-    cues_path = backend_path / "cues"
-    cues_path.mkdir(parents=True, exist_ok=True)
-    debug_file = cues_path / f"{file_stem}.dmx.log"
-    frames_written = 0
-    max_channel = max_used_channel or DMX_CHANNELS
-    max_channel = max(1, min(DMX_CHANNELS, int(max_channel)))
+    debug_file = build_canvas_debug_path(backend_path=backend_path, file_stem=file_stem, binary=binary)
+    debug_file.parent.mkdir(parents=True, exist_ok=True)
+    last_channel = max(1, min(canvas.frame_size, int(max_used_channel or canvas.frame_size)))
+    first_channel = max(1, min(last_channel, int(first_channel)))
+
+    if binary:
+        runs = RunLengthDMXCanvas.from_canvas(canvas)
+        with open(debug_file, "wb") as handle:
+            write_compact_canvas_dmxp(
+                handle,
+                runs,
+                reserved=DEBUG_CHANNEL_RANGE.pack(first_channel, last_channel),
+                channels=range(first_channel - 1, last_channel),
+            )
+        print(f"[DMX CANVAS] dumped DMX binary '{debug_file}' — runs={runs.run_count}", flush=True)
+        return debug_file
 
+    frames_written = 0
+    zero = bytes(last_channel - first_channel + 1)
     with open(debug_file, "w") as handle:
         for frame_index in range(canvas.total_frames):
-            view = canvas.frame_view(frame_index)
-            if not any(byte != 0 for byte in view[:max_channel]):
+            values = canvas.frame_view(frame_index)[first_channel - 1 : last_channel].tobytes()
+            if values == zero:
                 continue
-            time_sec = frame_index / float(canvas.fps)
-            hex_pairs = ".".join(f"{int(byte):02X}" for byte in view[:max_channel])
-            handle.write(f"[{time_sec:.3f}] {hex_pairs}\n")
+            handle.write(f"[{frame_index / float(canvas.fps):.3f}] {values.hex('.').upper()}\n")
             frames_written += 1
 
     print(f"[DMX CANVAS] dumped DMX log '{debug_file}' — frames={frames_written}", flush=True)
@@ -89,12 +136,16 @@ def dump_canvas_debug(
     song_filename: str,
     canvas: DMXCanvas | None,
     max_used_channel: int,
-) -> None:
-    dump_named_canvas_debug(
+    first_channel: int = 1,
+    binary: bool = False,
+) -> Path | None:
+    return dump_named_canvas_debug(
         backend_path=backend_path,
         file_stem=song_filename,
         canvas=canvas,
         max_used_channel=max_used_channel,
+        first_channel=first_channel,
+        binary=binary,
     )
 
 
@@ -104,10 +155,12 @@ def dump_canvas_binary(
     song_filename: str,
     canvas: DMXCanvas | None,
     show_date: date | None = None,
+    compact: bool = False,
 ) -> Path | None:
     return dump_named_canvas_binary(
         backend_path=backend_path,
         song_filename=song_filename,
         canvas=canvas,
         show_date=show_date,
+        compact=compact,
     )
@@ -0,0 +1,75 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from store.dmx_canvas import DMXCanvas
+from store.services.canvas_debug import dump_named_canvas_debug, parse_debug_channel_range
+
+DEBUG_DUMP_MODES = ("off", "log", "binary")
+
+
+class CanvasDebugExporter:
+    """Writes debug canvas dumps on one background thread, off the render path and the state lock.
+
+    Requests are coalesced per file: a dump requested while an older one for the same file
+    is still queued replaces it, so rapid edits write only the latest canvas. Canvases are
+    never written to after they are swapped in, so the worker reads them without copying.
+    """
+
+    def __init__(self, backend_path: Path, mode: str = "off", channels: str = ""):
+        self.backend_path = backend_path
+        self.mode = mode if mode in DEBUG_DUMP_MODES else "off"
+        self.channels = channels
+        self._pending: Dict[str, Tuple[DMXCanvas, int]] = {}
+        self._pending_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._draining = False
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    def submit(self, file_stem: str, canvas: DMXCanvas | None, max_used_channel: int) -> bool:
+        """Queue a dump of canvas to cues/<file_stem>.dmx.log (or .dmx.bin); False when disabled."""
+        if not self.enabled or canvas is None:
+            return False
+        with self._pending_lock:
+            self._pending[file_stem] = (canvas, max_used_channel)
+            if not self._draining:
+                self._draining = True
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="canvas-debug")
+                self._executor.submit(self._write_pending)
+        return True
+
+    def _write_pending(self) -> None:
+        while True:
+            with self._pending_lock:
+                if not self._pending:
+                    self._draining = False
+                    return
+                file_stem = next(iter(self._pending))
+                canvas, max_used_channel = self._pending.pop(file_stem)
+            first_channel, last_channel = parse_debug_channel_range(self.channels, max_used_channel, canvas.frame_size)
+            try:
+                dump_named_canvas_debug(
+                    backend_path=self.backend_path,
+                    file_stem=file_stem,
+                    canvas=canvas,
+                    max_used_channel=last_channel,
+                    first_channel=first_channel,
+                    binary=self.mode == "binary",
+                )
+            except OSError as exc:
+                print(f"[DMX CANVAS] debug dump failed for '{file_stem}': {exc}", flush=True)
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """Block until every queued dump is written."""
+        while True:
+            with self._pending_lock:
+                if not self._draining:
+                    return
+                # The single worker runs tasks in order, so this returns after the running drain.
+                barrier = self._executor.submit(lambda: None)
+            barrier.result(timeout)
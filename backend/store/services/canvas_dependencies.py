@@ -0,0 +1,105 @@
+import json
+from contextlib import nullcontext
+from typing import Any, ContextManager, Dict, List, NamedTuple, Optional, Tuple
+
+from models.cues import CueEntry
+from store.pois import PoiDatabase, PoiStore
+
+# Cue data keys that name a POI (sweep, orbit, orbit_out, move_to_poi, circle).
+POI_REFERENCE_KEYS = ("subject_POI", "start_POI", "end_POI", "target_POI", "target_poi", "poi_id", "poi", "POI")
+# Effects that also read the room reference cube (every `ref_*` POI) for their fixture.
+REFERENCE_CUBE_EFFECTS = frozenset({"circle"})
+
+PoiDependency = Tuple[str, Any]
+
+
+def snapshot_poi_db(pois: Optional[List[Dict[str, Any]]]) -> Optional[PoiDatabase]:
+    """Detached POI database for a render snapshot's POI list; None renders from the live store."""
+    return PoiDatabase.detached(pois) if pois is not None else None
+
+
+def poi_scope(poi_db: Optional[PoiDatabase]) -> ContextManager[Any]:
+    """Serve POI lookups on this thread from poi_db while rendering (no-op for the live store)."""
+    return poi_db.on_this_thread() if poi_db is not None else nullcontext()
+
+
+def cue_poi_ids(entry: CueEntry) -> Tuple[str, ...]:
+    """Normalized ids of the POIs a render cue reads, in a stable order."""
+    data = entry.data or {}
+    poi_ids = set()
+    for key in POI_REFERENCE_KEYS:
+        value = data.get(key)
+        if isinstance(value, str) and value.strip():
+            poi_ids.add(value.strip().lower())
+    return tuple(sorted(poi_ids))
+
+
+def _poi_value(poi_db: PoiDatabase, poi_id: str, fixture_id: str) -> Tuple[Any, ...]:
+    location = poi_db.get_location_sync(poi_id)
+    return (
+        poi_db.get_fixture_pan_tilt_u16(poi_id, fixture_id),
+        None if location is None else json.dumps(location, sort_keys=True, default=str),
+    )
+
+
+def cue_poi_dependencies(entry: CueEntry, poi_db: Optional[PoiDatabase] = None) -> Tuple[PoiDependency, ...]:
+    """(poi id, resolved value) for every POI the cue reads, as seen by its fixture.
+
+    The value is the fixture's parsed pan/tilt target at the POI plus the POI location, so
+    it changes exactly when an edit changes what the cue renders from. Part of the cue's
+    render signature: a POI edit marks only the cues that use that POI as changed.
+    """
+    poi_ids = cue_poi_ids(entry)
+    effect = str(entry.effect or "").strip().lower()
+    if not poi_ids and effect not in REFERENCE_CUBE_EFFECTS:
+        return ()
+    poi_db = poi_db or PoiStore.get_instance()
+    if poi_db is None:
+        return ()
+
+    fixture_id = entry.fixture_id or ""
+    if effect in REFERENCE_CUBE_EFFECTS:
+        poi_ids = tuple(sorted(set(poi_ids) | set(poi_db.reference_poi_ids())))
+    return tuple((poi_id, _poi_value(poi_db, poi_id, fixture_id)) for poi_id in poi_ids)
+
+
+class CueRenderSignature(NamedTuple):
+    """Value snapshot of one render cue, comparable across render passes.
+
+    `pois` holds the resolved value of every POI the cue reads (see cue_poi_dependencies),
+    so POI edits change the signatures of exactly the cues that depend on them.
+    """
+
+    start: int
+    end: int
+    time: float
+    fixture_id: str
+    effect: str
+    data: str
+    pois: Tuple[PoiDependency, ...] = ()
+
+
+def cue_render_signature(start: int, end: int, entry: CueEntry) -> CueRenderSignature:
+    data = json.dumps(entry.data or {}, sort_keys=True, default=str)
+    return CueRenderSignature(
+        int(start),
+        int(end),
+        float(entry.time),
+        entry.fixture_id or "",
+        entry.effect or "",
+        data,
+        cue_poi_dependencies(entry),
+    )
+
+
+def poi_dependents(signatures: Any, poi_id: str) -> Dict[str, int]:
+    """Per fixture id, how many render cues in `signatures` read the POI (a new `ref_*` POI counts for every reference-cube cue)."""
+    needle = str(poi_id or "").strip().lower()
+    reference = needle.startswith("ref_")
+    dependents: Dict[str, int] = {}
+    for signature in signatures:
+        if (reference and str(signature.effect).strip().lower() in REFERENCE_CUBE_EFFECTS) or any(
+            dependency[0] == needle for dependency in signature.pois
+        ):
+            dependents[signature.fixture_id] = dependents.get(signature.fixture_id, 0) + 1
+    return dependents
@@ -0,0 +1,175 @@
+import math
+from bisect import bisect_left
+from time import perf_counter
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+from models.cues import CueEntry
+from models.fixtures.fixture import Fixture
+from store.dmx_canvas import DMXCanvas
+from store.services.canvas_checkpoints import CanvasCheckpoint, capture_checkpoint, restore_checkpoint
+from store.services.canvas_layers import channel_runs, write_channel_column
+from store.services.canvas_profile import RenderProfile
+from store.services.canvas_render_ops import compile_render_ops
+from store.services.canvas_scheduler import ActiveCueScheduler
+
+
+def canvas_total_frames(song_length_seconds: float, fps: int) -> int:
+    return max(1, int(math.ceil(song_length_seconds * fps)) + 1)
+
+
+def write_span(
+    canvas: DMXCanvas,
+    universe: bytearray,
+    runs: Sequence[Tuple[int, int]],
+    first_frame: int,
+    last_frame: int,
+    columns: Dict[int, bytes],
+) -> None:
+    """Write frames first_frame..last_frame: the carried universe, overlaid with span columns."""
+    count = last_frame - first_frame + 1
+    frame_size = canvas.frame_size
+    if runs == [(0, frame_size)]:
+        canvas.buffer[first_frame * frame_size : (last_frame + 1) * frame_size] = bytes(universe) * count
+    else:
+        for low, high in runs:
+            for channel in range(low, high):
+                if channel not in columns:
+                    write_channel_column(canvas.buffer, channel, first_frame, bytes((universe[channel],)) * count, frame_size)
+    for channel, values in columns.items():
+        write_channel_column(canvas.buffer, channel, first_frame, values, frame_size)
+        universe[channel] = values[-1]
+
+
+def render_cue_frames(
+    *,
+    canvas: DMXCanvas,
+    fixtures: List[Fixture],
+    cues: List[Tuple[int, int, CueEntry]],
+    fps: int,
+    universe: bytearray,
+    first_frame: int = 0,
+    resume: CanvasCheckpoint | None = None,
+    previous: DMXCanvas | None = None,
+    settle_frame: int = 0,
+    checkpoint_at: Iterable[int] = (),
+    checkpoints: List[CanvasCheckpoint] | None = None,
+    cue_indices: Sequence[int] | None = None,
+    channels: Sequence[int] | None = None,
+    last_frame: int | None = None,
+    profile: RenderProfile | None = None,
+) -> int:
+    """Render cues from first_frame through last_frame (default: the end) and return the last frame written.
+
+    An ActiveCueScheduler walks the timeline in segments between cue starts, cue ends and
+    checkpoint frames, over which the set of running cues (in render order) is fixed. Segments with no running cue repeat the
+    carried universe, and a segment with a single running cue is handed to the effect's span
+    kernel when it has one; everything else renders frame by frame.
+
+    A resume checkpoint restores the cues already running at first_frame. With a previous
+    canvas, rendering stops at the first frame at or after settle_frame whose output matches
+    it while no cue is still running; every later frame is then known to be identical.
+    Checkpoints for the frames in checkpoint_at are appended to checkpoints (default
+    canvas.checkpoints), labelled with cue_indices when cues is a subset of the cue list.
+    With channels, only those frame offsets are written and compared (fixture layers).
+    A checkpoint requested for last_frame + 1 is still captured, so a later call can resume there.
+    With a profile, every op render and span kernel call is timed into it.
+    """
+    if cue_indices is None:
+        cue_indices = range(len(cues))
+    if checkpoints is None:
+        checkpoints = canvas.checkpoints
+    runs = channel_runs(channels) if channels is not None else [(0, canvas.frame_size)]
+    ops = compile_render_ops(cues, fixtures)
+
+    running: List[Tuple[int, int, CueEntry]] = []
+    entry_render_state: Dict[int, Dict[str, Any]] = {}
+    if resume is not None:
+        running, entry_render_state = restore_checkpoint(resume, cues, cue_indices)
+    scheduler = ActiveCueScheduler(cues, first_frame=first_frame, running=running)
+
+    capture_frames = sorted({frame for frame in checkpoint_at if frame >= first_frame})
+    cue_index = {id(entry): cue_indices[position] for position, (_start, _end, entry) in enumerate(cues)} if capture_frames else {}
+
+    def converged(frame_index: int) -> bool:
+        return (
+            previous is not None
+            and frame_index >= settle_frame
+            and all(end <= frame_index for (_start, end, _entry) in scheduler.active)
+            and all(previous.frame_view(frame_index)[low:high] == universe[low:high] for low, high in runs)
+        )
+
+    final_frame = canvas.total_frames - 1 if last_frame is None else min(last_frame, canvas.total_frames - 1)
+    frame_index = first_frame
+    while frame_index < canvas.total_frames:
+        position = bisect_left(capture_frames, frame_index)
+        if position < len(capture_frames) and capture_frames[position] == frame_index:
+            checkpoints.append(capture_checkpoint(frame_index, scheduler.active, cue_index, entry_render_state))
+            position += 1
+        if frame_index > final_frame:
+            break
+
+        scheduler.advance(frame_index)
+        active = scheduler.active
+
+        # The running set is fixed until the next cue boundary; checkpoint frames also cut segments.
+        segment_last = final_frame
+        next_change = scheduler.next_change()
+        if next_change is not None:
+            segment_last = min(segment_last, next_change - 1)
+        if position < len(capture_frames):
+            segment_last = min(segment_last, capture_frames[position] - 1)
+
+        if not active:
+            for idle_frame in range(frame_index, segment_last + 1):
+                if converged(idle_frame):
+                    write_span(canvas, universe, runs, frame_index, idle_frame, {})
+                    return idle_frame
+            write_span(canvas, universe, runs, frame_index, segment_last, {})
+            frame_index = segment_last + 1
+            continue
+
+        # Resolve the segment's ops and render states once; unknown fixtures render nothing.
+        segment_ops = []
+        for _start, _end, entry in active:
+            op = ops.get(id(entry))
+            if op is not None:
+                segment_ops.append((op, entry_render_state.setdefault(id(entry), {})))
+
+        if len(active) == 1 and segment_ops:
+            op, render_state = segment_ops[0]
+            if profile is None:
+                columns = op.render_span(universe, frame_index, segment_last, render_state, fps)
+            else:
+                started = perf_counter()
+                columns = op.render_span(universe, frame_index, segment_last, render_state, fps)
+                if columns is not None:
+                    profile.record(op, perf_counter() - started, segment_last - frame_index + 1)
+            if columns is not None:
+                write_span(canvas, universe, runs, frame_index, segment_last, columns)
+                if converged(segment_last):
+                    return segment_last
+                frame_index = segment_last + 1
+                continue
+
+        for segment_frame in range(frame_index, segment_last + 1):
+            if profile is None:
+                for op, render_state in segment_ops:
+                    op.render(universe, segment_frame, render_state, fps)
+            else:
+                for op, render_state in segment_ops:
+                    started = perf_counter()
+                    op.render(universe, segment_frame, render_state, fps)
+                    profile.record(op, perf_counter() - started, 1)
+
+            if channels is None:
+                canvas.set_frame(segment_frame, universe)
+            else:
+                offset = segment_frame * canvas.frame_size
+                for low, high in runs:
+                    canvas.buffer[offset + low : offset + high] = universe[low:high]
+
+            if converged(segment_frame):
+                return segment_frame
+        frame_index = segment_last + 1
+
+    return final_frame
@@ -0,0 +1,157 @@
+from dataclasses import replace
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from models.chasers import ChaserDefinition
+from models.cues import CueEntry, CueSheet
+from models.fixtures.fixture import Fixture
+from store.dmx_canvas import DMX_CHANNELS, DMXCanvas, rig_universe_count
+from store.services.canvas_checkpoints import CanvasCheckpoint, checkpoint_frames, nearest_checkpoint, remap_checkpoints, swap_layer_checkpoints
+from store.services.canvas_dependencies import cue_render_signature, poi_scope, snapshot_poi_db
+from store.services.canvas_frames import canvas_total_frames, render_cue_frames
+from store.services.canvas_layers import touched_layers
+from store.services.canvas_profile import RenderProfile
+from store.services.canvas_render_core import iter_cues_for_render
+from store.services.canvas_rendering import render_cue_sheet_to_canvas
+
+
+def _earliest_settled_frame(cues: List[Tuple[int, int, CueEntry]], frame_index: int) -> int:
+    """Walk back from frame_index until no rendered cue straddles the frame boundary."""
+    while frame_index > 0:
+        straddling = [start for start, end, _entry in cues if 0 <= start < frame_index <= end]
+        if not straddling:
+            break
+        frame_index = min(straddling)
+    return frame_index
+
+
+def rerender_cue_sheet_window(
+    *,
+    previous: DMXCanvas | None,
+    fixtures: List[Fixture],
+    cue_sheet: CueSheet | None,
+    chasers: List[ChaserDefinition],
+    bpm: float,
+    song_length_seconds: float,
+    fps: int,
+    apply_arm: Callable[[bytearray], None],
+    checkpoint_seconds: Iterable[float] = (),
+    profile: RenderProfile | None = None,
+    pois: List[Dict[str, Any]] | None = None,
+) -> Tuple[DMXCanvas, Tuple[int, int] | None]:
+    """Re-render only the fixture layers and frames affected by a cue sheet change.
+
+    Changed cues (chaser expansions included) are traced to the fixture layers they touch;
+    every other layer keeps its canvas columns. Each touched layer resumes from the nearest
+    checkpoint before its earliest changed cue, or from the latest frame none of its own cues
+    runs across, whichever is later. Returns the new canvas and the inclusive (first, last)
+    frame window that was rendered, or None when nothing changed. Falls back to a full render
+    whenever the previous canvas cannot be reused (different length, fps or armed base universe).
+    With pois, POI lookups and cue signatures read that snapshot instead of the live POI store.
+    """
+    with poi_scope(snapshot_poi_db(pois)):
+        return _rerender_cue_sheet_window(
+            previous=previous,
+            fixtures=fixtures,
+            cue_sheet=cue_sheet,
+            chasers=chasers,
+            bpm=bpm,
+            song_length_seconds=song_length_seconds,
+            fps=fps,
+            apply_arm=apply_arm,
+            checkpoint_seconds=checkpoint_seconds,
+            profile=profile,
+        )
+
+
+def _rerender_cue_sheet_window(
+    *,
+    previous: DMXCanvas | None,
+    fixtures: List[Fixture],
+    cue_sheet: CueSheet | None,
+    chasers: List[ChaserDefinition],
+    bpm: float,
+    song_length_seconds: float,
+    fps: int,
+    apply_arm: Callable[[bytearray], None],
+    checkpoint_seconds: Iterable[float],
+    profile: RenderProfile | None,
+) -> Tuple[DMXCanvas, Tuple[int, int] | None]:
+    total_frames = canvas_total_frames(song_length_seconds, fps)
+    base_universe = bytearray(DMX_CHANNELS * rig_universe_count(fixtures))
+    apply_arm(base_universe)
+
+    if (
+        previous is None
+        or previous.fps != fps
+        or previous.total_frames != total_frames
+        or previous.base_universe != bytes(base_universe)
+    ):
+        canvas = render_cue_sheet_to_canvas(
+            fixtures=fixtures,
+            cue_sheet=cue_sheet,
+            chasers=chasers,
+            bpm=bpm,
+            song_length_seconds=song_length_seconds,
+            fps=fps,
+            apply_arm=apply_arm,
+            checkpoint_seconds=checkpoint_seconds,
+            profile=profile,
+        )
+        return canvas, (0, canvas.total_frames - 1)
+
+    cues = iter_cues_for_render(cue_sheet, fixtures, fps, chasers, bpm, profile.sources if profile else None)
+    signatures = [cue_render_signature(start, end, entry) for start, end, entry in cues]
+    previous_checkpoints = remap_checkpoints(previous.checkpoints, previous.cue_signatures, signatures)
+    touched = touched_layers(fixtures, cues, signatures, previous.cue_signatures, total_frames)
+    if not touched:
+        canvas = replace(previous, cue_signatures=signatures, checkpoints=previous_checkpoints)
+        return canvas, None
+
+    canvas = DMXCanvas(
+        fps=fps,
+        total_frames=total_frames,
+        buffer=previous.to_bytearray(),
+        base_universe=bytes(base_universe),
+        universe_count=previous.universe_count,
+    )
+    capture_frames = checkpoint_frames(total_frames=total_frames, fps=fps, boundary_seconds=checkpoint_seconds)
+    checkpoint_active = {checkpoint.frame: list(checkpoint.active) for checkpoint in previous_checkpoints}
+    windows = []
+    for layer, cue_indices, spans in touched:
+        layer_cues = [cues[index] for index in cue_indices]
+        changed_start = max(0, min(signature.start for signature in spans))
+        settle_frame = min(total_frames - 1, max(signature.end for signature in spans))
+        first_frame = _earliest_settled_frame(layer_cues, changed_start)
+        resume = nearest_checkpoint(previous_checkpoints, changed_start)
+        if resume is not None and resume.frame > first_frame:
+            first_frame = resume.frame
+        else:
+            resume = None
+
+        universe = bytearray(previous.frame_view(first_frame - 1)) if first_frame > 0 else bytearray(base_universe)
+        captured: List[CanvasCheckpoint] = []
+        last_frame = render_cue_frames(
+            canvas=canvas,
+            fixtures=fixtures,
+            cues=layer_cues,
+            fps=fps,
+            universe=universe,
+            first_frame=first_frame,
+            resume=resume,
+            previous=previous,
+            settle_frame=settle_frame,
+            checkpoint_at=capture_frames,
+            checkpoints=captured,
+            cue_indices=cue_indices,
+            channels=layer.channels,
+            profile=profile,
+        )
+        windows.append((first_frame, last_frame))
+        swap_layer_checkpoints(checkpoint_active, captured, set(cue_indices), last_frame)
+
+    canvas.checkpoints = [
+        CanvasCheckpoint(frame=frame, active=tuple(sorted(active, key=lambda item: item[0])))
+        for frame, active in sorted(checkpoint_active.items())
+    ]
+    canvas.cue_signatures = signatures
+    return canvas, (min(first for first, _last in windows), max(last for _first, last in windows))
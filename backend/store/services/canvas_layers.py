@@ -0,0 +1,99 @@
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence, Tuple
+
+from models.fixtures.fixture import Fixture
+from store.dmx_canvas import DMX_CHANNELS
+from store.services.canvas_dependencies import CueRenderSignature
+
+
+@dataclass(frozen=True)
+class FixtureLayer:
+    """Fixtures that render into a shared set of canvas channel columns.
+
+    Effects only read and write their own fixture's channels, so a layer renders exactly
+    the same bytes on its own as it does inside the full rig. Fixtures whose channels
+    overlap are kept in one layer.
+    """
+
+    fixture_ids: Tuple[str, ...]
+    channels: Tuple[int, ...]  # 0-based frame offsets
+
+
+def _fixture_channel_offsets(fixture: Fixture) -> set[int]:
+    offsets = (fixture._frame_offset(name) for name in fixture.channels)
+    return {offset for offset in offsets if offset is not None}
+
+
+def build_fixture_layers(fixtures: Sequence[Fixture]) -> List[FixtureLayer]:
+    groups: List[Tuple[List[str], set[int]]] = []
+    for fixture in fixtures:
+        fixture_ids = [fixture.id]
+        channels = _fixture_channel_offsets(fixture)
+        remaining = []
+        for group_ids, group_channels in groups:
+            if group_channels & channels:
+                fixture_ids = group_ids + fixture_ids
+                channels |= group_channels
+            else:
+                remaining.append((group_ids, group_channels))
+        groups = remaining + [(fixture_ids, channels)]
+    return [FixtureLayer(fixture_ids=tuple(ids), channels=tuple(sorted(channels))) for ids, channels in groups]
+
+
+def split_cue_indices_by_layer(cues: Sequence[Tuple[int, int, Any]], layers: Sequence[FixtureLayer]) -> List[List[int]]:
+    """Cue list indices per layer, in cue order. Cues for unknown fixtures render nothing and are dropped."""
+    layer_by_fixture: Dict[str, int] = {}
+    for layer_index, layer in enumerate(layers):
+        for fixture_id in layer.fixture_ids:
+            layer_by_fixture[fixture_id] = layer_index
+    indices: List[List[int]] = [[] for _ in layers]
+    for cue_index, (_start, _end, entry) in enumerate(cues):
+        layer_index = layer_by_fixture.get(entry.fixture_id or "")
+        if layer_index is not None:
+            indices[layer_index].append(cue_index)
+    return indices
+
+
+def touched_layers(
+    fixtures: List[Fixture],
+    cues: Sequence[Tuple[int, int, Any]],
+    signatures: List[CueRenderSignature],
+    previous_signatures: List[CueRenderSignature],
+    total_frames: int,
+) -> List[Tuple[FixtureLayer, List[int], List[CueRenderSignature]]]:
+    """(layer, its cue indices, its changed cue signatures) for every layer a cue change touches."""
+    changed = (Counter(signatures) - Counter(previous_signatures)) + (Counter(previous_signatures) - Counter(signatures))
+    changed_by_fixture: Dict[str, List[CueRenderSignature]] = {}
+    for signature in changed:
+        if signature.end >= 0 and signature.start < total_frames:
+            changed_by_fixture.setdefault(signature.fixture_id, []).append(signature)
+
+    layers = build_fixture_layers(fixtures)
+    layer_cue_indices = split_cue_indices_by_layer(cues, layers)
+    touched = [
+        (layer, cue_indices, [signature for fixture_id in layer.fixture_ids for signature in changed_by_fixture.get(fixture_id, [])])
+        for layer, cue_indices in zip(layers, layer_cue_indices)
+    ]
+    return [(layer, cue_indices, spans) for layer, cue_indices, spans in touched if spans]
+
+
+def channel_runs(channels: Sequence[int]) -> List[Tuple[int, int]]:
+    """Collapse sorted channel offsets into half-open contiguous (low, high) runs."""
+    runs: List[Tuple[int, int]] = []
+    for channel in sorted(channels):
+        if runs and runs[-1][1] == channel:
+            runs[-1] = (runs[-1][0], channel + 1)
+        else:
+            runs.append((channel, channel + 1))
+    return runs
+
+
+def read_channel_column(buffer: Any, channel: int, first_frame: int, last_frame: int, frame_size: int = DMX_CHANNELS) -> bytes:
+    """One channel's values over an inclusive frame range of a flat buffer of frame_size-byte frames."""
+    return bytes(buffer[first_frame * frame_size + channel : (last_frame + 1) * frame_size : frame_size])
+
+
+def write_channel_column(buffer: Any, channel: int, first_frame: int, values: bytes, frame_size: int = DMX_CHANNELS) -> None:
+    start = first_frame * frame_size + channel
+    buffer[start : start + len(values) * frame_size : frame_size] = values
@@ -0,0 +1,129 @@
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+from typing import Any, Callable, Dict, Iterable, List
+
+from models.chasers import ChaserDefinition
+from models.cues import CueSheet
+from models.fixtures.fixture import Fixture
+from store.dmx_canvas import DMX_CHANNELS, DMXCanvas, rig_universe_count
+from store.pois import PoiStore
+from store.services.canvas_checkpoints import checkpoint_frames, merge_layer_checkpoints
+from store.services.canvas_dependencies import cue_render_signature, poi_scope, snapshot_poi_db
+from store.services.canvas_frames import canvas_total_frames, render_cue_frames
+from store.services.canvas_layers import build_fixture_layers, read_channel_column, split_cue_indices_by_layer, write_channel_column
+from store.services.canvas_render_core import iter_cues_for_render
+from store.services.canvas_rendering import render_cue_sheet_to_canvas
+
+
+def _render_layer(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Worker entry point: render one fixture layer and return its channel columns."""
+    canvas = DMXCanvas.allocate(fps=task["fps"], total_frames=task["total_frames"], universe_count=task["universe_count"])
+    with poi_scope(snapshot_poi_db(task["pois"])):
+        render_cue_frames(
+            canvas=canvas,
+            fixtures=task["fixtures"],
+            cues=task["cues"],
+            fps=task["fps"],
+            universe=bytearray(task["base_universe"]),
+            checkpoint_at=task["checkpoint_at"],
+            cue_indices=task["cue_indices"],
+        )
+
+    last_frame = canvas.total_frames - 1
+    return {
+        "columns": {
+            channel: read_channel_column(canvas.buffer, channel, 0, last_frame, canvas.frame_size) for channel in task["channels"]
+        },
+        "checkpoints": canvas.checkpoints,
+    }
+
+
+def render_cue_sheet_to_canvas_parallel(
+    *,
+    fixtures: List[Fixture],
+    cue_sheet: CueSheet | None,
+    chasers: List[ChaserDefinition],
+    bpm: float,
+    song_length_seconds: float,
+    fps: int,
+    apply_arm: Callable[[bytearray], None],
+    checkpoint_seconds: Iterable[float] = (),
+    pois: List[Dict[str, Any]] | None = None,
+    max_workers: int,
+) -> DMXCanvas:
+    """Render the cue sheet with fixture layers spread over a process pool.
+
+    Each layer owns disjoint channel columns and carries its own universe and effect state,
+    so layers are independent and their columns stitch into a canvas byte-identical to the
+    serial renderer, checkpoints included. Falls back to the serial renderer when there is
+    nothing to split. Workers, cue expansion and cue signatures all read one POI list:
+    pois when given, else a copy of the live POI store.
+    """
+    checkpoint_seconds = list(checkpoint_seconds)
+    serial_kwargs = {
+        "fixtures": fixtures,
+        "cue_sheet": cue_sheet,
+        "chasers": chasers,
+        "bpm": bpm,
+        "song_length_seconds": song_length_seconds,
+        "fps": fps,
+        "apply_arm": apply_arm,
+        "checkpoint_seconds": checkpoint_seconds,
+        "pois": pois,
+    }
+    layers = build_fixture_layers(fixtures)
+    if max_workers <= 1 or len(layers) <= 1:
+        return render_cue_sheet_to_canvas(**serial_kwargs)
+
+    total_frames = canvas_total_frames(song_length_seconds, fps)
+    universe_count = rig_universe_count(fixtures)
+    base_universe = bytearray(DMX_CHANNELS * universe_count)
+    apply_arm(base_universe)
+    if pois is None:
+        poi_db = PoiStore.get_instance()
+        pois = deepcopy(poi_db.pois) if poi_db else None
+    with poi_scope(snapshot_poi_db(pois)):
+        cues = iter_cues_for_render(cue_sheet, fixtures, fps, chasers, bpm)
+        signatures = [cue_render_signature(start, end, entry) for start, end, entry in cues]
+    capture_frames = checkpoint_frames(total_frames=total_frames, fps=fps, boundary_seconds=checkpoint_seconds)
+
+    fixture_map = {fixture.id: fixture for fixture in fixtures}
+    tasks = []
+    for layer, cue_indices in zip(layers, split_cue_indices_by_layer(cues, layers)):
+        if not cue_indices:
+            continue
+        tasks.append(
+            {
+                "fixtures": [fixture_map[fixture_id] for fixture_id in layer.fixture_ids],
+                "channels": layer.channels,
+                "cues": [cues[index] for index in cue_indices],
+                "cue_indices": cue_indices,
+                "fps": fps,
+                "total_frames": total_frames,
+                "universe_count": universe_count,
+                "base_universe": bytes(base_universe),
+                "checkpoint_at": capture_frames,
+                "pois": pois,
+            }
+        )
+    if len(tasks) <= 1:
+        return render_cue_sheet_to_canvas(**serial_kwargs)
+
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+        results = list(executor.map(_render_layer, tasks))
+
+    # Channels outside every rendered layer keep the armed base universe for the whole song.
+    canvas = DMXCanvas(
+        fps=fps,
+        total_frames=total_frames,
+        buffer=bytearray(bytes(base_universe) * total_frames),
+        universe_count=universe_count,
+    )
+    for result in results:
+        for channel, column in result["columns"].items():
+            write_channel_column(canvas.buffer, channel, 0, column, canvas.frame_size)
+
+    canvas.base_universe = bytes(base_universe)
+    canvas.cue_signatures = signatures
+    canvas.checkpoints = merge_layer_checkpoints(capture_frames, [result["checkpoints"] for result in results])
+    return canvas
@@ -0,0 +1,128 @@
+from typing import Any
+
+from models.cues import CueEntry
+from models.fixtures.fixture import Fixture
+from models.fixtures.moving_heads.orbit_helpers import orbit_writes_dimmer
+from models.fixtures.moving_heads.poi_geometry import estimate_circle_pan_tilt
+from models.fixtures.moving_heads.travel_helpers import EFFECT_SAFETY_PREROLL_SECONDS, EFFECT_SETTLE_SECONDS, fixture_travel_profile_seconds
+
+
+def fixture_axis_position(fixture: Fixture) -> tuple[int, int] | None:
+    current_values = fixture.current_values or {}
+    pan = current_values.get("pan")
+    tilt = current_values.get("tilt")
+    if pan is None or tilt is None:
+        if hasattr(fixture, "_has_axis_16bit") and fixture._has_axis_16bit("pan") and fixture._has_axis_16bit("tilt"):
+            return 0, 0
+        return None
+    try:
+        return int(pan), int(tilt)
+    except (TypeError, ValueError):
+        return None
+
+
+def _estimate_sweep_end_position(fixture: Fixture, data: dict[str, Any]) -> tuple[int, int] | None:
+    subject_poi = str(data.get("subject_POI") or "").strip()
+    start_poi = str(data.get("start_POI") or "").strip()
+    if not subject_poi or not start_poi:
+        return None
+
+    subject_pan, subject_tilt = fixture._resolve_poi_pan_tilt_u16(subject_poi)
+    start_pan, start_tilt = fixture._resolve_poi_pan_tilt_u16(start_poi)
+    if subject_pan is None or subject_tilt is None or start_pan is None or start_tilt is None:
+        return None
+
+    end_poi = str(data.get("end_POI") or "").strip()
+    if end_poi:
+        end_pan, end_tilt = fixture._resolve_poi_pan_tilt_u16(end_poi)
+        if end_pan is not None and end_tilt is not None:
+            return int(end_pan), int(end_tilt)
+
+    return (
+        fixture._clamp_u16((2 * int(subject_pan)) - int(start_pan)),
+        fixture._clamp_u16((2 * int(subject_tilt)) - int(start_tilt)),
+    )
+
+
+def _estimate_orbit_end_position(fixture: Fixture, data: dict[str, Any]) -> tuple[int, int] | None:
+    subject_poi = str(data.get("subject_POI") or "").strip()
+    start_poi = str(data.get("start_POI") or "").strip()
+    if not subject_poi or not start_poi:
+        return None
+
+    subject_pan, subject_tilt = fixture._resolve_poi_pan_tilt_u16(subject_poi)
+    if subject_pan is None or subject_tilt is None:
+        return None
+    return int(subject_pan), int(subject_tilt)
+
+
+def _estimate_circle_end_position(fixture: Fixture, data: dict[str, Any]) -> tuple[int, int] | None:
+    pan_u16, tilt_u16 = estimate_circle_pan_tilt(fixture, data, 1.0)
+    if pan_u16 is None or tilt_u16 is None:
+        return None
+    return int(pan_u16), int(tilt_u16)
+
+
+def estimate_entry_end_position(fixture: Fixture, entry: CueEntry) -> tuple[int, int] | None:
+    data = entry.data or {}
+    effect = str(entry.effect or "").strip().lower()
+    if effect == "move_to":
+        target = fixture._parse_pan_tilt_targets_u16(data)
+        if target[0] is None or target[1] is None:
+            return None
+        return int(target[0]), int(target[1])
+    if effect == "circle":
+        return _estimate_circle_end_position(fixture, data)
+    if effect == "orbit":
+        return _estimate_orbit_end_position(fixture, data)
+    if effect == "orbit_out":
+        start_poi = str(data.get("start_POI") or "").strip()
+        if not start_poi:
+            return None
+        start_pan, start_tilt = fixture._resolve_poi_pan_tilt_u16(start_poi)
+        if start_pan is None or start_tilt is None:
+            return None
+        return int(start_pan), int(start_tilt)
+    if effect == "move_to_poi":
+        target_poi = str(data.get("target_POI") or data.get("poi") or data.get("POI") or "").strip()
+        if not target_poi:
+            return None
+        target_pan, target_tilt = fixture._resolve_poi_pan_tilt_u16(target_poi)
+        if target_pan is None or target_tilt is None:
+            return None
+        return int(target_pan), int(target_tilt)
+    if effect == "sweep":
+        return _estimate_sweep_end_position(fixture, data)
+    return None
+
+
+def _travel_preroll_seconds(fixture: Fixture, poi_id: str, last_position: tuple[int, int] | None) -> float:
+    """Seconds to travel from last_position to a POI, plus the safety preroll and settle time."""
+    if not poi_id or last_position is None:
+        return 0.0
+
+    target_pan, target_tilt = fixture._resolve_poi_pan_tilt_u16(poi_id)
+    if target_pan is None or target_tilt is None:
+        return 0.0
+
+    last_pan, last_tilt = last_position
+    pan_full_travel_seconds, tilt_full_travel_seconds = fixture_travel_profile_seconds(fixture)
+    pan_seconds = (abs(int(target_pan) - int(last_pan)) / 65535.0) * pan_full_travel_seconds
+    tilt_seconds = (abs(int(target_tilt) - int(last_tilt)) / 65535.0) * tilt_full_travel_seconds
+    return max(0.0, pan_seconds, tilt_seconds) + EFFECT_SAFETY_PREROLL_SECONDS + EFFECT_SETTLE_SECONDS
+
+
+def estimate_sweep_preroll_seconds(fixture: Fixture, data: dict[str, Any], last_position: tuple[int, int] | None) -> float:
+    return _travel_preroll_seconds(fixture, str(data.get("start_POI") or "").strip(), last_position)
+
+
+def estimate_orbit_preroll_seconds(fixture: Fixture, data: dict[str, Any], last_position: tuple[int, int] | None) -> float:
+    if not orbit_writes_dimmer(data):
+        return 0.0
+    return _travel_preroll_seconds(fixture, str(data.get("start_POI") or "").strip(), last_position)
+
+
+def estimate_orbit_out_preroll_seconds(fixture: Fixture, data: dict[str, Any], last_position: tuple[int, int] | None) -> float:
+    if not orbit_writes_dimmer(data):
+        return 0.0
+    return _travel_preroll_seconds(fixture, str(data.get("subject_POI") or "").strip(), last_position)
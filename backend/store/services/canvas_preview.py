@@ -0,0 +1,68 @@
+import math
+from typing import Any, Dict
+
+from models.fixtures.fixture import Fixture
+from store.dmx_canvas import DMX_CHANNELS, DMXCanvas
+from store.services.canvas_frames import write_span
+from store.services.canvas_preroll import estimate_orbit_preroll_seconds, estimate_sweep_preroll_seconds
+
+
+def render_preview_canvas(
+    *,
+    fixture: Fixture,
+    effect: str,
+    duration: float,
+    data: Dict[str, Any],
+    base_universe: bytearray,
+    fps: int,
+) -> DMXCanvas:
+    preview_data = dict(data or {})
+    preroll_frames = 0
+    if effect in {"sweep", "orbit"}:
+        last_position = None
+        if hasattr(fixture, "_read_axis_u16_from_universe"):
+            last_pan = fixture._read_axis_u16_from_universe(base_universe, "pan")
+            last_tilt = fixture._read_axis_u16_from_universe(base_universe, "tilt")
+            if last_pan is not None and last_tilt is not None:
+                last_position = (int(last_pan), int(last_tilt))
+        preroll_seconds = estimate_sweep_preroll_seconds(fixture, preview_data, last_position) if effect == "sweep" else estimate_orbit_preroll_seconds(fixture, preview_data, last_position)
+        preroll_frames = max(0, int(round(preroll_seconds * fps)))
+        if preroll_frames > 0:
+            preview_data["__sweep_preroll_frames" if effect == "sweep" else "__orbit_preroll_frames"] = preroll_frames
+
+    visible_frames = max(1, int(math.ceil(float(duration) * fps)) + 1)
+    total_frames = preroll_frames + visible_frames
+    canvas = DMXCanvas.allocate(fps=fps, total_frames=total_frames, universe_count=len(base_universe) // DMX_CHANNELS)
+    universe = bytearray(base_universe)
+    render_state: Dict[str, Any] = {}
+
+    end_frame = total_frames - 1
+    columns = fixture.render_effect_span(
+        universe,
+        effect=effect,
+        first_frame=0,
+        last_frame=end_frame,
+        start_frame=0,
+        end_frame=end_frame,
+        fps=fps,
+        data=preview_data,
+        render_state=render_state,
+    )
+    if columns is not None:
+        write_span(canvas, universe, [(0, canvas.frame_size)], 0, end_frame, columns)
+        return canvas
+
+    for frame_index in range(total_frames):
+        fixture.render_effect(
+            universe,
+            effect=effect,
+            frame_index=frame_index,
+            start_frame=0,
+            end_frame=end_frame,
+            fps=fps,
+            data=preview_data,
+            render_state=render_state,
+        )
+        canvas.set_frame(frame_index, universe)
+
+    return canvas
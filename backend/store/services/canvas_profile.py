@@ -0,0 +1,57 @@
+from typing import Any, Dict, List, Tuple
+
+# Cue sources recorded by iter_cues_for_render(sources=...).
+CUE_SOURCE_USER = "user"
+CUE_SOURCE_CHASER = "chaser"
+CUE_SOURCE_DYNAMIC = "dynamic"
+
+
+class RenderProfile:
+    """Opt-in render timing: call counts, cumulative seconds and frames per bucket.
+
+    Buckets are (effect, fixture type) and cue source (user cue, static chaser expansion,
+    dynamic chaser generator). `sources` maps id(render entry) -> source and is filled by
+    iter_cues_for_render; entries missing from it count as user cues.
+    """
+
+    def __init__(self) -> None:
+        self.sources: Dict[int, str] = {}
+        self.by_effect: Dict[Tuple[str, str], List[float]] = {}
+        self.by_source: Dict[str, List[float]] = {}
+
+    def record(self, op: Any, seconds: float, frames: int) -> None:
+        """Add one render call of a RenderOp covering `frames` frames."""
+        source = self.sources.get(id(op.entry), CUE_SOURCE_USER)
+        for bucket in (
+            self.by_effect.setdefault((op.effect, op.fixture.type), [0, 0.0, 0]),
+            self.by_source.setdefault(source, [0, 0.0, 0]),
+        ):
+            bucket[0] += 1
+            bucket[1] += seconds
+            bucket[2] += frames
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(bucket[1] for bucket in self.by_source.values())
+
+    def summary(self) -> Dict[str, Any]:
+        """JSON-ready totals, slowest buckets first."""
+
+        def row(bucket: List[float]) -> Dict[str, Any]:
+            return {"calls": int(bucket[0]), "seconds": round(bucket[1], 4), "frames": int(bucket[2])}
+
+        effects = sorted(self.by_effect.items(), key=lambda item: item[1][1], reverse=True)
+        sources = sorted(self.by_source.items(), key=lambda item: item[1][1], reverse=True)
+        return {
+            "total_seconds": round(self.total_seconds, 4),
+            "effects": [{"effect": effect, "fixture_type": fixture_type, **row(bucket)} for (effect, fixture_type), bucket in effects],
+            "sources": [{"source": source, **row(bucket)} for source, bucket in sources],
+        }
+
+    def log_label(self, top: int = 3) -> str:
+        """Short `profile=...` suffix for the [DMX CANVAS] log lines."""
+        effects = sorted(self.by_effect.items(), key=lambda item: item[1][1], reverse=True)[:top]
+        sources = sorted(self.by_source.items(), key=lambda item: item[1][1], reverse=True)
+        effect_label = ",".join(f"{effect}/{fixture_type}:{bucket[1]:.2f}s" for (effect, fixture_type), bucket in effects)
+        source_label = ",".join(f"{source}:{bucket[1]:.2f}s" for source, bucket in sources)
+        return f"profile={self.total_seconds:.2f}s effects=[{effect_label}] sources=[{source_label}]"
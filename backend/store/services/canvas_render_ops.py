@@ -0,0 +1,106 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from models.cues import CueEntry
+from models.fixtures.fixture import Fixture
+from services.dynamic_chasers import PARAMETRIC_EFFECTS
+
+
+@dataclass(frozen=True)
+class RenderOp:
+    """One render cue with everything the frame loop needs resolved up front.
+
+    The fixture, the registry handler (None means the fixture's own fallback effects),
+    the normalized effect id and the 0-based frame offsets of the fixture's channels
+    are looked up once per render instead of once per frame.
+    """
+
+    start: int
+    end: int
+    entry: CueEntry
+    fixture: Fixture
+    effect: str
+    handler: Any
+    data: Dict[str, Any]
+    offsets: Dict[str, int]  # channel name -> 0-based frame offset
+
+    def render(self, universe: bytearray, frame_index: int, render_state: Dict[str, Any], fps: int) -> None:
+        if self.handler is not None:
+            self.handler.render(
+                self.fixture,
+                universe,
+                frame_index=frame_index,
+                start_frame=self.start,
+                end_frame=self.end,
+                fps=fps,
+                data=self.data,
+                render_state=render_state,
+            )
+            return
+        self.fixture._fallback_render_effect(
+            universe,
+            effect=self.effect,
+            frame_index=frame_index,
+            start_frame=self.start,
+            end_frame=self.end,
+            fps=fps,
+            data=self.data,
+            render_state=render_state,
+        )
+
+    def render_span(
+        self,
+        universe: bytearray,
+        first_frame: int,
+        last_frame: int,
+        render_state: Dict[str, Any],
+        fps: int,
+    ) -> Optional[Dict[int, bytes]]:
+        """Span kernel output keyed by universe offset, or None to render frame by frame."""
+        if self.handler is None:
+            return None
+        columns = self.handler.render_span(
+            self.fixture,
+            universe,
+            first_frame=first_frame,
+            last_frame=last_frame,
+            start_frame=self.start,
+            end_frame=self.end,
+            fps=fps,
+            data=self.data,
+            render_state=render_state,
+        )
+        return None if columns is None else self.fixture._span_columns_by_offset(columns, self.offsets)
+
+
+def compile_render_ops(cues: List[Tuple[int, int, CueEntry]], fixtures: List[Fixture]) -> Dict[int, RenderOp]:
+    """Compile render cues into RenderOps keyed by id(entry); cues for unknown fixtures are dropped."""
+    fixture_map: Dict[str, Fixture] = {}
+    for fixture in fixtures:
+        fixture_map.setdefault(fixture.id, fixture)
+    offsets_by_fixture: Dict[str, Dict[str, int]] = {}
+    handlers: Dict[Tuple[str, str], Any] = {}
+    ops: Dict[int, RenderOp] = {}
+    for start, end, entry in cues:
+        fixture = fixture_map.get(entry.fixture_id)
+        if fixture is None:
+            continue
+        effect = (entry.effect or "").lower().strip()
+        handler_key = (fixture.id, effect)
+        if handler_key not in handlers:
+            handlers[handler_key] = PARAMETRIC_EFFECTS.get(effect) or fixture.resolve_effect_handler(effect)
+        offsets = offsets_by_fixture.get(fixture.id)
+        if offsets is None:
+            offsets = {name: offset for name in fixture.channels if (offset := fixture._frame_offset(name)) is not None}
+            offsets_by_fixture[fixture.id] = offsets
+        ops[id(entry)] = RenderOp(
+            start=start,
+            end=end,
+            entry=entry,
+            fixture=fixture,
+            effect=effect,
+            handler=handlers[handler_key],
+            data=entry.data or {},
+            offsets=offsets,
+        )
+    return ops
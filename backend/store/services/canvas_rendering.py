@@ -1,12 +1,11 @@
-import math
-from typing import Any, Callable, Dict, List, Tuple
+from typing import Any, Callable, Dict, Iterable, List
 
 from models.chasers import ChaserDefinition
-from models.cues import CueEntry, CueSheet
+from models.cues import CueSheet
 from models.fixtures.fixture import Fixture
-from store.dmx_canvas import DMX_CHANNELS, DMXCanvas
-from store.services.canvas_debug import dump_canvas_debug
-from store.services.canvas_render_core import estimate_orbit_preroll_seconds, estimate_sweep_preroll_seconds, iter_cues_for_render, render_entry_into_universe
+from store.dmx_canvas import DMXCanvas
+from store.services.canvas_profile import RenderProfile
+from store.services.canvas_streaming import StreamingCanvasRender
 
 
 def render_cue_sheet_to_canvas(
@@ -18,89 +17,27 @@ def render_cue_sheet_to_canvas(
     song_length_seconds: float,
     fps: int,
     apply_arm: Callable[[bytearray], None],
+    checkpoint_seconds: Iterable[float] = (),
+    profile: RenderProfile | None = None,
+    pois: List[Dict[str, Any]] | None = None,
 ) -> DMXCanvas:
-    total_frames = max(1, int(math.ceil(song_length_seconds * fps)) + 1)
-    canvas = DMXCanvas.allocate(fps=fps, total_frames=total_frames)
-
-    base_universe = bytearray(DMX_CHANNELS)
-    apply_arm(base_universe)
-
-    cues = iter_cues_for_render(cue_sheet, fixtures, fps, chasers, bpm)
-    cues_by_start: Dict[int, List[Tuple[int, int, CueEntry]]] = {}
-    for start, end, entry in cues:
-        cues_by_start.setdefault(start, []).append((start, end, entry))
-
-    active: List[Tuple[int, int, CueEntry]] = []
-    universe = bytearray(base_universe)
-    entry_render_state: Dict[int, Dict[str, Any]] = {}
-
-    for frame_index in range(total_frames):
-        if frame_index in cues_by_start:
-            active.extend(cues_by_start[frame_index])
-
-        if active:
-            active = [(start, end, entry) for (start, end, entry) in active if end >= frame_index]
-
-        if active:
-            active_sorted = sorted(active, key=lambda item: (item[2].time, item[2].fixture_id or "", item[2].effect or ""))
-            for start_frame, end_frame, entry in active_sorted:
-                render_entry_into_universe(
-                    fixtures=fixtures,
-                    universe=universe,
-                    frame_index=frame_index,
-                    start_frame=start_frame,
-                    end_frame=end_frame,
-                    entry=entry,
-                    entry_render_state=entry_render_state,
-                    fps=fps,
-                )
-
-        canvas.set_frame(frame_index, universe)
-
-    return canvas
-
-
-def render_preview_canvas(
-    *,
-    fixture: Fixture,
-    effect: str,
-    duration: float,
-    data: Dict[str, Any],
-    base_universe: bytearray,
-    fps: int,
-) -> DMXCanvas:
-    preview_data = dict(data or {})
-    preroll_frames = 0
-    if effect in {"sweep", "orbit"}:
-        last_position = None
-        if hasattr(fixture, "_read_axis_u16_from_universe"):
-            last_pan = fixture._read_axis_u16_from_universe(base_universe, "pan")
-            last_tilt = fixture._read_axis_u16_from_universe(base_universe, "tilt")
-            if last_pan is not None and last_tilt is not None:
-                last_position = (int(last_pan), int(last_tilt))
-        preroll_seconds = estimate_sweep_preroll_seconds(fixture, preview_data, last_position) if effect == "sweep" else estimate_orbit_preroll_seconds(fixture, preview_data, last_position)
-        preroll_frames = max(0, int(round(preroll_seconds * fps)))
-        if preroll_frames > 0:
-            preview_data["__sweep_preroll_frames" if effect == "sweep" else "__orbit_preroll_frames"] = preroll_frames
-
-    visible_frames = max(1, int(math.ceil(float(duration) * fps)) + 1)
-    total_frames = preroll_frames + visible_frames
-    canvas = DMXCanvas.allocate(fps=fps, total_frames=total_frames)
-    universe = bytearray(base_universe)
-    render_state: Dict[str, Any] = {}
-
-    end_frame = total_frames - 1
-    for frame_index in range(total_frames):
-        fixture.render_effect(
-            universe,
-            effect=effect,
-            frame_index=frame_index,
-            start_frame=0,
-            end_frame=end_frame,
-            fps=fps,
-            data=preview_data,
-            render_state=render_state,
-        )
-        canvas.set_frame(frame_index, universe)
-
-    return canvas
+    """Render the full cue sheet one fixture layer at a time.
+
+    Layers own disjoint channel columns, so each renders on its own with the span fast
+    paths; channels outside every rendered layer keep the armed base universe. With pois,
+    POI lookups read that snapshot instead of the live POI store.
+    """
+    stream = StreamingCanvasRender(
+        fixtures=fixtures,
+        cue_sheet=cue_sheet,
+        chasers=chasers,
+        bpm=bpm,
+        song_length_seconds=song_length_seconds,
+        fps=fps,
+        apply_arm=apply_arm,
+        checkpoint_seconds=checkpoint_seconds,
+        profile=profile,
+        pois=pois,
+    )
+    stream.render_through(stream.canvas.total_frames - 1)
+    return stream.canvas
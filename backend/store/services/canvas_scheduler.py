@@ -0,0 +1,72 @@
+import heapq
+from bisect import insort
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from models.cues import CueEntry
+
+
+RenderCue = Tuple[int, int, CueEntry]
+
+
+def _render_order(entry: CueEntry) -> Tuple[float, str, str]:
+    return (entry.time, entry.fixture_id or "", entry.effect or "")
+
+
+class ActiveCueScheduler:
+    """Event-driven set of running cues for a frame-ordered render walk.
+
+    Cues join at their start frame and leave after their end frame. The running set is
+    kept in render order ((time, fixture_id, effect), ties in join order), so it is only
+    touched at cue boundaries instead of being filtered and re-sorted every frame.
+    """
+
+    def __init__(self, cues: Iterable[RenderCue], *, first_frame: int = 0, running: Sequence[RenderCue] = ()):
+        self._starts: Dict[int, List[RenderCue]] = {}
+        for cue in cues:
+            if cue[0] >= first_frame:
+                self._starts.setdefault(cue[0], []).append(cue)
+        # A sorted list is already a valid min-heap.
+        self._start_frames = sorted(self._starts)
+        self._ends: List[int] = []
+        self._running: List[Tuple[Tuple[float, str, str], int, RenderCue]] = []
+        self._joined = 0
+        self._active: List[RenderCue] = []
+        for cue in running:
+            self._join(cue)
+        self._active = [cue for _key, _order, cue in self._running]
+
+    def _join(self, cue: RenderCue) -> None:
+        insort(self._running, (_render_order(cue[2]), self._joined, cue), key=lambda item: (item[0], item[1]))
+        heapq.heappush(self._ends, cue[1])
+        self._joined += 1
+
+    @property
+    def active(self) -> List[RenderCue]:
+        """Running cues in render order. The list is replaced, never mutated, when the set changes."""
+        return self._active
+
+    def advance(self, frame_index: int) -> bool:
+        """Apply the start and end events due at frame_index; True when the running set changed."""
+        changed = False
+        while self._start_frames and self._start_frames[0] <= frame_index:
+            start_frame = heapq.heappop(self._start_frames)
+            for cue in self._starts.pop(start_frame):
+                self._join(cue)
+            changed = True
+        if self._ends and self._ends[0] < frame_index:
+            while self._ends and self._ends[0] < frame_index:
+                heapq.heappop(self._ends)
+            self._running = [item for item in self._running if item[2][1] >= frame_index]
+            changed = True
+        if changed:
+            self._active = [cue for _key, _order, cue in self._running]
+        return changed
+
+    def next_change(self) -> int | None:
+        """First frame after the current one at which the running set can change."""
+        candidates = []
+        if self._start_frames:
+            candidates.append(self._start_frames[0])
+        if self._ends:
+            candidates.append(self._ends[0] + 1)
+        return min(candidates) if candidates else None
@@ -0,0 +1,111 @@
+from typing import Any, Callable, Dict, Iterable, List
+
+from models.chasers import ChaserDefinition
+from models.cues import CueSheet
+from models.fixtures.fixture import Fixture
+from store.dmx_canvas import DMX_CHANNELS, DMXCanvas, rig_universe_count
+from store.services.canvas_checkpoints import CanvasCheckpoint, checkpoint_frames, merge_layer_checkpoints
+from store.services.canvas_dependencies import cue_render_signature, poi_scope, snapshot_poi_db
+from store.services.canvas_frames import canvas_total_frames, render_cue_frames
+from store.services.canvas_layers import build_fixture_layers, split_cue_indices_by_layer
+from store.services.canvas_profile import RenderProfile
+from store.services.canvas_render_core import iter_cues_for_render
+
+
+class StreamingCanvasRender:
+    """Song canvas rendered front to back in chunks, with a watermark of finished frames.
+
+    Every chunk renders each fixture layer from its resume checkpoint through the chunk's
+    last frame and captures a checkpoint at the next frame to continue from, so the frames
+    are byte-identical to a single full render. `valid_through` is the last frame every
+    layer has written; later frames still hold the armed base universe.
+    """
+
+    def __init__(
+        self,
+        *,
+        fixtures: List[Fixture],
+        cue_sheet: CueSheet | None,
+        chasers: List[ChaserDefinition],
+        bpm: float,
+        song_length_seconds: float,
+        fps: int,
+        apply_arm: Callable[[bytearray], None],
+        checkpoint_seconds: Iterable[float] = (),
+        profile: RenderProfile | None = None,
+        pois: List[Dict[str, Any]] | None = None,
+    ):
+        total_frames = canvas_total_frames(song_length_seconds, fps)
+        universe_count = rig_universe_count(fixtures)
+        base_universe = bytearray(DMX_CHANNELS * universe_count)
+        apply_arm(base_universe)
+        self.fixtures = fixtures
+        self.fps = fps
+        self.base_universe = bytes(base_universe)
+        self.canvas = DMXCanvas(
+            fps=fps,
+            total_frames=total_frames,
+            buffer=bytearray(self.base_universe * total_frames),
+            universe_count=universe_count,
+        )
+        self.profile = profile
+        self._poi_db = snapshot_poi_db(pois)
+        with poi_scope(self._poi_db):
+            self.cues = iter_cues_for_render(cue_sheet, fixtures, fps, chasers, bpm, profile.sources if profile else None)
+            # Taken with the POIs the frames render from, so a POI edit made meanwhile still shows as a change.
+            self.cue_signatures = [cue_render_signature(start, end, entry) for start, end, entry in self.cues]
+        self.capture_frames = checkpoint_frames(total_frames=total_frames, fps=fps, boundary_seconds=checkpoint_seconds)
+        layers = build_fixture_layers(fixtures)
+        self._layers = [
+            (layer, cue_indices, [self.cues[index] for index in cue_indices])
+            for layer, cue_indices in zip(layers, split_cue_indices_by_layer(self.cues, layers))
+            if cue_indices
+        ]
+        self._resume: List[CanvasCheckpoint | None] = [None] * len(self._layers)
+        self._layer_checkpoints: List[List[CanvasCheckpoint]] = [[] for _layer in self._layers]
+        self.valid_through = -1
+
+    @property
+    def done(self) -> bool:
+        return self.valid_through >= self.canvas.total_frames - 1
+
+    def render_through(self, frame_index: int) -> int:
+        """Render every layer up to frame_index (clamped to the canvas) and return the new watermark."""
+        first_frame = self.valid_through + 1
+        last_frame = min(int(frame_index), self.canvas.total_frames - 1)
+        if last_frame < first_frame:
+            return self.valid_through
+
+        resume_frame = last_frame + 1
+        capture_at = [frame for frame in self.capture_frames if first_frame <= frame <= last_frame]
+        if resume_frame < self.canvas.total_frames:
+            capture_at.append(resume_frame)
+        with poi_scope(self._poi_db):
+            for position, (layer, cue_indices, layer_cues) in enumerate(self._layers):
+                universe = bytearray(self.canvas.frame_view(first_frame - 1)) if first_frame > 0 else bytearray(self.base_universe)
+                captured: List[CanvasCheckpoint] = []
+                render_cue_frames(
+                    canvas=self.canvas,
+                    fixtures=self.fixtures,
+                    cues=layer_cues,
+                    fps=self.fps,
+                    universe=universe,
+                    first_frame=first_frame,
+                    resume=self._resume[position],
+                    checkpoint_at=capture_at,
+                    checkpoints=captured,
+                    cue_indices=cue_indices,
+                    channels=layer.channels,
+                    last_frame=last_frame,
+                    profile=self.profile,
+                )
+                # The next chunk captures resume_frame again at its start if it is a regular checkpoint.
+                self._resume[position] = next((checkpoint for checkpoint in captured if checkpoint.frame == resume_frame), None)
+                self._layer_checkpoints[position].extend(checkpoint for checkpoint in captured if checkpoint.frame <= last_frame)
+
+        self.valid_through = last_frame
+        if self.done:
+            self.canvas.base_universe = self.base_universe
+            self.canvas.cue_signatures = self.cue_signatures
+            self.canvas.checkpoints = merge_layer_checkpoints(self.capture_frames, self._layer_checkpoints)
+        return self.valid_through
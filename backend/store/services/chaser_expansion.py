@@ -0,0 +1,101 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from models.chasers import ChaserDefinition, ChaserEffect, get_chaser_cycle_beats
+from services.cue_helpers.timing import beatToTimeMs
+
+CHASER_EXPANSION_CACHE_SIZE = 256
+
+
+class ChaserStep(NamedTuple):
+    """One chaser effect, relative to the start of its cycle."""
+
+    beat: float
+    duration_seconds: float
+    fixture_id: str
+    effect: str
+    data: Dict[str, Any]
+
+
+class ChaserExpansion(NamedTuple):
+    """A chaser's effects for one cycle at one BPM; callers place repetitions by beat offset."""
+
+    cycle_beats: float
+    steps: Tuple[ChaserStep, ...]
+
+
+_expansions: "OrderedDict[Tuple[str, str, float], ChaserExpansion]" = OrderedDict()
+_expansions_lock = threading.Lock()
+
+
+def chaser_definition_hash(chaser: ChaserDefinition) -> str:
+    payload = json.dumps(chaser.model_dump(), sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def clear_chaser_expansions() -> None:
+    """Drop every memoized expansion (chaser files reloaded or a definition upserted)."""
+    with _expansions_lock:
+        _expansions.clear()
+
+
+def _chaser_source_effects(chaser: ChaserDefinition, params: Dict[str, Any]) -> Optional[List[ChaserEffect]]:
+    if chaser.type == "dynamic":
+        from services.dynamic_chasers import GENERATORS
+
+        generator = GENERATORS.get(chaser.generator_id or "")
+        if not generator:
+            return None
+        merged_params = dict(chaser.default_params)
+        merged_params.update(params)
+        return [ChaserEffect(**effect) for effect in generator(merged_params)]
+    return list(chaser.effects)
+
+
+def expand_chaser_cycle(
+    chaser: ChaserDefinition,
+    params: Dict[str, Any] | None,
+    bpm: float,
+    definition_hash: str | None = None,
+) -> Optional[ChaserExpansion]:
+    """Memoized one-cycle expansion keyed by (definition hash, params, BPM).
+
+    Dynamic chasers run their generator with default_params updated by params; static
+    chasers ignore params. None when a dynamic chaser's generator is unknown.
+    """
+    params = dict(params or {}) if chaser.type == "dynamic" else {}
+    key = (
+        definition_hash or chaser_definition_hash(chaser),
+        json.dumps(params, sort_keys=True, separators=(",", ":"), default=str),
+        float(bpm),
+    )
+    with _expansions_lock:
+        cached = _expansions.get(key)
+        if cached is not None:
+            _expansions.move_to_end(key)
+            return cached
+
+    source_effects = _chaser_source_effects(chaser, params)
+    if source_effects is None:
+        return None
+    expansion = ChaserExpansion(
+        cycle_beats=get_chaser_cycle_beats(chaser),
+        steps=tuple(
+            ChaserStep(
+                beat=effect.beat,
+                duration_seconds=beatToTimeMs(effect.duration, bpm) / 1000.0,
+                fixture_id=effect.fixture_id,
+                effect=effect.effect,
+                data=effect.data,
+            )
+            for effect in source_effects
+        ),
+    )
+    with _expansions_lock:
+        _expansions[key] = expansion
+        while len(_expansions) > CHASER_EXPANSION_CACHE_SIZE:
+            _expansions.popitem(last=False)
+    return expansion
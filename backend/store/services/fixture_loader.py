@@ -6,7 +6,7 @@ from models.fixtures.fixture import Fixture
 from models.fixtures.fixture_template import FixtureTemplate
 from models.fixtures.moving_heads.moving_head import MovingHead
 from models.fixtures.parcans.parcan import Parcan
-from store.dmx_canvas import DMX_CHANNELS
+from store.dmx_canvas import DMX_CHANNELS, rig_universe_count
 
 
 def _load_templates(fixtures_dir: Path) -> Dict[str, FixtureTemplate]:
@@ -33,12 +33,14 @@ def _instantiate_fixture(entry: dict, templates: Dict[str, FixtureTemplate]) ->
     fixture_id = entry.get("id")
     fixture_name = entry.get("name")
     base_channel = entry.get("base_channel", 1)
+    universe = entry.get("universe", 0)
     location = entry.get("location", {})
 
     kwargs = {
         "id": fixture_id,
         "name": fixture_name,
         "base_channel": base_channel,
+        "universe": universe,
         "template": template,
         "location": location,
     }
@@ -69,8 +71,8 @@ def load_fixtures_from_path(fixtures_path: Path) -> Tuple[List[Fixture], int]:
 
     max_channel = 0
     for fixture in fixtures:
-        for offset in fixture.channels.values():
-            max_channel = max(max_channel, fixture.base_channel + offset)
+        for channel in fixture.absolute_channels.values():
+            max_channel = max(max_channel, channel)
 
-    max_used_channel = max(0, min(DMX_CHANNELS, int(max_channel)))
+    max_used_channel = max(0, min(DMX_CHANNELS * rig_universe_count(fixtures), int(max_channel)))
     return fixtures, max_used_channel
@@ -1,4 +1,20 @@
 import os
 
 FPS: int = int(os.environ.get("FPS", 50))
+# Worker processes for full song renders; 1 keeps the serial in-process renderer.
+CANVAS_RENDER_WORKERS: int = int(os.environ.get("CANVAS_RENDER_WORKERS", 1))
+# Content-addressed song canvas cache; empty dir means "<cues>/.canvas_cache", CANVAS_CACHE=0 disables it.
+CANVAS_CACHE_ENABLED: bool = os.environ.get("CANVAS_CACHE", "1") != "0"
+CANVAS_CACHE_DIR: str = os.environ.get("CANVAS_CACHE_DIR", "")
+# Song load renders this many seconds past the playhead inline and streams the rest in the
+# background in CANVAS_STREAM_CHUNK_SECONDS chunks; 0 renders the whole song inline.
+CANVAS_STREAM_LEAD_SECONDS: float = float(os.environ.get("CANVAS_STREAM_LEAD_SECONDS", 10.0))
+CANVAS_STREAM_CHUNK_SECONDS: float = float(os.environ.get("CANVAS_STREAM_CHUNK_SECONDS", 2.0))
+# Time every song canvas render per (effect, fixture type) and cue source; also togglable over MCP.
+CANVAS_PROFILE_ENABLED: bool = os.environ.get("CANVAS_PROFILE", "0") == "1"
+# Debug dumps of every rendered song/preview canvas to cues/<name>.dmx.log ("log", hex text) or
+# .dmx.bin ("binary", compact DMXP), written on a background thread; off by default.
+# CANVAS_DEBUG_CHANNELS is a 1-based "first-last" (or "last") range, default 1..highest fixture channel.
+CANVAS_DEBUG_DUMP: str = os.environ.get("CANVAS_DEBUG_DUMP", "off").strip().lower() or "off"
+CANVAS_DEBUG_CHANNELS: str = os.environ.get("CANVAS_DEBUG_CHANNELS", "")
 MAX_SONG_SECONDS = 6 * 60
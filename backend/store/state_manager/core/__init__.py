@@ -1,4 +1,7 @@
 from .bootstrap import StateCoreBootstrapMixin
+from .canvas_export import StateCoreCanvasExportMixin
+from .canvas_lifecycle import StateCoreCanvasLifecycleMixin
+from .canvas_readout import StateCoreCanvasReadoutMixin
 from .fixture_effects import StateCoreFixtureEffectsMixin
 from .fixture_store import StateCoreFixtureStoreMixin
 from .metadata import StateCoreMetadataMixin
@@ -6,6 +9,9 @@ from .render import StateCoreRenderMixin
 
 __all__ = [
     "StateCoreBootstrapMixin",
+    "StateCoreCanvasExportMixin",
+    "StateCoreCanvasLifecycleMixin",
+    "StateCoreCanvasReadoutMixin",
     "StateCoreFixtureEffectsMixin",
     "StateCoreFixtureStoreMixin",
     "StateCoreMetadataMixin",
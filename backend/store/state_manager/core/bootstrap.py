@@ -1,4 +1,5 @@
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from time import perf_counter
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -7,6 +8,9 @@ from models.fixtures.fixture import Fixture
 from models.song import HumanHints, resolve_meta_root, resolve_songs_root
 from store.dmx_canvas import DMX_CHANNELS, DMXCanvas
 from store.pois import PoiStore
+from store.services.canvas_debug_exporter import CanvasDebugExporter
+
+from ..constants import CANVAS_DEBUG_CHANNELS, CANVAS_DEBUG_DUMP, CANVAS_PROFILE_ENABLED
 
 class StateCoreBootstrapMixin:
     def __init__(
@@ -24,6 +28,8 @@ class StateCoreBootstrapMixin:
         self.editor_universe: bytearray = bytearray(DMX_CHANNELS)
         self.output_universe: bytearray = bytearray(DMX_CHANNELS)
         self.fixtures: List[Fixture] = []
+        # Universes per frame: editor/output universes and song canvases hold this many 512-byte universes.
+        self.universe_count: int = 1
         self.poi_db: PoiStore = PoiStore(backend_path / "fixtures" / "pois.json")
         self.fixtures_path: Optional[Path] = None
         self.current_song = None
@@ -36,6 +42,23 @@ class StateCoreBootstrapMixin:
         self.canvas: Optional[DMXCanvas] = None
         self.song_length_seconds: float = 0.0
         self.canvas_dirty: bool = False
+        # Background re-render after a render input outside the cue sheet changed (POI edits);
+        # requests made while one runs coalesce into one more pass.
+        self.canvas_refresh_task: Optional[asyncio.Task] = None
+        self.canvas_refresh_pending: bool = False
+        # In-flight streamed song render (see StateCoreRenderMixin._load_or_render_song_canvas).
+        self.canvas_stream: Optional[Any] = None
+        self.canvas_stream_key: Optional[bytes] = None
+        self.canvas_stream_task: Optional[asyncio.Task] = None
+        # Song renders run one at a time on this thread with the state lock released; a
+        # result is swapped in only if no newer request has been applied (see _swap_canvas_locked).
+        self.canvas_executor: Optional[ThreadPoolExecutor] = None
+        self.canvas_request_seq: int = 0
+        self.canvas_applied_seq: int = 0
+        # RenderProfile of the last profiled song render (CANVAS_PROFILE=1 or profile_dmx_canvas).
+        self.canvas_profiling: bool = CANVAS_PROFILE_ENABLED
+        self.canvas_debug_exporter = CanvasDebugExporter(self.backend_path, CANVAS_DEBUG_DUMP, CANVAS_DEBUG_CHANNELS)
+        self.canvas_profile: Optional[Any] = None
         self.current_frame_index: int = 0
         self.preview_active: bool = False
         self.preview_task: Optional[asyncio.Task] = None
@@ -0,0 +1,108 @@
+# pyright: reportAttributeAccessIssue=false
+
+import asyncio
+from functools import partial
+from time import perf_counter
+from typing import Any, Dict
+
+from store.dmx_canvas import DMXCanvas
+from store.services.canvas_debug import (
+    build_named_canvas_binary_path,
+    build_show_name,
+    dump_canvas_binary,
+    dump_canvas_debug,
+)
+from store.services.canvas_profile import RenderProfile
+
+
+class StateCoreCanvasExportMixin:
+    def _build_canvas_metadata(self, canvas: DMXCanvas, song_filename: str) -> Dict[str, Any]:
+        show_name = build_show_name()
+        return {
+            "song": song_filename,
+            "fps": int(canvas.fps),
+            "total_frames": int(canvas.total_frames),
+            "duration_s": round((max(0, canvas.total_frames - 1)) / float(canvas.fps), 3),
+            "show_name": show_name,
+            "dmx_binary_path": str(
+                build_named_canvas_binary_path(
+                    backend_path=self.backend_path,
+                    song_filename=song_filename,
+                )
+            ),
+            "dmx_log_path": str(self.backend_path / "cues" / f"{song_filename}.dmx.log"),
+        }
+
+    async def rerender_dmx_canvas(self, compact: bool = False) -> Dict[str, Any]:
+        async with self.lock:
+            song_filename = getattr(getattr(self, "current_song", None), "song_id", None)
+            if not song_filename or not self.cue_sheet:
+                return {"ok": False, "reason": "no_song_loaded"}
+
+            await self._wait_for_canvas_stream_locked()
+            await self._refresh_canvas_after_cue_change()
+            if not self.canvas:
+                return {"ok": False, "reason": "canvas_unavailable"}
+
+            canvas = self.canvas
+            max_used_channel = self.max_used_channel
+            metadata = self._build_canvas_metadata(canvas, song_filename)
+
+        # Swapped-in canvases are never written to, so both files are written after the lock is released.
+        binary_path = await asyncio.to_thread(
+            partial(
+                dump_canvas_binary,
+                backend_path=self.backend_path,
+                song_filename=song_filename,
+                canvas=canvas,
+                compact=compact,
+            )
+        )
+        result = {
+            "ok": True,
+            **metadata,
+            "dmx_binary_path": str(binary_path),
+            "compact": bool(compact),
+        }
+        # An explicit export always refreshes the text log, whatever CANVAS_DEBUG_DUMP says.
+        log_path = await asyncio.to_thread(
+            partial(
+                dump_canvas_debug,
+                backend_path=self.backend_path,
+                song_filename=song_filename,
+                canvas=canvas,
+                max_used_channel=max_used_channel,
+            )
+        )
+        if log_path is not None:
+            result["dmx_log_path"] = str(log_path)
+        return result
+
+    async def profile_dmx_canvas(self) -> Dict[str, Any]:
+        """Render the current song once with profiling and return where the time went.
+
+        The profiled canvas is thrown away; the live canvas is untouched.
+        """
+        async with self.lock:
+            song_filename = getattr(getattr(self, "current_song", None), "song_id", None)
+            if not song_filename or not self.cue_sheet:
+                return {"ok": False, "reason": "no_song_loaded"}
+
+            profile = RenderProfile()
+            snapshot = {**self._canvas_render_snapshot(), "profile": profile}
+            started = perf_counter()
+            canvas = await self._render_unlocked(self._render_cue_sheet_to_canvas, snapshot)
+            render_seconds = perf_counter() - started
+            self.canvas_profile = profile
+            print(
+                f"[DMX CANVAS] profiled render for '{song_filename}' — "
+                f"frames={canvas.total_frames} seconds={render_seconds:.2f} {profile.log_label()}",
+                flush=True,
+            )
+            return {
+                "ok": True,
+                "song_filename": song_filename,
+                "total_frames": canvas.total_frames,
+                "render_seconds": round(render_seconds, 4),
+                "profile": profile.summary(),
+            }
@@ -0,0 +1,223 @@
+# pyright: reportAttributeAccessIssue=false
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+from store.dmx_canvas import DMX_CHANNELS, DMXCanvas, rig_universe_count
+from store.services.canvas_cache import build_canvas_cache_path, canvas_render_key, load_cached_canvas, store_cached_canvas
+from store.services.canvas_dependencies import cue_render_signature, poi_scope, snapshot_poi_db
+from store.services.canvas_profile import RenderProfile
+from store.services.canvas_render_core import iter_cues_for_render
+from store.services.canvas_streaming import StreamingCanvasRender
+
+from ..constants import (
+    CANVAS_CACHE_DIR,
+    CANVAS_CACHE_ENABLED,
+    CANVAS_STREAM_CHUNK_SECONDS,
+    CANVAS_STREAM_LEAD_SECONDS,
+    FPS,
+)
+
+
+def _start_stream(render_kwargs: Dict[str, Any], last_frame: int) -> StreamingCanvasRender:
+    stream = StreamingCanvasRender(**render_kwargs)
+    stream.render_through(last_frame)
+    return stream
+
+
+def _armed_base_universe(snapshot: Dict[str, Any]) -> bytes:
+    base_universe = bytearray(DMX_CHANNELS * rig_universe_count(snapshot["fixtures"]))
+    snapshot["apply_arm"](base_universe)
+    return bytes(base_universe)
+
+
+def _canvas_render_key(snapshot: Dict[str, Any]) -> bytes:
+    """Cache key of the canvas a render snapshot produces."""
+    return canvas_render_key(
+        fixtures=snapshot["fixtures"],
+        cue_sheet=snapshot["cue_sheet"],
+        chasers=snapshot["chasers"],
+        pois=snapshot["pois"],
+        bpm=snapshot["bpm"],
+        song_length_seconds=snapshot["song_length_seconds"],
+        fps=snapshot["fps"],
+        base_universe=_armed_base_universe(snapshot),
+    )
+
+
+def _load_cached_song_canvas(snapshot: Dict[str, Any], path: Path) -> Tuple[bytes, DMXCanvas | None]:
+    """Cache key of snapshot and the cached canvas under it (None on a miss), ready to install.
+
+    A hit gets the provenance incremental re-renders need; checkpoints are rebuilt by the
+    next full render.
+    """
+    key = _canvas_render_key(snapshot)
+    canvas = load_cached_canvas(path, key)
+    if canvas is not None:
+        canvas.base_universe = _armed_base_universe(snapshot)
+        with poi_scope(snapshot_poi_db(snapshot["pois"])):
+            cues = iter_cues_for_render(snapshot["cue_sheet"], snapshot["fixtures"], FPS, snapshot["chasers"], snapshot["bpm"])
+            canvas.cue_signatures = [cue_render_signature(start, end, entry) for start, end, entry in cues]
+    return key, canvas
+
+
+def _store_song_canvas(path: Path, key: bytes, canvas: DMXCanvas, song_filename: str) -> None:
+    try:
+        store_cached_canvas(path, key, canvas)
+    except OSError as exc:
+        print(f"[DMX CANVAS] cache write failed for '{song_filename}': {exc}", flush=True)
+
+
+class StateCoreCanvasLifecycleMixin:
+    async def _render_unlocked(self, render: Callable[..., Any], *args: Any) -> Any:
+        """Run render(*args) on the canvas render thread with the state lock released.
+
+        The caller holds self.lock before and after; other coroutines (playback ticker,
+        Art-Net, websocket intents) run while the render does. Render on a snapshot, not on
+        live state, and re-check state after the await.
+        """
+        if self.canvas_executor is None:
+            self.canvas_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="canvas-render")
+        future = asyncio.get_running_loop().run_in_executor(self.canvas_executor, render, *args)
+        self.lock.release()
+        try:
+            return await future
+        finally:
+            await self.lock.acquire()
+
+    def _next_canvas_request(self) -> int:
+        self.canvas_request_seq += 1
+        return self.canvas_request_seq
+
+    def _swap_canvas_locked(self, request: int, canvas: DMXCanvas, profile: RenderProfile | None = None) -> bool:
+        """Install a canvas rendered for request unless a newer request already swapped one in."""
+        if request <= self.canvas_applied_seq:
+            return False
+        self.canvas_applied_seq = request
+        self.canvas = canvas
+        if profile is not None:
+            self.canvas_profile = profile
+        return True
+
+    def _canvas_profile_log_suffix(self) -> str:
+        if not self.canvas_profiling or self.canvas_profile is None:
+            return ""
+        return f" {self.canvas_profile.log_label()}"
+
+    def _canvas_cache_path(self, song_filename: str) -> Path:
+        cache_dir = Path(CANVAS_CACHE_DIR) if CANVAS_CACHE_DIR else self.cues_path / ".canvas_cache"
+        return build_canvas_cache_path(cache_dir, song_filename)
+
+    async def _load_or_render_song_canvas(self, song_filename: str) -> str:
+        """Install the song canvas from the content-addressed cache, or render it on a miss.
+
+        Cache lookups, cache writes and renders run off the event loop on a snapshot, with
+        the state lock released. With CANVAS_STREAM_LEAD_SECONDS > 0
+        only the frames up to that far past the playhead render before this returns; a
+        background task renders the rest (see `_run_canvas_stream`). Returns the canvas
+        source: "cache", "render", "stream", or "superseded" when a newer load won.
+        """
+        request = self._next_canvas_request()
+        self.canvas = None
+        # The cache key, a cached canvas's signatures and a render all read this one snapshot.
+        snapshot = self._canvas_render_snapshot()
+        key = None
+        if CANVAS_CACHE_ENABLED:
+            key, canvas = await self._render_unlocked(_load_cached_song_canvas, snapshot, self._canvas_cache_path(song_filename))
+            if canvas is not None:
+                return "cache" if self._swap_canvas_locked(request, canvas) else "superseded"
+
+        if CANVAS_STREAM_LEAD_SECONDS > 0:
+            lead_frames = max(1, int(round(CANVAS_STREAM_LEAD_SECONDS * FPS)))
+            stream = await self._render_unlocked(_start_stream, snapshot, self.current_frame_index + lead_frames - 1)
+            if not self._swap_canvas_locked(request, stream.canvas, stream.profile):
+                return "superseded"
+            if not stream.done:
+                self.canvas_stream = stream
+                self.canvas_stream_key = key
+                self.canvas_stream_task = asyncio.create_task(self._run_canvas_stream(stream))
+                return "stream"
+        else:
+            canvas = await self._render_unlocked(self._render_cue_sheet_to_canvas, snapshot)
+            if not self._swap_canvas_locked(request, canvas, snapshot.get("profile")):
+                return "superseded"
+        await self._finish_song_canvas(song_filename, key, self.canvas)
+        return "render"
+
+    async def _finish_song_canvas(self, song_filename: str, key: bytes | None, canvas: DMXCanvas) -> None:
+        """Dump and cache a fully rendered song canvas; the cache write runs with the lock released."""
+        self._dump_canvas_debug(song_filename)
+        if key is not None:
+            await self._render_unlocked(_store_song_canvas, self._canvas_cache_path(song_filename), key, canvas, song_filename)
+
+    def _canvas_valid_through(self) -> int:
+        """Last frame of the current canvas that has been rendered."""
+        if not self.canvas:
+            return -1
+        stream = self.canvas_stream
+        if stream is not None and stream.canvas is self.canvas:
+            return stream.valid_through
+        return self.canvas.total_frames - 1
+
+    async def _run_canvas_stream(self, stream: StreamingCanvasRender) -> None:
+        """Render the rest of a streamed song canvas chunk by chunk on the canvas render thread."""
+        chunk_frames = max(1, int(round(CANVAS_STREAM_CHUNK_SECONDS * FPS)))
+        async with self.lock:
+            while self.canvas_stream is stream and not stream.done:
+                await self._render_unlocked(stream.render_through, stream.valid_through + chunk_frames)
+            if self.canvas_stream is not stream:
+                return
+            self.canvas_stream = None
+            self.canvas_stream_task = None
+            song_filename = getattr(getattr(self, "current_song", None), "song_id", None) or "unknown"
+            print(
+                f"[DMX CANVAS] streamed render complete for '{song_filename}' — "
+                f"frames={stream.canvas.total_frames}{self._canvas_profile_log_suffix()}",
+                flush=True,
+            )
+            await self._finish_song_canvas(song_filename, self.canvas_stream_key, stream.canvas)
+
+    async def _wait_for_canvas_stream_locked(self) -> None:
+        """Let an in-flight streamed render finish; callers need every frame of the canvas."""
+        while self.canvas_stream is not None and self.canvas_stream_task is not None:
+            task = self.canvas_stream_task
+            self.lock.release()
+            try:
+                await asyncio.wait([task])
+            finally:
+                await self.lock.acquire()
+            if self.canvas_stream_task is task:
+                break
+
+    def _schedule_canvas_refresh(self) -> None:
+        """Re-render the song canvas in the background, coalescing requests made while one runs.
+
+        Goes through the incremental cue-change re-render: cue signatures carry their POI
+        values, so only the layers and frame windows of cues whose inputs changed re-render.
+        """
+        self.canvas_refresh_pending = True
+        if self.canvas_refresh_task is None or self.canvas_refresh_task.done():
+            self.canvas_refresh_task = asyncio.create_task(self._run_canvas_refresh())
+
+    async def _run_canvas_refresh(self) -> None:
+        while self.canvas_refresh_pending:
+            self.canvas_refresh_pending = False
+            async with self.lock:
+                if self.cue_sheet is None or (self.canvas is None and self.canvas_stream is None):
+                    continue
+                try:
+                    await self._refresh_canvas_after_cue_change()
+                except Exception as exc:
+                    print(f"[DMX CANVAS] background re-render failed: {exc}", flush=True)
+
+    def _cancel_canvas_stream_locked(self) -> bool:
+        """Drop the in-flight streamed render; True when the current canvas was still incomplete."""
+        stream = self.canvas_stream
+        task = self.canvas_stream_task
+        self.canvas_stream = None
+        self.canvas_stream_task = None
+        if task is not None and task is not asyncio.current_task() and not task.done():
+            task.cancel()
+        return stream is not None and not stream.done
@@ -0,0 +1,71 @@
+# pyright: reportAttributeAccessIssue=false
+
+import math
+from typing import Any, Dict
+
+
+class StateCoreCanvasReadoutMixin:
+    async def read_fixture_output_window(
+        self,
+        fixture_id: str,
+        start_time: float,
+        end_time: float,
+        max_samples: int = 240,
+    ) -> Dict[str, Any]:
+        async with self.lock:
+            if end_time < start_time:
+                return {"ok": False, "reason": "invalid_time_range"}
+            if not self.canvas:
+                return {"ok": False, "reason": "canvas_unavailable"}
+            await self._wait_for_canvas_stream_locked()
+            if not self.canvas:
+                return {"ok": False, "reason": "canvas_unavailable"}
+
+            fixture = self._get_fixture(str(fixture_id or "").strip())
+            if not fixture:
+                return {"ok": False, "reason": "fixture_not_found", "fixture_id": fixture_id}
+
+            canvas = self.canvas
+            start_frame = canvas.clamp_frame_index(int(math.floor(float(start_time) * canvas.fps)))
+            end_frame = canvas.clamp_frame_index(int(math.ceil(float(end_time) * canvas.fps)))
+            frame_count = max(1, end_frame - start_frame + 1)
+            sample_limit = max(1, min(int(max_samples or 1), frame_count))
+            step = max(1, int(math.ceil(frame_count / float(sample_limit))))
+
+            sample_indices = list(range(start_frame, end_frame + 1, step))
+            if sample_indices[-1] != end_frame:
+                sample_indices.append(end_frame)
+
+            # One strided column read per channel instead of a frame view per sample.
+            columns = {}
+            for name, channel_1_based in fixture.absolute_channels.items():
+                if not 1 <= channel_1_based <= canvas.frame_size:
+                    continue
+                column = canvas.channel_view(channel_1_based - 1, start_frame, end_frame, step).tolist()
+                if len(column) < len(sample_indices):
+                    column.append(canvas.frame_view(end_frame)[channel_1_based - 1])
+                columns[name] = column
+
+            samples = [
+                {
+                    "frame": int(frame_index),
+                    "time_s": round(frame_index / float(canvas.fps), 3),
+                    "channels": {name: int(column[position]) for name, column in columns.items()},
+                }
+                for position, frame_index in enumerate(sample_indices)
+            ]
+
+            song_filename = getattr(getattr(self, "current_song", None), "song_id", None) or "unknown"
+            return {
+                "ok": True,
+                "song": song_filename,
+                "fixture_id": fixture.id,
+                "fps": int(canvas.fps),
+                "start_time": float(start_time),
+                "end_time": float(end_time),
+                "start_frame": int(start_frame),
+                "end_frame": int(end_frame),
+                "sample_step_frames": int(step),
+                "absolute_channels": dict(fixture.absolute_channels),
+                "samples": samples,
+            }
@@ -4,7 +4,6 @@ from typing import Optional
 
 from models.fixtures.fixture import Fixture
 from models.fixtures.effects import REGISTRY
-from store.dmx_canvas import DMX_CHANNELS
 
 class StateCoreFixtureEffectsMixin:
     def _get_fixture(self, fixture_id: str) -> Optional[Fixture]:
@@ -14,7 +13,7 @@ class StateCoreFixtureEffectsMixin:
         return REGISTRY.get_supported_effects(fixture)
 
     def _set_channel(self, universe: bytearray, channel_1_based: int, value: int) -> None:
-        if 1 <= channel_1_based <= DMX_CHANNELS:
+        if 1 <= channel_1_based <= len(universe):
             universe[channel_1_based - 1] = max(0, min(255, int(value)))
 
     def _apply_arm(self, universe: bytearray) -> None:
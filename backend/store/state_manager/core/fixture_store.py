@@ -4,7 +4,8 @@ import json
 from pathlib import Path
 from typing import Any, Dict, List
 
-from store.dmx_canvas import DMX_CHANNELS
+from store.dmx_canvas import DMX_CHANNELS, rig_universe_count
+from store.services.canvas_dependencies import poi_dependents
 from store.services.fixture_loader import load_fixtures_from_path
 
 
@@ -15,10 +16,16 @@ class StateCoreFixtureStoreMixin:
             fixtures, max_used_channel = load_fixtures_from_path(self.fixtures_path)
             self.fixtures = fixtures
             self.max_used_channel = max_used_channel
-            self.editor_universe = bytearray(DMX_CHANNELS)
-            self.output_universe = bytearray(DMX_CHANNELS)
+            self.universe_count = rig_universe_count(fixtures)
+            self.editor_universe = bytearray(DMX_CHANNELS * self.universe_count)
+            self.output_universe = bytearray(DMX_CHANNELS * self.universe_count)
             self._apply_arm(self.editor_universe)
             self._apply_arm(self.output_universe)
+            if self.canvas is not None or self.canvas_stream is not None:
+                # Cue signatures do not cover fixture definitions, so a reloaded rig
+                # re-renders the loaded song's canvas whole.
+                self.canvas_dirty = True
+                self._schedule_canvas_refresh()
 
     @property
     def pois(self) -> List[Dict[str, Any]]:
@@ -31,6 +38,26 @@ class StateCoreFixtureStoreMixin:
     async def get_pois(self) -> List[Dict[str, Any]]:
         return await self.poi_db.get_all()
 
+    def refresh_canvas_for_poi(self, poi_id: str) -> Dict[str, int]:
+        """Re-render, in the background, the song canvas cues that read a created/edited/deleted POI.
+
+        Returns the dependent cue count per fixture id from the current canvas; nothing is
+        scheduled when a complete canvas has no cue reading the POI.
+        """
+        canvas = self.canvas
+        if canvas is None or self.canvas_stream is not None:
+            self._schedule_canvas_refresh()
+            return {}
+        dependents = poi_dependents(canvas.cue_signatures, poi_id)
+        if dependents:
+            print(
+                f"[DMX CANVAS] POI '{poi_id}' changed — re-rendering {sum(dependents.values())} dependent cues "
+                f"on {', '.join(sorted(dependents))}",
+                flush=True,
+            )
+            self._schedule_canvas_refresh()
+        return dependents
+
     async def save_fixtures(self) -> None:
         if not self.fixtures_path:
             raise RuntimeError("fixtures_path_not_set")
@@ -65,7 +92,7 @@ class StateCoreFixtureStoreMixin:
         if not saved:
             return {"ok": False, "reason": "persist_failed"}
 
-        self.canvas_dirty = True
+        self.refresh_canvas_for_poi(normalized_poi_id)
         return {
             "ok": True,
             "fixture_id": fixture_id,
@@ -1,53 +1,91 @@
 # pyright: reportAttributeAccessIssue=false
 
-import math
-from typing import Any, Dict
+from copy import deepcopy
+from functools import partial
+from typing import Any, Dict, List, Tuple
 
 from models.fixtures.fixture import Fixture
-from store.dmx_canvas import DMXCanvas
-from store.services.canvas_rendering import (
-    dump_canvas_debug,
-    render_cue_sheet_to_canvas,
-    render_preview_canvas,
-)
-from store.services.canvas_debug import (
-    build_named_canvas_binary_path,
-    build_show_name,
-    dump_canvas_binary,
-    dump_named_canvas_debug,
-)
+from store.dmx_canvas import DMX_CHANNELS, DMXCanvas
+from store.services.canvas_incremental import rerender_cue_sheet_window
+from store.services.canvas_preview import render_preview_canvas
+from store.services.canvas_rendering import render_cue_sheet_to_canvas
+from store.services.canvas_parallel import render_cue_sheet_to_canvas_parallel
+from store.services.canvas_profile import RenderProfile
 
-from ..constants import FPS
+from ..constants import CANVAS_RENDER_WORKERS, FPS
+
+
+def _copy_armed_universe(base_universe: bytes, universe: bytearray) -> None:
+    universe[:] = base_universe
 
 
 class StateCoreRenderMixin:
-    def _build_canvas_metadata(self, canvas: DMXCanvas, song_filename: str) -> Dict[str, Any]:
-        show_name = build_show_name()
+    def _canvas_checkpoint_seconds(self) -> List[float]:
+        """Section starts of the current song, used as extra render checkpoints."""
+        song = getattr(self, "current_song", None)
+        if song is None:
+            return []
+        try:
+            sections = song.sections.sections
+        except (AttributeError, OSError, ValueError):
+            # No sections model, or an unreadable/invalid sections.json (JSON and validation errors are ValueErrors).
+            return []
+        starts = []
+        for section in sections or []:
+            start_s = section.get("start_s", section.get("start"))
+            if isinstance(start_s, (int, float)):
+                starts.append(float(start_s))
+        return starts
+
+    def _canvas_render_kwargs(self) -> Dict[str, Any]:
         return {
-            "song": song_filename,
-            "fps": int(canvas.fps),
-            "total_frames": int(canvas.total_frames),
-            "duration_s": round((max(0, canvas.total_frames - 1)) / float(canvas.fps), 3),
-            "show_name": show_name,
-            "dmx_binary_path": str(
-                build_named_canvas_binary_path(
-                    backend_path=self.backend_path,
-                    song_filename=song_filename,
-                )
-            ),
-            "dmx_log_path": str(self.backend_path / "cues" / f"{song_filename}.dmx.log"),
+            "fixtures": self.fixtures,
+            "cue_sheet": self.cue_sheet,
+            "chasers": self.chasers,
+            "bpm": self._current_bpm(),
+            "song_length_seconds": self.song_length_seconds,
+            "fps": FPS,
+            "apply_arm": self._apply_arm,
+            "checkpoint_seconds": self._canvas_checkpoint_seconds(),
         }
 
-    def _render_cue_sheet_to_canvas(self) -> DMXCanvas:
-        return render_cue_sheet_to_canvas(
-            fixtures=self.fixtures,
-            cue_sheet=self.cue_sheet,
-            chasers=self.chasers,
-            bpm=self._current_bpm(),
-            song_length_seconds=self.song_length_seconds,
-            fps=FPS,
-            apply_arm=self._apply_arm,
-        )
+    def _canvas_render_snapshot(self) -> Dict[str, Any]:
+        """Render inputs copied off the live state, safe to render from another thread.
+
+        POIs are copied too: the render thread reads them, not the POI store, so POI edits
+        made during the render show up as cue signature changes afterwards.
+        """
+        base_universe = bytearray(DMX_CHANNELS * self.universe_count)
+        self._apply_arm(base_universe)
+        return {
+            "fixtures": [fixture.model_copy(deep=True) for fixture in self.fixtures],
+            "cue_sheet": self.cue_sheet.model_copy(deep=True) if self.cue_sheet is not None else None,
+            "chasers": [chaser.model_copy(deep=True) for chaser in self.chasers],
+            "pois": deepcopy(self.pois),
+            "bpm": self._current_bpm(),
+            "song_length_seconds": self.song_length_seconds,
+            "fps": FPS,
+            "apply_arm": partial(_copy_armed_universe, bytes(base_universe)),
+            "checkpoint_seconds": self._canvas_checkpoint_seconds(),
+            **({"profile": RenderProfile()} if self.canvas_profiling else {}),
+        }
+
+    def _render_cue_sheet_to_canvas(self, render_kwargs: Dict[str, Any] | None = None) -> DMXCanvas:
+        if render_kwargs is None:
+            render_kwargs = self._canvas_render_kwargs()
+        # Profiled renders stay in-process so every op is timed into one RenderProfile.
+        if CANVAS_RENDER_WORKERS > 1 and render_kwargs.get("profile") is None:
+            return render_cue_sheet_to_canvas_parallel(**render_kwargs, max_workers=CANVAS_RENDER_WORKERS)
+        return render_cue_sheet_to_canvas(**render_kwargs)
+
+    def _rerender_cue_sheet_window(
+        self,
+        previous: DMXCanvas | None,
+        render_kwargs: Dict[str, Any] | None = None,
+    ) -> Tuple[DMXCanvas, Tuple[int, int] | None]:
+        if render_kwargs is None:
+            render_kwargs = self._canvas_render_kwargs()
+        return rerender_cue_sheet_window(previous=previous, **render_kwargs)
 
     def _render_preview_canvas(
         self,
@@ -68,97 +106,7 @@ class StateCoreRenderMixin:
         )
 
     def _dump_canvas_debug(self, song_filename: str) -> None:
-        dump_canvas_debug(
-            backend_path=self.backend_path,
-            song_filename=song_filename,
-            canvas=self.canvas,
-            max_used_channel=self.max_used_channel,
-        )
+        self.canvas_debug_exporter.submit(song_filename, self.canvas, self.max_used_channel)
 
     def _dump_preview_canvas_debug(self, file_stem: str) -> None:
-        dump_named_canvas_debug(
-            backend_path=self.backend_path,
-            file_stem=file_stem,
-            canvas=self.preview_canvas,
-            max_used_channel=self.max_used_channel,
-        )
-
-    async def rerender_dmx_canvas(self) -> Dict[str, Any]:
-        async with self.lock:
-            song_filename = getattr(getattr(self, "current_song", None), "song_id", None)
-            if not song_filename or not self.cue_sheet:
-                return {"ok": False, "reason": "no_song_loaded"}
-
-            self._refresh_canvas_after_cue_change()
-            if not self.canvas:
-                return {"ok": False, "reason": "canvas_unavailable"}
-
-            dump_canvas_binary(
-                backend_path=self.backend_path,
-                song_filename=song_filename,
-                canvas=self.canvas,
-            )
-
-            return {
-                "ok": True,
-                **self._build_canvas_metadata(self.canvas, song_filename),
-            }
-
-    async def read_fixture_output_window(
-        self,
-        fixture_id: str,
-        start_time: float,
-        end_time: float,
-        max_samples: int = 240,
-    ) -> Dict[str, Any]:
-        async with self.lock:
-            if end_time < start_time:
-                return {"ok": False, "reason": "invalid_time_range"}
-            if not self.canvas:
-                return {"ok": False, "reason": "canvas_unavailable"}
-
-            fixture = self._get_fixture(str(fixture_id or "").strip())
-            if not fixture:
-                return {"ok": False, "reason": "fixture_not_found", "fixture_id": fixture_id}
-
-            canvas = self.canvas
-            start_frame = canvas.clamp_frame_index(int(math.floor(float(start_time) * canvas.fps)))
-            end_frame = canvas.clamp_frame_index(int(math.ceil(float(end_time) * canvas.fps)))
-            frame_count = max(1, end_frame - start_frame + 1)
-            sample_limit = max(1, min(int(max_samples or 1), frame_count))
-            step = max(1, int(math.ceil(frame_count / float(sample_limit))))
-
-            sample_indices = list(range(start_frame, end_frame + 1, step))
-            if sample_indices[-1] != end_frame:
-                sample_indices.append(end_frame)
-
-            samples = []
-            for frame_index in sample_indices:
-                frame = canvas.frame_view(frame_index)
-                channels = {
-                    name: int(frame[channel_1_based - 1])
-                    for name, channel_1_based in fixture.absolute_channels.items()
-                    if 1 <= channel_1_based <= len(frame)
-                }
-                samples.append(
-                    {
-                        "frame": int(frame_index),
-                        "time_s": round(frame_index / float(canvas.fps), 3),
-                        "channels": channels,
-                    }
-                )
-
-            song_filename = getattr(getattr(self, "current_song", None), "song_id", None) or "unknown"
-            return {
-                "ok": True,
-                "song": song_filename,
-                "fixture_id": fixture.id,
-                "fps": int(canvas.fps),
-                "start_time": float(start_time),
-                "end_time": float(end_time),
-                "start_frame": int(start_frame),
-                "end_frame": int(end_frame),
-                "sample_step_frames": int(step),
-                "absolute_channels": dict(fixture.absolute_channels),
-                "samples": samples,
-            }
+        self.canvas_debug_exporter.submit(file_stem, self.preview_canvas, self.max_used_channel)
@@ -1,5 +1,8 @@
 from .core import (
     StateCoreBootstrapMixin,
+    StateCoreCanvasExportMixin,
+    StateCoreCanvasLifecycleMixin,
+    StateCoreCanvasReadoutMixin,
     StateCoreFixtureEffectsMixin,
     StateCoreFixtureStoreMixin,
     StateCoreMetadataMixin,
@@ -29,6 +32,9 @@ class StateManager(
     StatePlaybackPreviewControlMixin,
     StatePlaybackPreviewStartMixin,
     StatePlaybackChannelMixin,
+    StateCoreCanvasLifecycleMixin,
+    StateCoreCanvasExportMixin,
+    StateCoreCanvasReadoutMixin,
     StateCoreRenderMixin,
     StateCoreMetadataMixin,
     StateCoreFixtureStoreMixin,
@@ -7,7 +7,8 @@ from uuid import uuid4
 
 from models.cues import CueEntry, CueSheet
 from store.dmx_canvas import DMXCanvas
-from store.services.canvas_render_core import iter_cues_for_render, render_entry_into_universe
+from store.services.canvas_frames import render_cue_frames
+from store.services.canvas_render_core import iter_cues_for_render
 
 from ..constants import FPS
 
@@ -20,30 +21,8 @@ class StatePlaybackPreviewChaserMixin:
         )
         cues = iter_cues_for_render(cue_sheet, self.fixtures, FPS, [], self._current_bpm())
         total_frames = max(1, max((end for _, end, _ in cues), default=0) + 1)
-        canvas = DMXCanvas.allocate(fps=FPS, total_frames=total_frames)
-        active: List[tuple[int, int, CueEntry]] = []
-        cues_by_start: Dict[int, List[tuple[int, int, CueEntry]]] = {}
-        for start, end, entry in cues:
-            cues_by_start.setdefault(start, []).append((start, end, entry))
-        universe = bytearray(base_universe)
-        entry_render_state: Dict[int, Dict[str, Any]] = {}
-        for frame_index in range(total_frames):
-            if frame_index in cues_by_start:
-                active.extend(cues_by_start[frame_index])
-            if active:
-                active = [item for item in active if item[1] >= frame_index]
-                for start_frame, end_frame, entry in sorted(active, key=lambda item: (item[2].time, item[2].fixture_id or "", item[2].effect or "")):
-                    render_entry_into_universe(
-                        fixtures=self.fixtures,
-                        universe=universe,
-                        frame_index=frame_index,
-                        start_frame=start_frame,
-                        end_frame=end_frame,
-                        entry=entry,
-                        entry_render_state=entry_render_state,
-                        fps=FPS,
-                    )
-            canvas.set_frame(frame_index, universe)
+        canvas = DMXCanvas.allocate(fps=FPS, total_frames=total_frames, universe_count=self.universe_count)
+        render_cue_frames(canvas=canvas, fixtures=self.fixtures, cues=cues, fps=FPS, universe=bytearray(base_universe))
         return canvas
 
     async def start_preview_chaser(
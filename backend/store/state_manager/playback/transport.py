@@ -3,7 +3,7 @@
 import asyncio
 import contextlib
 from time import perf_counter
-from typing import Optional
+from typing import Optional, Tuple
 
 
 class StatePlaybackTransportMixin:
@@ -56,10 +56,15 @@ class StatePlaybackTransportMixin:
             self.current_frame_index = self._time_to_frame_index(self.timecode)
             self._apply_canvas_frame_to_output(self.current_frame_index)
 
-    async def advance_timecode(self, delta_seconds: float) -> None:
+    async def advance_timecode(self, delta_seconds: float) -> Optional[Tuple[int, int]]:
+        """Move the playhead to the wall clock and output its canvas frame.
+
+        Returns the output frame key (see `_apply_canvas_frame_to_output`), or None when not
+        playing or no canvas is loaded; ticks that return the same key output the same bytes.
+        """
         async with self.lock:
             if not self.is_playing:
-                return
+                return None
             next_timecode = self._current_playback_timecode_locked(perf_counter())
             if self.song_length_seconds > 0.0 and next_timecode >= self.song_length_seconds:
                 self.timecode = float(self.song_length_seconds)
@@ -69,7 +74,7 @@ class StatePlaybackTransportMixin:
             else:
                 self.timecode = next_timecode
             self.current_frame_index = self._time_to_frame_index(self.timecode)
-            self._apply_canvas_frame_to_output(self.current_frame_index)
+            return self._apply_canvas_frame_to_output(self.current_frame_index)
 
     async def blackout_output(self) -> None:
         async with self.lock:
@@ -93,7 +98,12 @@ class StatePlaybackTransportMixin:
         elapsed = max(0.0, float(now) - float(self.playback_anchor_perf))
         return self._clamp_timecode(self.playback_anchor_timecode + elapsed)
 
-    def _apply_canvas_frame_to_output(self, frame_index: int) -> None:
+    def _apply_canvas_frame_to_output(self, frame_index: int) -> Optional[Tuple[int, int]]:
+        """Copy a canvas frame to the output universe; returns (canvas swap, frame) or None without a canvas."""
         if not self.canvas:
-            return
+            return None
+        # Past the streamed-render watermark, hold the last rendered frame.
+        frame_index = min(frame_index, max(0, self._canvas_valid_through()))
         self.output_universe[:] = self.canvas.frame_view(frame_index)
+        # Swapped-in canvases never change below the watermark, so the key pins the bytes.
+        return (self.canvas_applied_seq, frame_index)
@@ -5,13 +5,15 @@ from __future__ import annotations
 import time
 from typing import Any, Dict, List, Optional
 
-from models.chasers import ChaserDefinition, ChaserEffect, get_chaser_cycle_beats, load_chasers
+from models.chasers import ChaserDefinition, get_chaser_cycle_beats, load_chasers
 from models.cues import create_cue_entry
 from services.cue_helpers.timing import beatToTimeMs
+from store.services.chaser_expansion import clear_chaser_expansions, expand_chaser_cycle
 
 
 class StateSongChaserMixin:
     def load_chasers(self) -> None:
+        clear_chaser_expansions()
         try:
             self.chasers = load_chasers(self.chasers_dir)
         except Exception as exc:
@@ -81,36 +83,21 @@ class StateSongChaserMixin:
         chaser = self.get_chaser_definition(chaser_id)
         if not chaser:
             return []
-
-        # Determine source of effects (Static vs Dynamic)
-        source_effects: List[ChaserEffect] = []
-        if chaser.type == "dynamic":
-            from services.dynamic_chasers import GENERATORS
-            if chaser.generator_id in GENERATORS:
-                # Merge definition defaults with instance overrides
-                merged_params = dict(chaser.default_params)
-                if params:
-                    merged_params.update(params)
-                
-                raw_effects = GENERATORS[chaser.generator_id](merged_params)
-                source_effects = [ChaserEffect(**e) for e in raw_effects]
-        else:
-            source_effects = chaser.effects
+        expansion = expand_chaser_cycle(chaser, params, bpm)
+        if expansion is None:
+            return []
 
         entries: List[Dict[str, Any]] = []
-        cycle_beats = get_chaser_cycle_beats(chaser)
-
         for cycle in range(repetitions):
-            cycle_offset_beats = cycle * cycle_beats
-            for effect in source_effects:
-                cue_time_ms = start_time_ms + beatToTimeMs(cycle_offset_beats + effect.beat, bpm)
-                cue_duration_ms = beatToTimeMs(effect.duration, bpm)
+            cycle_offset_beats = cycle * expansion.cycle_beats
+            for step in expansion.steps:
+                cue_time_ms = start_time_ms + beatToTimeMs(cycle_offset_beats + step.beat, bpm)
                 entries.append({
                     "time": cue_time_ms / 1000.0,
-                    "fixture_id": effect.fixture_id,
-                    "effect": effect.effect,
-                    "duration": cue_duration_ms / 1000.0,
-                    "data": dict(effect.data),
+                    "fixture_id": step.fixture_id,
+                    "effect": step.effect,
+                    "duration": step.duration_seconds,
+                    "data": dict(step.data),
                 })
         return entries
 
@@ -136,7 +123,7 @@ class StateSongChaserMixin:
 
             self._validate_cue_entry(entry)
             await self.save_cue_sheet()
-            self._refresh_canvas_after_cue_change()
+            await self._refresh_canvas_after_cue_change()
             return {"ok": True, "chaser_id": chaser.id, "entry": entry.model_dump(exclude_none=True)}
 
     async def start_chaser_instance(self, chaser_id: str, start_time_ms: float, repetitions: int) -> Dict[str, Any]:
@@ -15,6 +15,7 @@ from models.cues import (
     update_cue_entry,
     upsert_cue_entries,
 )
+from store.services.chaser_expansion import clear_chaser_expansions
 
 
 class StateSongCueMixin:
@@ -80,13 +81,24 @@ class StateSongCueMixin:
         for entry in self.cue_sheet.entries:
             self._validate_cue_entry(entry)
 
-    def _refresh_canvas_after_cue_change(self) -> None:
+    async def _refresh_canvas_after_cue_change(self) -> None:
+        # A dirty canvas is stale for reasons the cue diff cannot see (POI edits are part of the
+        # cue signatures; fixture reloads in load_fixtures are not), and a half-streamed canvas
+        # has frames that were never rendered; render either one whole.
+        stream_incomplete = self._cancel_canvas_stream_locked()
+        previous = None if self.canvas_dirty or stream_incomplete else self.canvas
         self.canvas_dirty = False
-        self.canvas = self._render_cue_sheet_to_canvas()
+        request = self._next_canvas_request()
+        snapshot = self._canvas_render_snapshot()
+        canvas, window = await self._render_unlocked(self._rerender_cue_sheet_window, previous, snapshot)
+        if not self._swap_canvas_locked(request, canvas, snapshot.get("profile")):
+            return
         song_name = self.cue_sheet.song_filename
+        window_label = f"{window[0]}..{window[1]}" if window else "none"
         print(
             f"[DMX CANVAS] re-render complete for '{song_name}' — "
-            f"frames={self.canvas.total_frames} fps={self.canvas.fps}",
+            f"frames={self.canvas.total_frames} fps={self.canvas.fps} window={window_label}"
+            f"{self._canvas_profile_log_suffix()}",
             flush=True,
         )
         self._dump_canvas_debug(song_name)
@@ -110,7 +122,7 @@ class StateSongCueMixin:
                 self.cue_sheet = current_cue_sheet
                 return {"ok": False, "reason": str(exc), "song_filename": song_filename}
 
-            self._refresh_canvas_after_cue_change()
+            await self._refresh_canvas_after_cue_change()
             return {
                 "ok": True,
                 "song_filename": song_filename,
@@ -144,7 +156,7 @@ class StateSongCueMixin:
                 )
 
             await self.save_cue_sheet()
-            self._refresh_canvas_after_cue_change()
+            await self._refresh_canvas_after_cue_change()
 
             return new_entries
 
@@ -191,7 +203,7 @@ class StateSongCueMixin:
             )
             self._validate_cue_entry(entry)
             await self.save_cue_sheet()
-            self._refresh_canvas_after_cue_change()
+            await self._refresh_canvas_after_cue_change()
 
             return {
                 "ok": True,
@@ -223,7 +235,7 @@ class StateSongCueMixin:
                 self.cue_sheet.entries = current_entries
                 return {"ok": False, "reason": str(exc)}
             await self.save_cue_sheet()
-            self._refresh_canvas_after_cue_change()
+            await self._refresh_canvas_after_cue_change()
             return {"ok": True, "entry": entry.model_dump(exclude_none=True)}
 
     async def save_cue_sheet(self):
@@ -279,7 +291,7 @@ class StateSongCueMixin:
                 return {"ok": False, "reason": str(exc)}
 
             await self.save_cue_sheet()
-            self._refresh_canvas_after_cue_change()
+            await self._refresh_canvas_after_cue_change()
             return {
                 "ok": True,
                 "start_time": float(start_time),
@@ -309,7 +321,7 @@ class StateSongCueMixin:
                 return {"ok": False, "reason": str(exc)}
 
             await self.save_cue_sheet()
-            self._refresh_canvas_after_cue_change()
+            await self._refresh_canvas_after_cue_change()
             return {
                 "ok": True,
                 "count": len(self.cue_sheet.entries),
@@ -338,7 +350,7 @@ class StateSongCueMixin:
                 self.cue_sheet.entries = current_entries
                 return {"ok": False, "reason": str(exc)}
             await self.save_cue_sheet()
-            self._refresh_canvas_after_cue_change()
+            await self._refresh_canvas_after_cue_change()
             return {"ok": True, "entry": entry.model_dump(exclude_none=True)}
 
     async def delete_cue_entry(self, index: int) -> Dict[str, Any]:
@@ -350,7 +362,7 @@ class StateSongCueMixin:
             except IndexError as exc:
                 return {"ok": False, "reason": str(exc)}
             await self.save_cue_sheet()
-            self._refresh_canvas_after_cue_change()
+            await self._refresh_canvas_after_cue_change()
             return {"ok": True, "entry": entry.model_dump(exclude_none=True)}
 
     async def clear_cue_entries(
@@ -373,7 +385,7 @@ class StateSongCueMixin:
 
             removed = before_count - len(self.cue_sheet.entries)
             if removed > 0:
-                self._refresh_canvas_after_cue_change()
+                await self._refresh_canvas_after_cue_change()
 
             return {
                 "ok": True,
@@ -427,9 +439,10 @@ class StateSongCueMixin:
                     self.cue_sheet.chasers[idx] = new_def
                 else:
                     self.cue_sheet.chasers.append(new_def)
+                clear_chaser_expansions()
                 
                 await self.save_cue_sheet()
-                self._refresh_canvas_after_cue_change()
+                await self._refresh_canvas_after_cue_change()
             
             return {"ok": True, "chaser": new_def}
 
@@ -489,6 +502,6 @@ class StateSongCueMixin:
             # Apply upsert logic
             counts = upsert_cue_entries(self.cue_sheet, new_entries)
             await self.save_cue_sheet()
-            self._refresh_canvas_after_cue_change()
+            await self._refresh_canvas_after_cue_change()
 
             return {"ok": True, **counts}
@@ -10,6 +10,7 @@ from store.dmx_canvas import DMX_CHANNELS
 class StateSongLoadingMixin:
     async def load_song(self, song_filename: str):
         async with self.lock:
+            self._cancel_canvas_stream_locked()
             audio_url = None
             audio_file = self.songs_path / f"{song_filename}.mp3"
             if audio_file.exists():
@@ -28,8 +29,8 @@ class StateSongLoadingMixin:
             self.load_human_hints(song_filename)
             self._validate_cue_sheet()
 
-            self.editor_universe = bytearray(DMX_CHANNELS)
-            self.output_universe = bytearray(DMX_CHANNELS)
+            self.editor_universe = bytearray(DMX_CHANNELS * self.universe_count)
+            self.output_universe = bytearray(DMX_CHANNELS * self.universe_count)
             self._apply_arm(self.editor_universe)
             self._apply_arm(self.output_universe)
             self.is_playing = False
@@ -44,10 +45,15 @@ class StateSongLoadingMixin:
             self.preview_duration = 0.0
             self.active_chasers = {}
             self.canvas_dirty = False
-            self.canvas = self._render_cue_sheet_to_canvas()
+            source = await self._load_or_render_song_canvas(song_filename)
+            if source == "superseded":
+                return
+            status = {"cache": "cache hit", "render": "render complete", "stream": "streaming render started"}[source]
             print(
-                f"[DMX CANVAS] render complete for '{song_filename}' — "
-                f"frames={self.canvas.total_frames} fps={self.canvas.fps}",
+                f"[DMX CANVAS] {status} for '{song_filename}' — "
+                f"frames={self.canvas.total_frames} fps={self.canvas.fps} valid_through={self._canvas_valid_through()}"
+                f"{self._canvas_profile_log_suffix() if source != 'cache' else ''}",
                 flush=True,
             )
-            self._dump_canvas_debug(song_filename)
+            if source == "cache":
+                self._dump_canvas_debug(song_filename)
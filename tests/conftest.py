@@ -0,0 +1,63 @@
+import json
+import shutil
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import pytest
+
+from store.state import StateManager
+
+
+BACKEND_PATH = Path(__file__).resolve().parents[1] / "backend"
+
+
+@pytest.fixture
+def make_state_manager(tmp_path: Path) -> Callable[..., Awaitable[StateManager]]:
+    """Factory for a StateManager on the repo rig that only writes under tmp_path.
+
+    Songs, cues and meta live in tmp_path and the backend path is tmp_path/backend, so cue
+    sheet saves, POI edits and debug dumps stay out of the repo; fixtures and chasers are
+    read from the repo. cues writes an `alpha-song` with that cue sheet; pois replaces the
+    repo POIs.
+    """
+
+    async def make(
+        *,
+        cues: Optional[List[Dict[str, Any]]] = None,
+        pois: Optional[List[Dict[str, Any]]] = None,
+    ) -> StateManager:
+        backend_path = tmp_path / "backend"
+        for path in (tmp_path / "songs", tmp_path / "cues", tmp_path / "meta", backend_path / "cues", backend_path / "fixtures"):
+            path.mkdir(parents=True, exist_ok=True)
+        if cues is not None:
+            (tmp_path / "songs" / "alpha-song.mp3").write_bytes(b"")
+            (tmp_path / "cues" / "alpha-song.json").write_text(json.dumps(cues))
+        pois_path = backend_path / "fixtures" / "pois.json"
+        if pois is None:
+            shutil.copyfile(BACKEND_PATH / "fixtures" / "pois.json", pois_path)
+        else:
+            pois_path.write_text(json.dumps(pois))
+
+        state_manager = StateManager(backend_path, tmp_path / "songs", tmp_path / "cues", tmp_path / "meta")
+        state_manager.chasers_dir = BACKEND_PATH / "chasers"
+        await state_manager.load_fixtures(BACKEND_PATH / "fixtures" / "fixtures.json")
+        return state_manager
+
+    return make
+
+
+@pytest.fixture
+def canvas_render_kwargs() -> Callable[..., Dict[str, Any]]:
+    """Render function kwargs for a state manager's rig: no chasers, 120 BPM, 50 FPS."""
+
+    def render_kwargs(state_manager: StateManager, song_length_seconds: float = 10.0) -> Dict[str, Any]:
+        return {
+            "fixtures": state_manager.fixtures,
+            "chasers": [],
+            "bpm": 120.0,
+            "song_length_seconds": song_length_seconds,
+            "fps": 50,
+            "apply_arm": state_manager._apply_arm,
+        }
+
+    return render_kwargs
@@ -0,0 +1,230 @@
+"""Render benchmark over synthetic cue sheets.
+
+Run from the repo root:
+
+    PYTHONPATH=.:./backend python -m tests.render_benchmark --sizes 100 1000 10000 50000 --output render_benchmark.json
+
+Each size builds a deterministic cue sheet mixing parcan flashes, moving-head sweeps and
+orbits, and static plus dynamic chasers, then times the song render, the cue expansion,
+an effect preview and a chaser preview. Results (seconds, frames/sec, peak traced memory)
+are written as JSON tagged with the current commit so runs can be diffed across commits.
+"""
+
+import argparse
+import json
+import platform
+import random
+import subprocess
+import time
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Tuple
+
+from models.chasers import ChaserDefinition
+from models.cues import CueEntry, CueSheet
+from store.services.canvas_render_core import iter_cues_for_render
+from store.services.canvas_preview import render_preview_canvas
+from store.services.canvas_rendering import render_cue_sheet_to_canvas
+from store.state import StateManager
+from store.state_manager.constants import FPS
+from tests.fixture_effect_matrix import FIXTURES_PATH, POIS, WORKSPACE_ROOT, build_state_manager
+
+DEFAULT_SIZES = [100, 1000, 10000, 50000]
+BPM = 120.0
+SEED = 1337
+SECONDS_PER_CUE = 0.25
+MIN_SONG_SECONDS = 30.0
+MAX_SONG_SECONDS = 1200.0
+PARCANS = ["parcan_l", "parcan_r", "parcan_pl", "parcan_pr"]
+MOVING_HEADS = ["mini_beam_prism_l", "head_el150"]
+CHASERS = [
+    ChaserDefinition(
+        id="bench_static",
+        name="Bench Static",
+        description="Left-to-right parcan flash chase.",
+        effects=[
+            {"beat": float(index) * 0.5, "fixture_id": fixture_id, "effect": "flash", "duration": 0.5, "data": {}}
+            for index, fixture_id in enumerate(PARCANS)
+        ],
+    ),
+    ChaserDefinition(
+        id="bench_dynamic",
+        name="Bench Dynamic",
+        description="Sine wave across the parcans.",
+        type="dynamic",
+        generator_id="dynamic_wave_generator",
+        default_params={"fixtures": PARCANS, "duration_beats": 2.0, "step_size": 0.25, "fade_in_beats": 0.5, "fade_out_beats": 0.5},
+    ),
+]
+
+
+def song_seconds_for(size: int) -> float:
+    return min(MAX_SONG_SECONDS, max(MIN_SONG_SECONDS, size * SECONDS_PER_CUE))
+
+
+def synthetic_cue_sheet(size: int, song_seconds: float, seed: int = SEED) -> CueSheet:
+    """Deterministic cue sheet of `size` rows spread over the song."""
+    rng = random.Random(seed + size)
+    entries: List[CueEntry] = []
+    for _ in range(size):
+        time_s = round(rng.uniform(0.0, song_seconds - 4.0), 3)
+        roll = rng.random()
+        if roll < 0.45:
+            entries.append(CueEntry(time=time_s, fixture_id=rng.choice(PARCANS), effect="flash", duration=round(rng.uniform(0.1, 0.5), 3), data={}))
+        elif roll < 0.65:
+            entries.append(CueEntry(
+                time=time_s,
+                fixture_id=rng.choice(MOVING_HEADS),
+                effect="sweep",
+                duration=2.0,
+                data={"subject_POI": "subject", "start_POI": "start", "end_POI": "end", "duration": 2.0, "easing": 0.5, "dimmer_easing": 0.0, "max_dim": 1.0},
+            ))
+        elif roll < 0.85:
+            entries.append(CueEntry(
+                time=time_s,
+                fixture_id=rng.choice(MOVING_HEADS),
+                effect="orbit",
+                duration=2.0,
+                data={"subject_POI": "subject", "start_POI": "start", "orbits": 1.0, "easing": "late_focus"},
+            ))
+        elif roll < 0.95:
+            entries.append(CueEntry(time=time_s, chaser_id="bench_static", data={"repetitions": 1}))
+        else:
+            entries.append(CueEntry(time=time_s, chaser_id="bench_dynamic", data={"repetitions": 1}))
+    entries.sort(key=lambda entry: entry.time)
+    return CueSheet(song_filename=f"bench_{size}", entries=entries)
+
+
+def _measure(fn: Callable[[], Any], *, memory: bool) -> Tuple[Any, Dict[str, Any]]:
+    started = time.perf_counter()
+    result = fn()
+    stats: Dict[str, Any] = {"seconds": round(time.perf_counter() - started, 4)}
+    if memory:
+        # Separate traced pass: tracemalloc slows allocation-heavy code too much to time under it.
+        tracemalloc.start()
+        try:
+            fn()
+            stats["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result, stats
+
+
+def _per_second(count: int, seconds: float) -> float:
+    return round(count / seconds, 1) if seconds > 0 else 0.0
+
+
+async def prepare_state_manager() -> StateManager:
+    state_manager = build_state_manager()
+    await state_manager.load_fixtures(FIXTURES_PATH)
+    state_manager.poi_db.pois = POIS
+    state_manager.chasers = list(CHASERS)
+    state_manager.current_song = SimpleNamespace(song_id="render_benchmark", meta=SimpleNamespace(bpm=BPM))
+    return state_manager
+
+
+def benchmark_size(state_manager: StateManager, size: int, *, memory: bool = True) -> Dict[str, Any]:
+    song_seconds = song_seconds_for(size)
+    cue_sheet = synthetic_cue_sheet(size, song_seconds)
+    render_kwargs = {
+        "fixtures": state_manager.fixtures,
+        "cue_sheet": cue_sheet,
+        "chasers": state_manager.chasers,
+        "bpm": BPM,
+        "song_length_seconds": song_seconds,
+        "fps": FPS,
+        "apply_arm": state_manager._apply_arm,
+    }
+
+    cues, expand_stats = _measure(lambda: iter_cues_for_render(cue_sheet, state_manager.fixtures, FPS, state_manager.chasers, BPM), memory=memory)
+    expand_stats["render_cues"] = len(cues)
+    expand_stats["cues_per_second"] = _per_second(len(cues), expand_stats["seconds"])
+
+    canvas, render_stats = _measure(lambda: render_cue_sheet_to_canvas(**render_kwargs), memory=memory)
+    render_stats["frames"] = canvas.total_frames
+    render_stats["frames_per_second"] = _per_second(canvas.total_frames, render_stats["seconds"])
+
+    head = next(fixture for fixture in state_manager.fixtures if fixture.id == "head_el150")
+    base_universe = bytearray(canvas.frame_view(0))
+    preview, preview_stats = _measure(
+        lambda: render_preview_canvas(
+            fixture=head,
+            effect="sweep",
+            duration=8.0,
+            data={"subject_POI": "subject", "start_POI": "start", "end_POI": "end", "duration": 8.0, "easing": 0.5, "dimmer_easing": 0.0, "max_dim": 1.0},
+            base_universe=base_universe,
+            fps=FPS,
+        ),
+        memory=memory,
+    )
+    preview_stats["frames"] = preview.total_frames
+    preview_stats["frames_per_second"] = _per_second(preview.total_frames, preview_stats["seconds"])
+
+    chaser_entries = state_manager.expand_chaser_entries("bench_dynamic", 0.0, max(1, size // 100), BPM)
+    chaser_preview, chaser_stats = _measure(
+        lambda: state_manager._render_preview_chaser_canvas(chaser_entries, base_universe),
+        memory=memory,
+    )
+    chaser_stats["entries"] = len(chaser_entries)
+    chaser_stats["frames"] = chaser_preview.total_frames
+    chaser_stats["frames_per_second"] = _per_second(chaser_preview.total_frames, chaser_stats["seconds"])
+
+    return {
+        "size": size,
+        "song_seconds": song_seconds,
+        "iter_cues_for_render": expand_stats,
+        "render_cue_sheet_to_canvas": render_stats,
+        "render_preview_canvas": preview_stats,
+        "render_preview_chaser_canvas": chaser_stats,
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=WORKSPACE_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run_benchmark(sizes: List[int], *, memory: bool = True) -> Dict[str, Any]:
+    state_manager = await prepare_state_manager()
+    results = []
+    for size in sizes:
+        result = benchmark_size(state_manager, size, memory=memory)
+        render = result["render_cue_sheet_to_canvas"]
+        print(
+            f"[BENCH] size={size} frames={render['frames']} render={render['seconds']}s "
+            f"({render['frames_per_second']} frames/s) peak={render.get('peak_bytes', '-')}",
+            flush=True,
+        )
+        results.append(result)
+    return {
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "fps": FPS,
+        "bpm": BPM,
+        "seed": SEED,
+        "results": results,
+    }
+
+
+def main(argv: List[str] | None = None) -> None:
+    import asyncio
+
+    parser = argparse.ArgumentParser(description="Benchmark DMX canvas rendering on synthetic cue sheets.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--output", default=str(WORKSPACE_ROOT / "render_benchmark.json"))
+    parser.add_argument("--no-memory", action="store_true", help="skip the traced peak-memory pass")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run_benchmark(args.sizes, memory=not args.no_memory))
+    with open(args.output, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2)
+        handle.write("\n")
+    print(f"[BENCH] wrote {args.output}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
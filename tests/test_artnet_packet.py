@@ -0,0 +1,151 @@
+import pytest
+
+from services.artnet import (
+    ARTDMX_HEADER_SIZE,
+    ARTNET_IP,
+    ARTNET_UNIVERSE,
+    ARTSYNC_PACKET,
+    DMX_CHANNELS,
+    ArtNetService,
+    parse_artnet_outputs,
+)
+
+
+class RecordingSocket:
+    def __init__(self):
+        self.packets = []
+
+    def sendto(self, packet, address):
+        self.packets.append(bytes(packet))
+
+    def close(self):
+        pass
+
+
+def _service() -> ArtNetService:
+    service = ArtNetService()
+    service.sock.close()
+    service.sock = RecordingSocket()
+    return service
+
+
+@pytest.mark.asyncio
+async def test_artdmx_packet_carries_the_universe_in_place():
+    service = _service()
+    universe = bytearray(DMX_CHANNELS)
+    universe[0] = 12
+    universe[511] = 34
+
+    await service.update_universe(universe)
+    await service.send_artnet()
+
+    (packet,) = service.sock.packets
+    assert len(packet) == 530
+    assert packet[:12] == b"Art-Net\x00\x00\x50\x00\x0e"
+    assert packet[14:16] == bytes((ARTNET_UNIVERSE & 0xFF, ARTNET_UNIVERSE >> 8))
+    assert packet[16:18] == b"\x02\x00"
+    assert packet[ARTDMX_HEADER_SIZE:] == bytes(universe)
+    assert service.outputs[0].data.obj is service.outputs[0].packet
+
+
+@pytest.mark.asyncio
+async def test_unwritten_universe_is_not_resent_unless_continuous():
+    service = _service()
+    universe = bytearray(DMX_CHANNELS)
+    universe[5] = 1
+
+    await service.update_universe(universe)
+    await service.send_artnet()
+    await service.send_artnet()
+    assert len(service.sock.packets) == 1
+
+    # Rewriting the same bytes is not a change; set_channel and different bytes are.
+    version = service.output_version
+    await service.update_universe(bytes(universe))
+    await service.send_artnet()
+    assert len(service.sock.packets) == 1
+    assert service.output_version == version
+    await service.set_channel(6, 99)
+    assert service.output_version == version + 1
+    await service.send_artnet()
+    await service.set_continuous_send(True)
+    await service.send_artnet()
+    assert len(service.sock.packets) == 3
+    assert service.sock.packets[1][ARTDMX_HEADER_SIZE + 5] == 99
+
+
+@pytest.mark.asyncio
+async def test_sequence_byte_counts_1_to_255_and_wraps():
+    service = _service()
+    await service.set_continuous_send(True)
+
+    for _ in range(256):
+        await service.send_artnet()
+
+    sequences = [packet[12] for packet in service.sock.packets]
+    assert sequences[:3] == [1, 2, 3]
+    assert sequences[254:] == [255, 1]
+    assert 0 not in sequences
+
+
+def _multi_service() -> ArtNetService:
+    service = ArtNetService(outputs=[("10.0.0.1", 0), ("10.0.0.2", 1), ("10.0.0.2", 2)])
+    service.sock.close()
+    service.sock = RecordingSocket()
+    service.sock.sendto = lambda packet, address: service.sock.packets.append((bytes(packet), address))
+    return service
+
+
+def test_artnet_outputs_parse_node_and_universe():
+    assert parse_artnet_outputs("") == [(ARTNET_IP, ARTNET_UNIVERSE)]
+    assert parse_artnet_outputs("10.0.0.1:4, 10.0.0.2, 10.0.0.3:9") == [("10.0.0.1", 4), ("10.0.0.2", 5), ("10.0.0.3", 9)]
+
+
+@pytest.mark.asyncio
+async def test_multi_universe_frame_routes_each_universe_to_its_node_and_syncs():
+    service = _multi_service()
+    frame = bytearray(3 * DMX_CHANNELS)
+    frame[0] = 1
+    frame[DMX_CHANNELS] = 2
+    frame[2 * DMX_CHANNELS] = 3
+
+    await service.update_universe(frame)
+    await service.send_artnet()
+
+    dmx = [(packet, address) for packet, address in service.sock.packets if packet[8:10] == b"\x00\x50"]
+    syncs = [address for packet, address in service.sock.packets if packet == ARTSYNC_PACKET]
+    assert [(packet[14], packet[ARTDMX_HEADER_SIZE], address[0]) for packet, address in dmx] == [
+        (0, 1, "10.0.0.1"),
+        (1, 2, "10.0.0.2"),
+        (2, 3, "10.0.0.2"),
+    ]
+    assert [address[0] for address in syncs] == ["10.0.0.1", "10.0.0.2"]
+    assert service.sock.packets[-2:] == [(ARTSYNC_PACKET, address) for address in syncs]
+
+
+@pytest.mark.asyncio
+async def test_unchanged_universes_are_skipped_independently():
+    service = _multi_service()
+    await service.update_universe(bytes(3 * DMX_CHANNELS))
+    await service.send_artnet()
+    service.sock.packets.clear()
+
+    await service.set_channel(DMX_CHANNELS + 10, 77)
+    await service.send_artnet()
+
+    dmx = [packet for packet, _address in service.sock.packets if packet[8:10] == b"\x00\x50"]
+    assert [packet[14] for packet in dmx] == [1]
+    assert dmx[0][ARTDMX_HEADER_SIZE + 9] == 77
+
+    service.sock.packets.clear()
+    await service.send_artnet()
+    assert service.sock.packets == []
+
+
+@pytest.mark.asyncio
+async def test_single_output_sends_no_artsync():
+    service = _service()
+    await service.set_channel(1, 5)
+    await service.send_artnet()
+
+    assert ARTSYNC_PACKET not in service.sock.packets
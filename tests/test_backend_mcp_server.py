@@ -87,7 +87,7 @@ class FakeStateManager:
             "entries": list(self._cue_entries),
         }
 
-    async def rerender_dmx_canvas(self):
+    async def rerender_dmx_canvas(self, compact=False):
         return {
             "ok": True,
             "song": self.current_song.song_id,
@@ -99,6 +99,19 @@ class FakeStateManager:
             "dmx_log_path": f"backend/cues/{self.current_song.song_id}.dmx.log",
         }
 
+    async def profile_dmx_canvas(self):
+        return {
+            "ok": True,
+            "song_filename": self.current_song.song_id,
+            "total_frames": self.canvas.total_frames,
+            "render_seconds": 0.01,
+            "profile": {
+                "total_seconds": 0.008,
+                "effects": [{"effect": "flash", "fixture_type": "parcan", "calls": 3, "seconds": 0.008, "frames": 5}],
+                "sources": [{"source": "user", "calls": 3, "seconds": 0.008, "frames": 5}],
+            },
+        }
+
     async def read_fixture_output_window(self, fixture_id: str, start_time: float, end_time: float, max_samples: int = 240):
         del max_samples
         fixture = next((item for item in self.fixtures if item.id == fixture_id), None)
@@ -168,6 +181,24 @@ async def test_render_dmx_canvas_returns_binary_artifact_metadata():
     assert rendered.data["data"]["dmx_log_path"].endswith(f"{TEST_SONG}.dmx.log")
 
 
+@pytest.mark.asyncio
+async def test_profile_dmx_canvas_returns_render_profile():
+    meta_path = Path(__file__).resolve().parents[1] / "data" / "output"
+    song_service = FakeSongService(meta_path)
+    state_manager = FakeStateManager(meta_path)
+    ws_manager = FakeWsManager(state_manager, song_service)
+    runtime = BackendMcpRuntime()
+    runtime.attach(ws_manager, song_service)
+    mcp = create_backend_mcp(runtime)
+
+    async with Client(mcp) as client:
+        profiled = await client.call_tool("profile_dmx_canvas", {})
+
+    assert profiled.data["ok"] is True
+    assert profiled.data["data"]["profile"]["effects"][0]["effect"] == "flash"
+    assert profiled.data["data"]["profile"]["sources"][0]["source"] == "user"
+
+
 @pytest.mark.asyncio
 async def test_backend_mcp_tools_cover_song_metadata_and_cues():
     meta_path = Path(__file__).resolve().parents[1] / "data" / "output"
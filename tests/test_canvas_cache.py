@@ -0,0 +1,62 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from store.dmx_canvas import DMXCanvas
+from store.services.canvas_cache import load_cached_canvas, store_cached_canvas
+from store.state import StateManager
+
+
+def test_cached_canvas_round_trips_only_for_its_key(tmp_path: Path):
+    canvas = DMXCanvas.allocate(fps=50, total_frames=3)
+    canvas.buffer[512 + 7] = 200
+    path = store_cached_canvas(tmp_path / "song.canvas.dmx", b"k" * 16, canvas)
+
+    loaded = load_cached_canvas(path, b"k" * 16)
+
+    assert loaded is not None
+    assert (loaded.fps, loaded.total_frames, loaded.to_bytearray()) == (50, 3, canvas.buffer)
+    assert load_cached_canvas(path, b"x" * 16) is None
+    assert load_cached_canvas(tmp_path / "missing.canvas.dmx", b"k" * 16) is None
+
+
+@pytest.mark.asyncio
+async def test_load_song_reuses_cached_canvas_until_an_input_changes(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr("store.state_manager.core.canvas_lifecycle.CANVAS_STREAM_LEAD_SECONDS", 0)
+    backend_path = Path(__file__).resolve().parents[1] / "backend"
+    for name in ["songs", "cues", "meta"]:
+        (tmp_path / name).mkdir()
+    (tmp_path / "songs" / "alpha-song.mp3").write_bytes(b"")
+    cue_path = tmp_path / "cues" / "alpha-song.json"
+    cue_path.write_text(json.dumps([
+        {"time": 0.0, "fixture_id": "parcan_l", "effect": "set_channels", "duration": 0.0, "data": {"channels": {"red": 255}}},
+    ]))
+
+    state_manager = StateManager(backend_path, tmp_path / "songs", tmp_path / "cues", tmp_path / "meta")
+    await state_manager.load_fixtures(backend_path / "fixtures" / "fixtures.json")
+    renders = []
+    render = state_manager._render_cue_sheet_to_canvas
+    state_manager._render_cue_sheet_to_canvas = lambda *args: renders.append(1) or render(*args)
+
+    await state_manager.load_song("alpha-song")
+    rendered = bytes(state_manager.canvas.to_bytearray())
+    await state_manager.load_song("alpha-song")
+
+    assert len(renders) == 1
+    assert bytes(state_manager.canvas.to_bytearray()) == rendered
+    assert state_manager.canvas.cue_signatures
+
+    # A cached (memory-mapped) canvas still takes incremental cue-edit re-renders.
+    state_manager.cue_sheet.entries[0].data["channels"]["green"] = 255
+    async with state_manager.lock:
+        await state_manager._refresh_canvas_after_cue_change()
+    assert state_manager.canvas.is_flat
+    assert bytes(state_manager.canvas.to_bytearray()) != rendered
+
+    cue_path.write_text(json.dumps([
+        {"time": 0.0, "fixture_id": "parcan_l", "effect": "set_channels", "duration": 0.0, "data": {"channels": {"blue": 255}}},
+    ]))
+    await state_manager.load_song("alpha-song")
+
+    assert len(renders) == 2
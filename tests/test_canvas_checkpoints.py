@@ -0,0 +1,95 @@
+from pathlib import Path
+
+import pytest
+
+from models.cues import CueSheet
+from store.services.canvas_checkpoints import (
+    CanvasCheckpoint,
+    checkpoint_frames,
+    nearest_checkpoint,
+    remap_checkpoints,
+)
+from store.services.canvas_incremental import rerender_cue_sheet_window
+from store.services.canvas_rendering import render_cue_sheet_to_canvas
+from store.state import StateManager
+
+
+BACKEND_PATH = Path(__file__).resolve().parents[1] / "backend"
+
+
+async def _render_kwargs(tmp_path: Path) -> dict:
+    for name in ["songs", "cues", "meta"]:
+        (tmp_path / name).mkdir()
+    state_manager = StateManager(BACKEND_PATH, tmp_path / "songs", tmp_path / "cues", tmp_path / "meta")
+    await state_manager.load_fixtures(BACKEND_PATH / "fixtures" / "fixtures.json")
+    return {
+        "fixtures": state_manager.fixtures,
+        "chasers": [],
+        "bpm": 120.0,
+        "song_length_seconds": 20.0,
+        "fps": 50,
+        "apply_arm": state_manager._apply_arm,
+        "checkpoint_seconds": [6.5],
+    }
+
+
+def _entries() -> list[dict]:
+    return [
+        {"time": 1.0, "fixture_id": "head_el150", "effect": "fade_in", "duration": 15.0, "data": {"dim": 200}},
+        {"time": 2.0, "fixture_id": "parcan_l", "effect": "strobe", "duration": 12.0, "data": {"rate": 6.0}},
+        {"time": 12.0, "fixture_id": "head_el150", "effect": "flash", "duration": 1.0, "data": {}},
+    ]
+
+
+def test_checkpoint_frames_merge_interval_grid_and_boundaries():
+    frames = checkpoint_frames(total_frames=1001, fps=50, interval_seconds=4.0, boundary_seconds=[1.0, 8.0, 30.0, "x"])
+
+    assert frames == [50, 200, 400, 600, 800, 1000]
+
+
+def test_nearest_checkpoint_picks_latest_at_or_before_frame():
+    checkpoints = [CanvasCheckpoint(frame=frame, active=()) for frame in (100, 200, 300)]
+
+    assert nearest_checkpoint(checkpoints, 99) is None
+    assert nearest_checkpoint(checkpoints, 200).frame == 200
+    assert nearest_checkpoint(checkpoints, 299).frame == 200
+
+
+def test_remap_checkpoints_matches_duplicate_cues_by_occurrence():
+    old = [("a",), ("b",), ("b",)]
+    new = [("x",), ("a",), ("b",), ("b",)]
+    checkpoints = [CanvasCheckpoint(frame=10, active=((2, {"n": 2}),)), CanvasCheckpoint(frame=20, active=((1, {}),))]
+
+    remapped = remap_checkpoints(checkpoints, old, new)
+    assert [(checkpoint.frame, checkpoint.active) for checkpoint in remapped] == [(10, ((3, {"n": 2}),)), (20, ((2, {}),))]
+
+    # A cue that no longer exists drops out of the checkpoint; the rest of the rig keeps its state.
+    assert remap_checkpoints(checkpoints, old, [("a",), ("b",)]) == [CanvasCheckpoint(frame=10, active=()), CanvasCheckpoint(frame=20, active=((1, {}),))]
+
+
+@pytest.mark.asyncio
+async def test_full_render_records_checkpoints_with_running_cue_state(tmp_path: Path):
+    kwargs = await _render_kwargs(tmp_path)
+    canvas = render_cue_sheet_to_canvas(cue_sheet=CueSheet(song_filename="song", entries=_entries()), **kwargs)
+
+    assert [checkpoint.frame for checkpoint in canvas.checkpoints] == [200, 325, 400, 600, 800, 1000]
+    checkpoint = nearest_checkpoint(canvas.checkpoints, 400)
+    assert len(checkpoint.active) == 2
+    assert all(state for _index, state in checkpoint.active)
+
+
+@pytest.mark.asyncio
+async def test_rerender_resumes_from_checkpoint_inside_running_cues(tmp_path: Path):
+    kwargs = await _render_kwargs(tmp_path)
+    previous = render_cue_sheet_to_canvas(cue_sheet=CueSheet(song_filename="song", entries=_entries()), **kwargs)
+
+    entries = _entries()
+    entries[2]["data"] = {"color": "#0000ff"}
+    cue_sheet = CueSheet(song_filename="song", entries=entries)
+    canvas, window = rerender_cue_sheet_window(previous=previous, cue_sheet=cue_sheet, **kwargs)
+    full = render_cue_sheet_to_canvas(cue_sheet=cue_sheet, **kwargs)
+
+    assert bytes(canvas.buffer) == bytes(full.buffer)
+    # The flash sits inside the same head's running fade_in; without checkpoints it would restart at frame 50.
+    assert window[0] == 600
+    assert [checkpoint.frame for checkpoint in canvas.checkpoints] == [checkpoint.frame for checkpoint in full.checkpoints]
@@ -0,0 +1,83 @@
+import threading
+from pathlib import Path
+
+from store.dmx_canvas import DMXCanvas
+from store.services.canvas_binary_compact import read_compact_canvas_dmxp
+from store.services.canvas_debug import DEBUG_CHANNEL_RANGE, parse_debug_channel_range
+from store.services.canvas_debug_exporter import CanvasDebugExporter
+
+
+def _canvas() -> DMXCanvas:
+    canvas = DMXCanvas.allocate(fps=50, total_frames=6)
+    for frame_index in range(2, 6):
+        universe = bytearray(512)
+        universe[0] = 10 * frame_index
+        universe[3] = 0xAB
+        universe[40] = frame_index
+        canvas.set_frame(frame_index, universe)
+    return canvas
+
+
+def test_debug_dumps_are_off_by_default(tmp_path: Path):
+    exporter = CanvasDebugExporter(tmp_path)
+
+    assert not exporter.submit("song", _canvas(), 64)
+    exporter.wait()
+    assert not (tmp_path / "cues").exists()
+
+
+def test_text_dump_limits_channels_and_skips_silent_frames(tmp_path: Path):
+    exporter = CanvasDebugExporter(tmp_path, "log", "2-4")
+
+    assert exporter.submit("song", _canvas(), 64)
+    exporter.wait()
+
+    lines = (tmp_path / "cues" / "song.dmx.log").read_text().splitlines()
+    assert lines == [f"[{frame_index / 50:.3f}] 00.00.AB" for frame_index in range(2, 6)]
+
+
+def test_binary_dump_round_trips_the_channel_range(tmp_path: Path):
+    exporter = CanvasDebugExporter(tmp_path, "binary")
+    canvas = _canvas()
+
+    exporter.submit("song", canvas, 32)
+    exporter.wait()
+
+    runs, reserved = read_compact_canvas_dmxp((tmp_path / "cues" / "song.dmx.bin").read_bytes())
+    assert DEBUG_CHANNEL_RANGE.unpack_from(reserved) == (1, 32)
+    for frame_index in range(canvas.total_frames):
+        dumped = bytes(runs.frame_view(frame_index))
+        assert dumped[:32] == bytes(canvas.frame_view(frame_index))[:32]
+        assert dumped[32:] == bytes(480)
+
+
+def test_rapid_dumps_coalesce_to_the_latest_canvas(tmp_path: Path, monkeypatch):
+    started = threading.Event()
+    release = threading.Event()
+    written = []
+
+    def blocking_dump(**kwargs):
+        written.append(kwargs["canvas"])
+        started.set()
+        release.wait(5)
+
+    monkeypatch.setattr("store.services.canvas_debug_exporter.dump_named_canvas_debug", blocking_dump)
+    exporter = CanvasDebugExporter(tmp_path, "log")
+    canvases = [_canvas() for _ in range(4)]
+
+    exporter.submit("song", canvases[0], 64)
+    started.wait(5)
+    for canvas in canvases[1:]:
+        exporter.submit("song", canvas, 64)
+    release.set()
+    exporter.wait(5)
+
+    assert [id(canvas) for canvas in written] == [id(canvases[0]), id(canvases[3])]
+
+
+def test_debug_channel_range_parsing():
+    assert parse_debug_channel_range("", 48) == (1, 48)
+    assert parse_debug_channel_range("16", 48) == (1, 16)
+    assert parse_debug_channel_range("10-20", 48) == (10, 20)
+    assert parse_debug_channel_range("20-900", 48) == (20, 512)
+    assert parse_debug_channel_range("bad", 48) == (1, 48)
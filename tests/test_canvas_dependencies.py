@@ -0,0 +1,117 @@
+import asyncio
+import copy
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from models.cues import CueSheet
+from store.services.canvas_dependencies import cue_render_signature, poi_dependents
+from store.services.canvas_incremental import rerender_cue_sheet_window
+from store.services.canvas_rendering import render_cue_sheet_to_canvas
+
+
+POIS = [
+    {"id": "stage", "location": {"x": 0.5, "y": 0.5, "z": 0.0}, "fixtures": {"head_el150": {"pan": 30000, "tilt": 36000}}},
+    {"id": "door", "fixtures": {"head_el150": {"pan": 6000, "tilt": 10000}}},
+]
+CUES = [
+    {"time": 0.5, "fixture_id": "parcan_l", "effect": "fade_in", "duration": 1.0, "data": {"red": 255}},
+    {"time": 1.0, "fixture_id": "head_el150", "effect": "move_to_poi", "duration": 1.0, "data": {"target_POI": "stage"}},
+    {"time": 4.0, "fixture_id": "head_el150", "effect": "move_to_poi", "duration": 1.0, "data": {"target_POI": "door"}},
+]
+
+
+@pytest.mark.asyncio
+async def test_poi_edit_changes_only_the_signatures_of_cues_that_read_it(make_state_manager):
+    state_manager = await make_state_manager(cues=CUES, pois=POIS)
+    cue_sheet = CueSheet(song_filename="song", entries=CUES)
+    before = [cue_render_signature(0, 0, entry) for entry in cue_sheet.entries]
+
+    await state_manager.update_fixture_poi_target("head_el150", "stage", 41000, 20000)
+    after = [cue_render_signature(0, 0, entry) for entry in cue_sheet.entries]
+
+    assert [left == right for left, right in zip(before, after)] == [True, False, True]
+    assert poi_dependents(before, "stage") == {"head_el150": 1}
+    assert poi_dependents(before, "nowhere") == {}
+
+
+@pytest.mark.asyncio
+async def test_rerender_after_poi_edit_matches_full_render(make_state_manager, canvas_render_kwargs):
+    state_manager = await make_state_manager(cues=CUES, pois=POIS)
+    kwargs = canvas_render_kwargs(state_manager, song_length_seconds=6.0)
+    cue_sheet = CueSheet(song_filename="song", entries=CUES)
+    previous = render_cue_sheet_to_canvas(cue_sheet=cue_sheet, **kwargs)
+
+    await state_manager.update_fixture_poi_target("head_el150", "stage", 41000, 20000)
+    canvas, window = rerender_cue_sheet_window(previous=previous, cue_sheet=cue_sheet, **kwargs)
+    full = render_cue_sheet_to_canvas(cue_sheet=cue_sheet, **kwargs)
+
+    assert bytes(canvas.buffer) == bytes(full.buffer)
+    assert bytes(canvas.buffer) != bytes(previous.buffer)
+    # Only the move toward the edited POI re-renders; frames before it are kept.
+    assert window is not None and window[0] == 50
+
+
+@pytest.mark.asyncio
+async def test_snapshot_render_signatures_use_the_snapshot_pois(make_state_manager, canvas_render_kwargs):
+    state_manager = await make_state_manager(cues=CUES, pois=POIS)
+    kwargs = canvas_render_kwargs(state_manager, song_length_seconds=6.0)
+    cue_sheet = CueSheet(song_filename="song", entries=CUES)
+    snapshot_pois = copy.deepcopy(state_manager.pois)
+    expected = render_cue_sheet_to_canvas(cue_sheet=cue_sheet, **kwargs)
+
+    # The POI is edited while a render works from the snapshot taken before the edit.
+    await state_manager.update_fixture_poi_target("head_el150", "stage", 41000, 20000)
+    previous = render_cue_sheet_to_canvas(cue_sheet=cue_sheet, pois=snapshot_pois, **kwargs)
+    canvas, window = rerender_cue_sheet_window(previous=previous, cue_sheet=cue_sheet, pois=copy.deepcopy(state_manager.pois), **kwargs)
+
+    assert bytes(previous.buffer) == bytes(expected.buffer)
+    assert previous.cue_signatures == expected.cue_signatures
+    assert window is not None
+    assert bytes(canvas.buffer) == bytes(render_cue_sheet_to_canvas(cue_sheet=cue_sheet, **kwargs).buffer)
+
+
+@pytest.mark.asyncio
+async def test_poi_edit_refreshes_the_loaded_song_canvas_in_the_background(make_state_manager, monkeypatch):
+    monkeypatch.setattr("store.state_manager.core.canvas_lifecycle.CANVAS_STREAM_LEAD_SECONDS", 0)
+    monkeypatch.setattr("store.state_manager.core.canvas_lifecycle.CANVAS_CACHE_ENABLED", False)
+    state_manager = await make_state_manager(cues=CUES, pois=POIS)
+    await state_manager.load_song("alpha-song")
+    head = next(fixture for fixture in state_manager.fixtures if fixture.id == "head_el150")
+    pan_offset = head._absolute_channel("pan_msb") - 1 if "pan_msb" in head.channels else head._absolute_channel("pan") - 1
+    before = bytes(state_manager.canvas.frame_view(state_manager.canvas.total_frames - 1))
+
+    assert state_manager.refresh_canvas_for_poi("nowhere") == {}
+    assert state_manager.canvas_refresh_task is None
+
+    await state_manager.update_fixture_poi_target("head_el150", "door", 60000, 10000)
+    await state_manager.canvas_refresh_task
+
+    after = bytes(state_manager.canvas.frame_view(state_manager.canvas.total_frames - 1))
+    assert after[pan_offset] != before[pan_offset]
+    assert not state_manager.canvas_dirty
+
+
+@pytest.mark.asyncio
+async def test_fixture_reload_re_renders_the_loaded_song_canvas(make_state_manager, monkeypatch, tmp_path: Path):
+    monkeypatch.setattr("store.state_manager.core.canvas_lifecycle.CANVAS_STREAM_LEAD_SECONDS", 0)
+    monkeypatch.setattr("store.state_manager.core.canvas_lifecycle.CANVAS_CACHE_ENABLED", False)
+    state_manager = await make_state_manager(cues=CUES, pois=POIS)
+    await state_manager.load_song("alpha-song")
+    assert state_manager.canvas.universe_count == 1
+
+    rig = tmp_path / "rig"
+    shutil.copytree(state_manager.fixtures_path.parent, rig)
+    fixtures = json.loads((rig / "fixtures.json").read_text())
+    next(entry for entry in fixtures if entry["id"] == "parcan_l")["universe"] = 1
+    (rig / "fixtures.json").write_text(json.dumps(fixtures))
+    await state_manager.load_fixtures(rig / "fixtures.json")
+    await state_manager.canvas_refresh_task
+
+    parcan = next(fixture for fixture in state_manager.fixtures if fixture.id == "parcan_l")
+    red = bytes(state_manager.canvas.frame_view(state_manager.canvas.total_frames - 1))[parcan._absolute_channel("red") - 1]
+    assert state_manager.canvas.universe_count == 2
+    assert parcan._absolute_channel("red") > 512 and red == 255
+    assert not state_manager.canvas_dirty
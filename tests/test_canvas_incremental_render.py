@@ -0,0 +1,100 @@
+import pytest
+
+from models.cues import CueSheet
+from store.services.canvas_incremental import rerender_cue_sheet_window
+from store.services.canvas_rendering import render_cue_sheet_to_canvas
+
+
+def _entries() -> list[dict]:
+    return [
+        {"time": 0.0, "fixture_id": "parcan_l", "effect": "set_channels", "duration": 0.0, "data": {"channels": {"red": 255}}},
+        {"time": 1.0, "fixture_id": "parcan_r", "effect": "fade_in", "duration": 1.0, "data": {"blue": 200}},
+        {"time": 3.0, "fixture_id": "parcan_l", "effect": "flash", "duration": 0.5, "data": {}},
+        {"time": 5.0, "fixture_id": "parcan_pl", "effect": "strobe", "duration": 1.0, "data": {"rate": 8.0}},
+        {"time": 7.0, "fixture_id": "head_el150", "effect": "move_to", "duration": 1.0, "data": {"pan": 40000, "tilt": 20000}},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_rerender_window_matches_full_render_and_stops_after_change(make_state_manager, canvas_render_kwargs):
+    state_manager = await make_state_manager()
+    kwargs = canvas_render_kwargs(state_manager)
+    previous = render_cue_sheet_to_canvas(cue_sheet=CueSheet(song_filename="song", entries=_entries()), **kwargs)
+
+    entries = _entries()
+    entries[3]["data"] = {"rate": 4.0}
+    cue_sheet = CueSheet(song_filename="song", entries=entries)
+
+    canvas, window = rerender_cue_sheet_window(previous=previous, cue_sheet=cue_sheet, **kwargs)
+    full = render_cue_sheet_to_canvas(cue_sheet=cue_sheet, **kwargs)
+
+    assert bytes(canvas.buffer) == bytes(full.buffer)
+    assert window is not None
+    # The strobe restores its on-state at its end frame, so output converges right after it.
+    assert window == (250, 300)
+    assert bytes(previous.frame_view(249)) == bytes(canvas.frame_view(249))
+
+
+@pytest.mark.asyncio
+async def test_rerender_window_walks_back_over_running_cues(make_state_manager, canvas_render_kwargs):
+    state_manager = await make_state_manager()
+    kwargs = canvas_render_kwargs(state_manager)
+    previous = render_cue_sheet_to_canvas(cue_sheet=CueSheet(song_filename="song", entries=_entries()), **kwargs)
+
+    entries = _entries() + [
+        {"time": 1.5, "fixture_id": "parcan_r", "effect": "set_channels", "duration": 0.0, "data": {"channels": {"green": 90}}},
+    ]
+    cue_sheet = CueSheet(song_filename="song", entries=entries)
+
+    canvas, window = rerender_cue_sheet_window(previous=previous, cue_sheet=cue_sheet, **kwargs)
+    full = render_cue_sheet_to_canvas(cue_sheet=cue_sheet, **kwargs)
+
+    assert bytes(canvas.buffer) == bytes(full.buffer)
+    assert window is not None
+    # The new cue lands inside the running fade_in, which has to restart from its own start frame.
+    assert window[0] == 50
+
+
+@pytest.mark.asyncio
+async def test_rerender_window_reports_no_change_and_full_render_on_length_change(make_state_manager, canvas_render_kwargs):
+    state_manager = await make_state_manager()
+    kwargs = canvas_render_kwargs(state_manager)
+    cue_sheet = CueSheet(song_filename="song", entries=_entries())
+    previous = render_cue_sheet_to_canvas(cue_sheet=cue_sheet, **kwargs)
+
+    canvas, window = rerender_cue_sheet_window(previous=previous, cue_sheet=cue_sheet, **kwargs)
+    assert window is None
+    assert bytes(canvas.buffer) == bytes(previous.buffer)
+
+    kwargs["song_length_seconds"] = 12.0
+    canvas, window = rerender_cue_sheet_window(previous=previous, cue_sheet=cue_sheet, **kwargs)
+    assert window == (0, canvas.total_frames - 1)
+
+
+@pytest.mark.asyncio
+async def test_cue_edit_refreshes_canvas_incrementally(make_state_manager):
+    state_manager = await make_state_manager()
+    state_manager.cue_sheet = CueSheet(song_filename="song", entries=_entries())
+    state_manager.song_length_seconds = 10.0
+    state_manager.canvas = state_manager._render_cue_sheet_to_canvas()
+
+    result = await state_manager.add_effect_cue_entry(4.0, "parcan_r", "full", 0.0, {})
+
+    assert result["ok"] is True
+    assert bytes(state_manager.canvas.buffer) == bytes(state_manager._render_cue_sheet_to_canvas().buffer)
+
+
+@pytest.mark.asyncio
+async def test_rerender_window_leaves_other_fixture_layers_untouched(make_state_manager, canvas_render_kwargs):
+    state_manager = await make_state_manager()
+    kwargs = canvas_render_kwargs(state_manager)
+    previous = render_cue_sheet_to_canvas(cue_sheet=CueSheet(song_filename="song", entries=_entries()), **kwargs)
+    # Mark parcan_l's red channel (offset 15) across the whole song; a re-render of its layer would overwrite the mark.
+    previous.buffer[15::512] = bytes([7]) * previous.total_frames
+
+    entries = _entries()
+    entries[3]["data"] = {"rate": 4.0}
+    canvas, window = rerender_cue_sheet_window(previous=previous, cue_sheet=CueSheet(song_filename="song", entries=entries), **kwargs)
+
+    assert window == (250, 300)
+    assert bytes(canvas.buffer[15::512]) == bytes([7]) * canvas.total_frames
@@ -0,0 +1,104 @@
+from pathlib import Path
+
+import pytest
+
+from models.cues import CueSheet
+from store.dmx_canvas import DMX_CHANNELS
+from store.pois import PoiStore
+from store.services.canvas_layers import build_fixture_layers, split_cue_indices_by_layer
+from store.services.canvas_parallel import render_cue_sheet_to_canvas_parallel
+from store.services.canvas_rendering import render_cue_sheet_to_canvas
+
+
+POIS = [
+    {"id": "stage", "fixtures": {"head_el150": {"pan": 30000, "tilt": 12000}, "mini_beam_prism_l": {"pan": 20000, "tilt": 9000}}},
+    {"id": "crowd", "fixtures": {"head_el150": {"pan": 50000, "tilt": 30000}, "mini_beam_prism_l": {"pan": 45000, "tilt": 26000}}},
+]
+
+
+def _cue_sheet() -> CueSheet:
+    return CueSheet(
+        song_filename="song",
+        entries=[
+            {"time": 0.5, "fixture_id": "parcan_l", "effect": "fade_in", "duration": 2.0, "data": {"red": 200, "blue": 40}},
+            {"time": 1.0, "fixture_id": "parcan_r", "effect": "strobe", "duration": 1.5, "data": {"rate": 10.0}},
+            {"time": 1.2, "fixture_id": "parcan_pl", "effect": "color_fade", "duration": 3.0, "data": {"start_color": "#ff0000", "end_color": "#0000ff"}},
+            {"time": 0.0, "fixture_id": "head_el150", "effect": "move_to_poi", "duration": 1.0, "data": {"target_POI": "stage"}},
+            {"time": 2.0, "fixture_id": "head_el150", "effect": "sweep", "duration": 2.0, "data": {"subject_POI": "stage", "start_POI": "crowd", "max_dim": 1.0}},
+            {"time": 1.0, "fixture_id": "mini_beam_prism_l", "effect": "orbit", "duration": 2.5, "data": {"subject_POI": "stage", "start_POI": "crowd", "orbits": 1.0}},
+            {"time": 3.0, "fixture_id": "missing_fixture", "effect": "full", "duration": 1.0, "data": {}},
+        ],
+    )
+
+
+@pytest.mark.asyncio
+async def test_fixture_layers_split_rig_by_channel_ownership(make_state_manager):
+    state_manager = await make_state_manager(pois=POIS)
+    layers = build_fixture_layers(state_manager.fixtures)
+
+    assert sorted(fixture_id for layer in layers for fixture_id in layer.fixture_ids) == sorted(f.id for f in state_manager.fixtures)
+    assert all(len(layer.fixture_ids) == 1 for layer in layers)
+    parcan_l = next(layer for layer in layers if layer.fixture_ids == ("parcan_l",))
+    assert parcan_l.channels == tuple(range(15, 20))
+
+    parcan = next(fixture for fixture in state_manager.fixtures if fixture.id == "parcan_l")
+    overlapping = parcan.model_copy(update={"id": "clone", "base_channel": parcan.base_channel + 1})
+    merged = build_fixture_layers([*state_manager.fixtures, overlapping])
+    assert len(merged) == len(layers)
+    assert any(set(layer.fixture_ids) == {"parcan_l", "clone"} and layer.channels == tuple(range(15, 21)) for layer in merged)
+
+
+@pytest.mark.asyncio
+async def test_split_cue_indices_drops_unknown_fixtures(make_state_manager):
+    state_manager = await make_state_manager(pois=POIS)
+    layers = build_fixture_layers(state_manager.fixtures)
+    cues = [(0, 1, entry) for entry in _cue_sheet().entries]
+
+    indices = split_cue_indices_by_layer(cues, layers)
+
+    assert sorted(index for layer_indices in indices for index in layer_indices) == [0, 1, 2, 3, 4, 5]
+
+
+@pytest.mark.asyncio
+async def test_parallel_render_is_byte_identical_to_serial(make_state_manager, tmp_path: Path):
+    state_manager = await make_state_manager(pois=POIS)
+    kwargs = {
+        "fixtures": state_manager.fixtures,
+        "cue_sheet": _cue_sheet(),
+        "chasers": [],
+        "bpm": 120.0,
+        "song_length_seconds": 6.0,
+        "fps": 50,
+        "apply_arm": state_manager._apply_arm,
+        "checkpoint_seconds": [1.5],
+    }
+
+    serial = render_cue_sheet_to_canvas(**kwargs)
+    parallel = render_cue_sheet_to_canvas_parallel(**kwargs, max_workers=2)
+
+    assert bytes(parallel.buffer) == bytes(serial.buffer)
+    assert parallel.cue_signatures == serial.cue_signatures
+    assert parallel.checkpoints == serial.checkpoints
+    assert PoiStore.get_instance().filepath == tmp_path / "backend" / "fixtures" / "pois.json"
+
+
+@pytest.mark.asyncio
+async def test_fixture_on_a_second_universe_renders_past_channel_512(make_state_manager, canvas_render_kwargs):
+    state_manager = await make_state_manager(pois=POIS)
+    single = render_cue_sheet_to_canvas(**canvas_render_kwargs(state_manager, 6.0), cue_sheet=_cue_sheet())
+    state_manager.fixtures = [
+        fixture.model_copy(update={"universe": 1}) if fixture.id == "parcan_l" else fixture for fixture in state_manager.fixtures
+    ]
+    parcan = next(fixture for fixture in state_manager.fixtures if fixture.id == "parcan_l")
+    kwargs = {**canvas_render_kwargs(state_manager, 6.0), "cue_sheet": _cue_sheet()}
+
+    serial = render_cue_sheet_to_canvas(**kwargs)
+    parallel = render_cue_sheet_to_canvas_parallel(**kwargs, max_workers=2)
+
+    red = parcan._frame_offset("red")
+    assert parcan.absolute_channels["red"] == red + 1 > DMX_CHANNELS
+    assert (serial.universe_count, serial.frame_size) == (2, 2 * DMX_CHANNELS)
+    assert serial.channel_view(red).tolist() == single.channel_view(red - DMX_CHANNELS).tolist()
+    assert max(serial.channel_view(red).tolist()) == 200
+    assert not any(serial.channel_view(red - DMX_CHANNELS).tolist())
+    assert bytes(parallel.buffer) == bytes(serial.buffer)
@@ -0,0 +1,75 @@
+from types import SimpleNamespace
+
+import pytest
+
+from models.chasers import ChaserDefinition
+from models.cues import CueEntry, CueSheet
+from store.services.canvas_profile import RenderProfile
+from store.services.canvas_rendering import render_cue_sheet_to_canvas
+
+
+CHASERS = [
+    ChaserDefinition(
+        id="pair",
+        name="Pair",
+        description="",
+        effects=[{"beat": 0.0, "fixture_id": "parcan_r", "effect": "flash", "duration": 1.0, "data": {}}],
+    ),
+    ChaserDefinition(
+        id="wave",
+        name="Wave",
+        description="",
+        type="dynamic",
+        generator_id="dynamic_wave_generator",
+        default_params={"fixtures": ["parcan_pl", "parcan_pr"], "duration_beats": 1.0, "step_size": 0.5},
+    ),
+]
+CUES = [
+    CueEntry(time=0.2, fixture_id="parcan_l", effect="fade_in", duration=1.0, data={"red": 1.0}),
+    CueEntry(time=0.5, fixture_id="head_el150", effect="move_to", duration=1.0, data={"pan": 40000, "tilt": 9000}),
+    CueEntry(time=1.0, chaser_id="pair", data={"repetitions": 2}),
+    CueEntry(time=2.0, chaser_id="wave", data={"repetitions": 1}),
+]
+
+
+@pytest.mark.asyncio
+async def test_profiled_render_is_identical_and_buckets_effects_and_sources(make_state_manager):
+    state_manager = await make_state_manager()
+    render_kwargs = {
+        "fixtures": state_manager.fixtures,
+        "cue_sheet": CueSheet(song_filename="song", entries=CUES),
+        "chasers": CHASERS,
+        "bpm": 120.0,
+        "song_length_seconds": 4.0,
+        "fps": 50,
+        "apply_arm": state_manager._apply_arm,
+    }
+    profile = RenderProfile()
+
+    profiled = render_cue_sheet_to_canvas(**render_kwargs, profile=profile)
+
+    assert profiled.buffer == render_cue_sheet_to_canvas(**render_kwargs).buffer
+    summary = profile.summary()
+    buckets = {(row["effect"], row["fixture_type"]) for row in summary["effects"]}
+    assert {("fade_in", "parcan"), ("move_to", "moving_head"), ("flash", "parcan")} <= buckets
+    assert {row["source"] for row in summary["sources"]} == {"user", "chaser", "dynamic"}
+    move_to = next(row for row in summary["effects"] if row["effect"] == "move_to")
+    assert move_to["frames"] == move_to["calls"] > 0
+    assert profile.log_label().startswith("profile=")
+
+
+@pytest.mark.asyncio
+async def test_profile_dmx_canvas_leaves_the_live_canvas_alone(make_state_manager):
+    state_manager = await make_state_manager(cues=[cue.model_dump(exclude_none=True) for cue in CUES[:2]])
+    await state_manager.load_song("alpha-song")
+    if state_manager.canvas_stream_task:
+        await state_manager.canvas_stream_task
+    canvas = state_manager.canvas
+
+    result = await state_manager.profile_dmx_canvas()
+
+    assert result["ok"] is True
+    assert result["total_frames"] == canvas.total_frames
+    assert {row["source"] for row in result["profile"]["sources"]} == {"user"}
+    assert state_manager.canvas is canvas
+    assert state_manager.canvas_profile is not None
@@ -0,0 +1,85 @@
+import asyncio
+import threading
+
+import pytest
+
+import store.state_manager.core.canvas_lifecycle as canvas_lifecycle
+
+
+CUES = [
+    {"time": 0.5, "fixture_id": "parcan_l", "effect": "fade_in", "duration": 1.0, "data": {"red": 1.0}},
+]
+
+
+@pytest.mark.asyncio
+async def test_song_render_runs_on_a_snapshot_with_the_lock_released(make_state_manager, monkeypatch):
+    monkeypatch.setattr("store.state_manager.core.canvas_lifecycle.CANVAS_STREAM_LEAD_SECONDS", 0)
+    monkeypatch.setattr("store.state_manager.core.canvas_lifecycle.CANVAS_CACHE_ENABLED", False)
+    state_manager = await make_state_manager(cues=CUES)
+    started = threading.Event()
+    release = threading.Event()
+    snapshots = []
+    render = state_manager._render_cue_sheet_to_canvas
+
+    def blocking_render(render_kwargs):
+        snapshots.append(render_kwargs)
+        started.set()
+        release.wait(5)
+        return render(render_kwargs)
+
+    state_manager._render_cue_sheet_to_canvas = blocking_render
+    load = asyncio.create_task(state_manager.load_song("alpha-song"))
+    await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+
+    assert not state_manager.lock.locked()
+    assert state_manager.canvas is None
+    assert snapshots[0]["fixtures"][0] is not state_manager.fixtures[0]
+    assert snapshots[0]["cue_sheet"] is not state_manager.cue_sheet
+
+    release.set()
+    await load
+    assert state_manager.canvas is not None
+    assert state_manager.canvas.total_frames > 0
+
+
+@pytest.mark.asyncio
+async def test_stale_render_results_are_not_swapped_in(make_state_manager):
+    state_manager = await make_state_manager(cues=CUES)
+    await state_manager.load_song("alpha-song")
+    current = state_manager.canvas
+
+    async with state_manager.lock:
+        stale = state_manager._next_canvas_request()
+        fresh = state_manager._next_canvas_request()
+        assert state_manager._swap_canvas_locked(fresh, current)
+        assert not state_manager._swap_canvas_locked(stale, object())
+    assert state_manager.canvas is current
+
+
+@pytest.mark.asyncio
+async def test_canvas_cache_hit_loads_with_the_lock_released(make_state_manager, monkeypatch):
+    monkeypatch.setattr("store.state_manager.core.canvas_lifecycle.CANVAS_STREAM_LEAD_SECONDS", 0)
+    monkeypatch.setattr("store.state_manager.core.canvas_lifecycle.CANVAS_CACHE_ENABLED", True)
+    monkeypatch.setattr("store.state_manager.core.canvas_lifecycle.CANVAS_CACHE_DIR", "")
+    state_manager = await make_state_manager(cues=CUES)
+    await state_manager.load_song("alpha-song")
+    rendered = bytes(state_manager.canvas.to_bytearray())
+    started = threading.Event()
+    release = threading.Event()
+    load_cached_canvas = canvas_lifecycle.load_cached_canvas
+
+    def blocking_load(path, key):
+        started.set()
+        release.wait(5)
+        return load_cached_canvas(path, key)
+
+    monkeypatch.setattr("store.state_manager.core.canvas_lifecycle.load_cached_canvas", blocking_load)
+    load = asyncio.create_task(state_manager.load_song("alpha-song"))
+    await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+
+    assert not state_manager.lock.locked()
+
+    release.set()
+    await load
+    assert state_manager.canvas.cue_signatures
+    assert bytes(state_manager.canvas.to_bytearray()) == rendered
@@ -0,0 +1,55 @@
+from pathlib import Path
+
+import pytest
+
+from models.cues import CueEntry
+from store.services.canvas_render_ops import compile_render_ops
+from store.state import StateManager
+
+
+BACKEND_PATH = Path(__file__).resolve().parents[1] / "backend"
+
+
+async def _fixtures(tmp_path: Path):
+    for name in ["songs", "cues", "meta"]:
+        (tmp_path / name).mkdir()
+    state_manager = StateManager(BACKEND_PATH, tmp_path / "songs", tmp_path / "cues", tmp_path / "meta")
+    await state_manager.load_fixtures(BACKEND_PATH / "fixtures" / "fixtures.json")
+    return state_manager.fixtures
+
+
+@pytest.mark.asyncio
+async def test_compiled_ops_render_like_fixture_render_effect(tmp_path: Path):
+    fixtures = await _fixtures(tmp_path)
+    parcan = next(fixture for fixture in fixtures if fixture.id == "parcan_l")
+    cues = [
+        (0, 40, CueEntry(time=0.0, fixture_id="parcan_l", effect=" Fade_In ", duration=0.8, data={"red": 1.0})),
+        (0, 40, CueEntry(time=0.0, fixture_id="head_el150", effect="move_to", duration=0.8, data={"pan": 30000, "tilt": 9000})),
+        (0, 40, CueEntry(time=0.0, fixture_id="missing", effect="flash", duration=0.8, data={})),
+    ]
+
+    ops = compile_render_ops(cues, fixtures)
+
+    assert set(ops) == {id(cues[0][2]), id(cues[1][2])}
+    fade_op = ops[id(cues[0][2])]
+    assert fade_op.fixture is parcan and fade_op.effect == "fade_in"
+    assert fade_op.offsets["dim"] == parcan.absolute_channels["dim"] - 1
+
+    for start, end, entry in cues[:2]:
+        op = ops[id(entry)]
+        fixture = op.fixture
+        expected, actual = bytearray(512), bytearray(512)
+        expected_state, actual_state = {}, {}
+        for frame_index in range(start, end + 1):
+            fixture.render_effect(
+                expected,
+                effect=entry.effect,
+                frame_index=frame_index,
+                start_frame=start,
+                end_frame=end,
+                fps=50,
+                data=entry.data,
+                render_state=expected_state,
+            )
+            op.render(actual, frame_index, actual_state, 50)
+            assert actual == expected, (fixture.id, frame_index)
@@ -0,0 +1,45 @@
+from models.cues import CueEntry
+from store.services.canvas_scheduler import ActiveCueScheduler
+
+
+def _cue(start: int, end: int, time: float, fixture_id: str, effect: str = "flash"):
+    return (start, end, CueEntry(time=time, fixture_id=fixture_id, effect=effect, duration=0.0, data={}))
+
+
+def test_scheduler_keeps_running_cues_in_render_order_between_boundaries():
+    late = _cue(0, 10, 0.2, "parcan_l")
+    early = _cue(5, 7, 0.1, "parcan_r")
+    tie = _cue(5, 20, 0.1, "parcan_r")
+    scheduler = ActiveCueScheduler([late, early, tie])
+
+    assert scheduler.advance(0) is True
+    assert scheduler.active == [late]
+    assert scheduler.next_change() == 5
+    active = scheduler.active
+    assert scheduler.advance(3) is False
+    assert scheduler.active is active
+
+    scheduler.advance(5)
+    # Sorted by cue time, then fixture and effect; identical keys keep cue-list order.
+    assert scheduler.active == [early, tie, late]
+    assert scheduler.next_change() == 8
+
+    scheduler.advance(8)
+    assert scheduler.active == [tie, late]
+    scheduler.advance(11)
+    assert scheduler.active == [tie]
+    assert scheduler.next_change() == 21
+    scheduler.advance(21)
+    assert scheduler.active == []
+    assert scheduler.next_change() is None
+
+
+def test_scheduler_resumes_with_running_cues_and_skips_earlier_starts():
+    running = _cue(0, 30, 0.0, "head_el150", "fade_in")
+    later = _cue(12, 14, 0.3, "parcan_l")
+    scheduler = ActiveCueScheduler([running, later], first_frame=10, running=[running])
+
+    assert scheduler.active == [running]
+    assert scheduler.next_change() == 12
+    scheduler.advance(12)
+    assert scheduler.active == [running, later]
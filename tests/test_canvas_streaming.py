@@ -0,0 +1,61 @@
+from pathlib import Path
+
+import pytest
+
+from models.cues import CueEntry, CueSheet
+from store.services.canvas_rendering import render_cue_sheet_to_canvas
+from store.services.canvas_streaming import StreamingCanvasRender
+
+
+CUES = [
+    {"time": 0.5, "fixture_id": "parcan_l", "effect": "fade_in", "duration": 3.0, "data": {"red": 1.0}},
+    {"time": 1.0, "fixture_id": "parcan_r", "effect": "strobe", "duration": 2.5, "data": {"rate": 6}},
+    {"time": 0.8, "fixture_id": "head_el150", "effect": "move_to", "duration": 2.0, "data": {"pan": 40000, "tilt": 9000}},
+    {"time": 3.2, "fixture_id": "parcan_l", "effect": "color_fade", "duration": 1.5, "data": {"end_color": "#0000ff"}},
+]
+
+
+@pytest.mark.asyncio
+async def test_chunked_stream_matches_full_render(make_state_manager):
+    state_manager = await make_state_manager()
+    cue_sheet = CueSheet(song_filename="song", entries=[CueEntry(**cue) for cue in CUES])
+    render_kwargs = {
+        "fixtures": state_manager.fixtures,
+        "cue_sheet": cue_sheet,
+        "chasers": [],
+        "bpm": 120.0,
+        "song_length_seconds": 6.0,
+        "fps": 50,
+        "apply_arm": state_manager._apply_arm,
+        "checkpoint_seconds": [2.0],
+    }
+    full = render_cue_sheet_to_canvas(**render_kwargs)
+
+    stream = StreamingCanvasRender(**render_kwargs)
+    for frame_index in [0, 37, 38, 120, 121, 199, 400]:
+        assert stream.render_through(frame_index) == min(frame_index, full.total_frames - 1)
+
+    assert stream.done
+    assert stream.canvas.buffer == full.buffer
+    assert stream.canvas.checkpoints == full.checkpoints
+    assert stream.canvas.cue_signatures == full.cue_signatures
+
+
+@pytest.mark.asyncio
+async def test_load_song_streams_the_tail_and_holds_output_at_the_watermark(make_state_manager, tmp_path: Path, monkeypatch):
+    monkeypatch.setattr("store.state_manager.core.canvas_lifecycle.CANVAS_STREAM_LEAD_SECONDS", 1.0)
+    monkeypatch.setattr("store.state_manager.core.canvas_lifecycle.CANVAS_STREAM_CHUNK_SECONDS", 1.0)
+    state_manager = await make_state_manager(cues=CUES)
+
+    await state_manager.load_song("alpha-song")
+
+    assert state_manager._canvas_valid_through() == 49
+    state_manager._apply_canvas_frame_to_output(500)
+    assert state_manager.output_universe == bytearray(state_manager.canvas.frame_view(49))
+
+    await state_manager.canvas_stream_task
+    full = render_cue_sheet_to_canvas(**state_manager._canvas_render_kwargs())
+    assert state_manager.canvas_stream is None
+    assert state_manager._canvas_valid_through() == state_manager.canvas.total_frames - 1
+    assert state_manager.canvas.buffer == full.buffer
+    assert list((tmp_path / "cues" / ".canvas_cache").glob("alpha-song.*"))
@@ -0,0 +1,79 @@
+import pytest
+
+from models.chasers import ChaserDefinition, ChaserEffect
+from models.cues import CueEntry
+from services.cue_helpers import beatToTimeMs
+from services.dynamic_chasers import GENERATORS
+from store.services import chaser_expansion
+from store.services.canvas_cue_expansion import expand_entry_for_render
+from store.services.chaser_expansion import clear_chaser_expansions, expand_chaser_cycle
+
+
+WAVE = ChaserDefinition(
+    id="wave",
+    name="Wave",
+    description="",
+    type="dynamic",
+    generator_id="dynamic_wave_generator",
+    default_params={"fixtures": ["parcan_l", "parcan_r"], "duration_beats": 2.0, "step_size": 0.5},
+)
+PULSE = ChaserDefinition(
+    id="pulse",
+    name="Pulse",
+    description="",
+    effects=[
+        ChaserEffect(beat=0.0, fixture_id="parcan_l", effect="flash", duration=0.5, data={"color": "blue"}),
+        ChaserEffect(beat=1.5, fixture_id="parcan_r", effect="flash", duration=0.5),
+    ],
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_chaser_expansions()
+    yield
+    clear_chaser_expansions()
+
+
+def test_dynamic_generator_runs_once_per_definition_params_and_bpm(monkeypatch):
+    calls = []
+    generator = GENERATORS["dynamic_wave_generator"]
+    monkeypatch.setitem(GENERATORS, "dynamic_wave_generator", lambda params: calls.append(params) or generator(params))
+
+    first = expand_chaser_cycle(WAVE, {"speed": 2.0}, 120.0)
+    assert expand_chaser_cycle(WAVE, {"speed": 2.0}, 120.0) is first
+    assert len(calls) == 1
+
+    expand_chaser_cycle(WAVE, {"speed": 3.0}, 120.0)
+    expand_chaser_cycle(WAVE, {"speed": 2.0}, 90.0)
+    edited = WAVE.model_copy(update={"default_params": {**WAVE.default_params, "step_size": 0.25}})
+    assert len(expand_chaser_cycle(edited, {"speed": 2.0}, 120.0).steps) > len(first.steps)
+    assert len(calls) == 4
+
+    clear_chaser_expansions()
+    expand_chaser_cycle(WAVE, {"speed": 2.0}, 120.0)
+    assert len(calls) == 5
+
+
+def test_render_expansion_places_repetitions_by_beat_offset():
+    cue = CueEntry(time=1.5, chaser_id="pulse", data={"repetitions": 2}, name="pulse cue")
+
+    expanded = expand_entry_for_render(cue, [PULSE], 120.0, 50)
+
+    assert len(expanded) == 2 * len(PULSE.effects)
+    for position, entry in enumerate(expanded):
+        cycle, effect = divmod(position, len(PULSE.effects))
+        raw = PULSE.effects[effect]
+        assert entry.time == 1.5 + beatToTimeMs(cycle * 2.0 + raw.beat, 120.0) / 1000.0
+        assert entry.duration == beatToTimeMs(raw.duration, 120.0) / 1000.0
+        assert (entry.fixture_id, entry.effect, entry.data, entry.name) == (raw.fixture_id, raw.effect, raw.data, "pulse cue")
+    # Each expanded cue owns its data dict, so per-cue render tweaks never leak into the cache.
+    assert expanded[0].data is not expanded[len(PULSE.effects)].data
+
+
+def test_expansion_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(chaser_expansion, "CHASER_EXPANSION_CACHE_SIZE", 3)
+    for bpm in [100.0, 110.0, 120.0, 130.0]:
+        expand_chaser_cycle(WAVE, {}, bpm)
+
+    assert len(chaser_expansion._expansions) == 3
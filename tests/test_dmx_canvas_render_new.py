@@ -10,7 +10,7 @@ from backend.models.fixtures.moving_heads.moving_head import MovingHead
 from backend.models.fixtures.parcans.parcan import Parcan
 from backend.models.cues import CueSheet
 from backend.store.dmx_canvas import DMXCanvas
-from backend.store.services.canvas_debug import build_named_canvas_binary_path, build_show_name, dump_canvas_binary
+from backend.store.services.canvas_debug import build_named_canvas_binary_path, build_show_name, dump_canvas_binary, dump_canvas_debug
 
 @pytest.fixture
 def workspace_root():
@@ -171,7 +171,7 @@ def test_dump_canvas_binary_writes_spec_file_and_overwrites_same_day(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_rerender_dmx_canvas_writes_binary_show_in_data_shows(tmp_path: Path):
+async def test_rerender_dmx_canvas_writes_binary_show_in_data_shows(tmp_path: Path, monkeypatch):
     workspace_root = Path(__file__).resolve().parents[1]
     source_backend = workspace_root / "backend"
     backend_path = tmp_path / "backend"
@@ -206,7 +206,18 @@ async def test_rerender_dmx_canvas_writes_binary_show_in_data_shows(tmp_path: Pa
     state_manager = StateManager(backend_path, songs_path, cues_path, meta_path)
     await state_manager.load_fixtures(backend_path / "fixtures" / "fixtures.json")
     await state_manager.load_song(song_name)
+    locked_during_write = {}
 
+    def recording_dump_canvas_debug(**kwargs):
+        locked_during_write["log"] = state_manager.lock.locked()
+        return dump_canvas_debug(**kwargs)
+
+    def recording_dump_canvas_binary(**kwargs):
+        locked_during_write["binary"] = state_manager.lock.locked()
+        return dump_canvas_binary(**kwargs)
+
+    monkeypatch.setattr("backend.store.state_manager.core.canvas_export.dump_canvas_debug", recording_dump_canvas_debug)
+    monkeypatch.setattr("backend.store.state_manager.core.canvas_export.dump_canvas_binary", recording_dump_canvas_binary)
     result = await state_manager.rerender_dmx_canvas()
 
     assert result["ok"] is True
@@ -217,3 +228,5 @@ async def test_rerender_dmx_canvas_writes_binary_show_in_data_shows(tmp_path: Pa
     assert binary_path.exists()
     assert binary_path.parent == tmp_path / "data" / "shows"
     assert binary_path.read_bytes()[0:4] == b"DMXP"
+    assert Path(result["dmx_log_path"]).exists()
+    assert locked_during_write == {"binary": False, "log": False}
@@ -0,0 +1,49 @@
+import io
+
+import pytest
+
+from store.dmx_canvas import DMX_CHANNELS, DMXCanvas, RunLengthDMXCanvas
+from store.services.canvas_binary import read_canvas_dmxp
+from store.services.canvas_binary_compact import read_compact_canvas_dmxp, write_compact_canvas_dmxp
+
+
+def _canvas() -> DMXCanvas:
+    canvas = DMXCanvas.allocate(fps=50, total_frames=20)
+    for frame_index in range(canvas.total_frames):
+        universe = bytearray(DMX_CHANNELS)
+        if 5 <= frame_index < 12:
+            universe[0] = 255
+        if frame_index >= 9:
+            universe[300] = frame_index if frame_index < 14 else 14
+        canvas.set_frame(frame_index, universe)
+    return canvas
+
+
+def test_run_length_canvas_keeps_one_frame_per_run():
+    canvas = _canvas()
+
+    compact = RunLengthDMXCanvas.from_canvas(canvas)
+
+    # 0..4 dark, 5..8 lit, 9..13 ramp one frame at a time, 14..19 hold.
+    assert compact.run_starts() == [0, 5, 9, 10, 11, 12, 13, 14]
+    assert len(compact.run_frames) == compact.run_count * DMX_CHANNELS
+    for frame_index in range(-1, canvas.total_frames + 1):
+        assert compact.frame_view(frame_index) == canvas.frame_view(frame_index)
+    assert compact.to_canvas().buffer == canvas.buffer
+
+
+def test_compact_dmx_file_round_trips_run_length_canvas():
+    compact = RunLengthDMXCanvas.from_canvas(_canvas())
+    handle = io.BytesIO()
+    write_compact_canvas_dmxp(handle, compact, reserved=b"key")
+
+    loaded, reserved = read_compact_canvas_dmxp(handle.getvalue())
+
+    assert reserved == b"key".ljust(16, b"\x00")
+    assert (loaded.fps, loaded.total_frames) == (50, 20)
+    assert loaded.run_frames == compact.run_frames and loaded.run_index == compact.run_index
+    assert len(handle.getvalue()) < 20 * DMX_CHANNELS // 4
+    with pytest.raises(ValueError):
+        read_canvas_dmxp(handle.getvalue())
+    with pytest.raises(ValueError):
+        read_compact_canvas_dmxp(handle.getvalue()[:-1])
@@ -0,0 +1,130 @@
+from pathlib import Path
+
+import pytest
+
+from store.dmx_canvas import DMX_CHANNELS, DMXCanvas
+from store.services.canvas_binary import DMXP_HEADER, DMXP_TIMESTAMP, open_canvas_dmxp, write_canvas_dmxp, write_file_atomic
+
+
+def _canvas() -> DMXCanvas:
+    canvas = DMXCanvas.allocate(fps=50, total_frames=10)
+    for frame_index in range(canvas.total_frames):
+        universe = bytearray(DMX_CHANNELS)
+        universe[3] = frame_index
+        universe[511] = 100 + frame_index
+        canvas.set_frame(frame_index, universe)
+    return canvas
+
+
+def test_channel_view_reads_column_over_frame_range_without_copying():
+    canvas = _canvas()
+
+    assert canvas.channel_view(3).tolist() == list(range(10))
+    assert canvas.channel_view(3, 2, 8, step=3).tolist() == [2, 5, 8]
+    assert canvas.channel_view(511, 8, 50).tolist() == [108, 109]
+
+    canvas.channel_view(3, 4, 5)[0] = 77
+    assert canvas.frame_view(4)[3] == 77
+
+    with pytest.raises(ValueError):
+        canvas.channel_view(DMX_CHANNELS)
+
+
+def test_frames_view_spans_inclusive_frame_range():
+    canvas = _canvas()
+
+    view = canvas.frames_view(1, 2)
+    assert len(view) == 2 * DMX_CHANNELS
+    assert view[3] == 1 and view[DMX_CHANNELS + 3] == 2
+
+
+def test_as_array_shares_canvas_buffer():
+    np = pytest.importorskip("numpy")
+    canvas = _canvas()
+
+    array = canvas.as_array()
+    assert array.shape == (10, DMX_CHANNELS) and array.dtype == np.uint8
+    assert array[2:5, 3].tolist() == [2, 3, 4]
+
+    array[6:9, 40] = 255
+    assert canvas.channel_view(40, 6, 8).tolist() == [255, 255, 255]
+    assert canvas.frame_view(6)[40] == 255
+
+
+def test_mapped_show_file_serves_the_same_views(tmp_path: Path):
+    canvas = _canvas()
+    path = tmp_path / "song.dmx"
+    with open(path, "wb") as handle:
+        write_canvas_dmxp(handle, canvas)
+
+    mapped, _reserved = open_canvas_dmxp(path)
+
+    assert (mapped.fps, mapped.total_frames, mapped.is_flat) == (50, 10, False)
+    assert mapped.frame_view(7) == canvas.frame_view(7)
+    assert mapped.channel_view(3, 2, 8, step=3).tolist() == [2, 5, 8]
+    assert mapped.to_bytearray() == canvas.buffer
+    with pytest.raises(TypeError):
+        mapped.frame_view(0)[3] = 1
+    with pytest.raises(ValueError):
+        mapped.frames_view(0, 1)
+
+
+def _reference_dmxp(canvas: DMXCanvas) -> bytes:
+    records = b"".join(
+        DMXP_TIMESTAMP.pack(int(round(frame_index * 1000.0 / canvas.fps))) + bytes(canvas.frame_view(frame_index))
+        for frame_index in range(canvas.total_frames)
+    )
+    return DMXP_HEADER.pack(b"DMXP", 1, 1, canvas.total_frames, canvas.fps, bytes(16)) + records
+
+
+def test_chunked_dmxp_export_matches_per_frame_records(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr("store.services.canvas_binary.DMXP_WRITE_CHUNK_FRAMES", 3)
+    canvas = _canvas()
+    canvas.fps = 60
+    path = tmp_path / "song.dmx"
+
+    write_file_atomic(path, lambda handle: write_canvas_dmxp(handle, canvas))
+    assert path.read_bytes() == _reference_dmxp(canvas)
+
+    # A canvas mapped from a DMXP file streams its records straight from the mapping.
+    mapped, _reserved = open_canvas_dmxp(path)
+    copy_path = tmp_path / "copy.dmx"
+    write_file_atomic(copy_path, lambda handle: write_canvas_dmxp(handle, mapped, reserved=b"key"))
+    assert copy_path.read_bytes()[DMXP_HEADER.size :] == path.read_bytes()[DMXP_HEADER.size :]
+    assert open_canvas_dmxp(copy_path)[1] == b"key".ljust(16, b"\x00")
+
+
+def test_atomic_write_keeps_the_old_file_when_writing_fails(tmp_path: Path):
+    path = tmp_path / "song.dmx"
+    path.write_bytes(b"old")
+
+    def failing_write(handle):
+        handle.write(b"partial")
+        raise OSError("disk full")
+
+    with pytest.raises(OSError):
+        write_file_atomic(path, failing_write)
+
+    assert path.read_bytes() == b"old"
+    assert [item.name for item in tmp_path.iterdir()] == ["song.dmx"]
+
+
+def test_multi_universe_canvas_round_trips_through_dmxp(tmp_path: Path):
+    canvas = DMXCanvas.allocate(fps=50, total_frames=4, universe_count=2)
+    for frame_index in range(canvas.total_frames):
+        frame = bytearray(canvas.frame_size)
+        frame[0] = frame_index
+        frame[DMX_CHANNELS + 1] = 100 + frame_index
+        canvas.set_frame(frame_index, frame)
+    path = tmp_path / "song.dmx"
+    write_file_atomic(path, lambda handle: write_canvas_dmxp(handle, canvas))
+
+    mapped, _reserved = open_canvas_dmxp(path)
+
+    assert int.from_bytes(path.read_bytes()[6:8], "little") == 2
+    assert (mapped.universe_count, mapped.frame_size) == (2, 2 * DMX_CHANNELS)
+    assert mapped.universe_view(3, 1)[1] == 103
+    assert mapped.channel_view(DMX_CHANNELS + 1).tolist() == [100, 101, 102, 103]
+    assert mapped.to_bytearray() == canvas.buffer
+    with pytest.raises(ValueError):
+        canvas.universe_view(0, 2)
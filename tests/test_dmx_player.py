@@ -0,0 +1,176 @@
+import asyncio
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import services.dmx_player as dmx_player
+from services.dmx_player import CompactDmxShowFile, DmxShowFile, DmxShowPlayer, open_show_file, play_show_file
+from store.dmx_canvas import DMX_CHANNELS, DMXCanvas, RunLengthDMXCanvas
+from store.services.canvas_binary import write_canvas_dmxp
+from store.services.canvas_binary_compact import write_compact_canvas_dmxp
+
+
+BACKEND_PATH = Path(__file__).resolve().parents[1] / "backend"
+
+
+class RecordingArtNet:
+    universe_count = 1
+
+    def __init__(self):
+        self.universes = []
+
+    async def update_universe(self, universe):
+        self.universes.append(bytes(universe))
+
+
+def _show_file(tmp_path: Path, fps: int = 50, total_frames: int = 10) -> Path:
+    canvas = DMXCanvas.allocate(fps=fps, total_frames=total_frames)
+    for frame_index in range(total_frames):
+        universe = bytearray(DMX_CHANNELS)
+        universe[0] = frame_index
+        universe[511] = 200
+        canvas.set_frame(frame_index, universe)
+    path = tmp_path / "song.show_20260101.dmx"
+    with open(path, "wb") as handle:
+        write_canvas_dmxp(handle, canvas)
+    return path
+
+
+def test_show_file_reads_timestamps_and_frames_in_place(tmp_path: Path):
+    show = DmxShowFile(_show_file(tmp_path, fps=60))
+
+    assert (show.total_frames, show.fps) == (10, 60)
+    assert [show.timestamp_ms(index) for index in range(3)] == [0, 17, 33]
+    assert bytes(show.frame_view(7))[0] == 7
+    assert show.frame_at_ms(40) == 2
+    assert show.frame_at_ms(-5) == 0
+    show.close()
+
+
+def test_show_file_rejects_other_files(tmp_path: Path):
+    path = tmp_path / "song.dmx"
+    path.write_bytes(b"DMXQ" + bytes(28))
+
+    with pytest.raises(ValueError):
+        DmxShowFile(path)
+
+
+@pytest.mark.asyncio
+async def test_player_sends_frames_in_timestamp_order(tmp_path: Path):
+    show = DmxShowFile(_show_file(tmp_path, fps=500, total_frames=20))
+    artnet = RecordingArtNet()
+
+    await DmxShowPlayer(show, artnet).play()
+
+    sent = [universe[0] for universe in artnet.universes]
+    assert sent == sorted(sent)
+    assert sent[-1] == 19
+    assert all(universe[511] == 200 for universe in artnet.universes)
+    show.close()
+
+
+@pytest.mark.asyncio
+async def test_player_starts_mid_show(tmp_path: Path):
+    show = DmxShowFile(_show_file(tmp_path, fps=500, total_frames=20))
+    artnet = RecordingArtNet()
+
+    await DmxShowPlayer(show, artnet).play(start_seconds=0.03)
+
+    assert artnet.universes[0][0] == 15
+    show.close()
+
+
+@pytest.mark.asyncio
+async def test_stop_ends_a_looping_show(tmp_path: Path, monkeypatch):
+    class StoppingArtNet(RecordingArtNet):
+        async def start(self):
+            pass
+
+        async def stop(self):
+            pass
+
+        async def blackout(self):
+            self.blacked_out = True
+
+        async def update_universe(self, universe):
+            await super().update_universe(universe)
+            if len(self.universes) == 25:
+                self.player.stop()
+
+    class TrackedPlayer(DmxShowPlayer):
+        def __init__(self, show, artnet_service):
+            super().__init__(show, artnet_service)
+            artnet_service.player = self
+
+    monkeypatch.setattr(dmx_player, "DmxShowPlayer", TrackedPlayer)
+    artnet = StoppingArtNet()
+
+    await asyncio.wait_for(play_show_file(_show_file(tmp_path, fps=500), loop=True, artnet_service=artnet), timeout=5)
+
+    # The 10-frame show looped twice, then stop() ended the loop instead of restarting it.
+    assert len(artnet.universes) == 25
+    assert artnet.blacked_out
+
+
+@pytest.mark.asyncio
+async def test_player_sends_every_universe_of_a_multi_universe_show(tmp_path: Path):
+    canvas = DMXCanvas.allocate(fps=500, total_frames=3, universe_count=2)
+    canvas.set_frame(2, bytes([7]) * canvas.frame_size)
+    path = tmp_path / "song.dmx"
+    with open(path, "wb") as handle:
+        write_canvas_dmxp(handle, canvas)
+    show = DmxShowFile(path)
+    artnet = RecordingArtNet()
+
+    await DmxShowPlayer(show, artnet).play()
+
+    assert show.universe_count == 2
+    assert artnet.universes[-1] == bytes([7]) * (2 * DMX_CHANNELS)
+    show.close()
+
+
+def test_compact_show_file_plays_the_same_frames(tmp_path: Path):
+    full_path = _show_file(tmp_path, fps=60)
+    canvas = DMXCanvas.allocate(fps=60, total_frames=10)
+    for frame_index in range(10):
+        universe = bytearray(DMX_CHANNELS)
+        universe[0] = frame_index // 4
+        canvas.set_frame(frame_index, universe)
+    compact_path = tmp_path / "song.dmx.bin"
+    with open(compact_path, "wb") as handle:
+        write_compact_canvas_dmxp(handle, RunLengthDMXCanvas.from_canvas(canvas))
+    full = open_show_file(full_path)
+    compact = open_show_file(compact_path)
+
+    assert isinstance(full, DmxShowFile) and isinstance(compact, CompactDmxShowFile)
+    assert [compact.timestamp_ms(index) for index in range(10)] == [full.timestamp_ms(index) for index in range(10)]
+    assert [bytes(compact.frame_view(index)) for index in range(10)] == [bytes(canvas.frame_view(index)) for index in range(10)]
+    assert compact.frame_at_ms(40) == full.frame_at_ms(40) == 2
+    full.close()
+    compact.close()
+
+
+def test_compact_show_file_rejects_a_truncated_run_table(tmp_path: Path):
+    canvas = DMXCanvas.allocate(fps=50, total_frames=4)
+    canvas.set_frame(2, bytes([9]) * DMX_CHANNELS)
+    path = tmp_path / "song.dmx.bin"
+    with open(path, "wb") as handle:
+        write_compact_canvas_dmxp(handle, RunLengthDMXCanvas.from_canvas(canvas))
+    path.write_bytes(path.read_bytes()[:-1])
+
+    with pytest.raises(ValueError):
+        open_show_file(path)
+
+
+def test_player_imports_no_render_stack():
+    loaded = subprocess.run(
+        [sys.executable, "-c", "import sys, services.dmx_player; print(' '.join(sorted(sys.modules)))"],
+        cwd=BACKEND_PATH,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+
+    assert not [name for name in loaded if name.split(".")[0] in {"pydantic", "models", "store", "mcp", "fastmcp", "numpy"}]
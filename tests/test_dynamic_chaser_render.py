@@ -0,0 +1,120 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from models.chasers import ChaserDefinition
+from models.cues import CueEntry, CueSheet
+from services.cue_helpers import beatToTimeMs
+from store.services.canvas_cue_expansion import expand_entry_for_render
+from store.services.canvas_rendering import render_cue_sheet_to_canvas
+from store.services.chaser_expansion import expand_chaser_cycle
+
+
+BACKEND_PATH = Path(__file__).resolve().parents[1] / "backend"
+WAVE = ChaserDefinition(
+    id="wave",
+    name="Wave",
+    description="",
+    type="dynamic",
+    generator_id="dynamic_wave_generator",
+    default_params={"fixtures": ["parcan_pl", "parcan_l", "parcan_r", "parcan_pr"], "duration_beats": 4.0, "step_size": 0.05},
+)
+
+
+def _step_rows(cue: CueEntry, params: dict, repetitions: int, bpm: float) -> list:
+    """The wave as the set_channels rows chaser apply writes into a cue sheet."""
+    expansion = expand_chaser_cycle(WAVE, params, bpm)
+    return [
+        CueEntry(
+            time=cue.time + beatToTimeMs(cycle * expansion.cycle_beats + step.beat, bpm) / 1000.0,
+            fixture_id=step.fixture_id,
+            effect=step.effect,
+            duration=step.duration_seconds,
+            data=dict(step.data),
+        )
+        for cycle in range(repetitions)
+        for step in expansion.steps
+    ]
+
+
+def test_wave_cue_renders_as_one_op_per_fixture():
+    cue = CueEntry(time=1.0, chaser_id="wave", data={"repetitions": 3, "speed": 2.0})
+
+    expanded = expand_entry_for_render(cue, [WAVE], 120.0, 50)
+
+    assert [entry.fixture_id for entry in expanded] == WAVE.default_params["fixtures"]
+    assert {entry.effect for entry in expanded} == {"dynamic_wave"}
+    assert all(entry.data["params"]["speed"] == 2.0 for entry in expanded)
+    assert len(expanded) * 60 < len(_step_rows(cue, {"speed": 2.0}, 3, 120.0))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("bpm,repetitions,params", [(120.0, 1, {}), (128.0, 2, {"speed": 2.5}), (96.0, 3, {"step_size": 0.25})])
+async def test_native_wave_matches_step_expansion(make_state_manager, bpm: float, repetitions: int, params: dict):
+    state_manager = await make_state_manager()
+    cue = CueEntry(time=0.731, chaser_id="wave", data={"repetitions": repetitions, **params})
+    render_kwargs = {
+        "fixtures": state_manager.fixtures,
+        "chasers": [WAVE],
+        "bpm": bpm,
+        "song_length_seconds": 2.0 + repetitions * 4.0 * 60.0 / bpm,
+        "fps": 50,
+        "apply_arm": state_manager._apply_arm,
+    }
+
+    native = render_cue_sheet_to_canvas(cue_sheet=CueSheet(song_filename="song", entries=[cue]), **render_kwargs)
+    rows = render_cue_sheet_to_canvas(
+        cue_sheet=CueSheet(song_filename="song", entries=_step_rows(cue, params, repetitions, bpm)),
+        **render_kwargs,
+    )
+
+    assert native.buffer == rows.buffer
+
+
+@pytest.mark.asyncio
+async def test_overlapping_cue_keeps_step_row_precedence(make_state_manager):
+    state_manager = await make_state_manager()
+    wave = CueEntry(time=0.0, chaser_id="wave", data={"repetitions": 1})
+    fade = CueEntry(time=0.5, fixture_id="parcan_l", effect="fade_in", duration=0.5, data={"red": 255, "green": 0, "blue": 0})
+    render_kwargs = {
+        "fixtures": state_manager.fixtures,
+        "chasers": [WAVE],
+        "bpm": 120.0,
+        "song_length_seconds": 3.0,
+        "fps": 50,
+        "apply_arm": state_manager._apply_arm,
+    }
+
+    native = render_cue_sheet_to_canvas(cue_sheet=CueSheet(song_filename="song", entries=[wave, fade]), **render_kwargs)
+    rows = render_cue_sheet_to_canvas(
+        cue_sheet=CueSheet(song_filename="song", entries=[*_step_rows(wave, {}, 1, 120.0), fade]),
+        **render_kwargs,
+    )
+
+    # Steps starting after the fade still land on top of it, exactly as the rows do.
+    assert native.buffer == rows.buffer
+
+
+@pytest.mark.asyncio
+async def test_shipped_cue_sheet_renders_as_with_step_rows(make_state_manager, monkeypatch: pytest.MonkeyPatch):
+    state_manager = await make_state_manager()
+    state_manager.load_chasers()
+    entries = json.loads((BACKEND_PATH / "cues" / "What a Feeling - Courtney Storm.json").read_text(encoding="utf-8"))
+    cue_sheet = CueSheet(song_filename="What a Feeling - Courtney Storm", entries=entries)
+    assert any(entry.chaser_id == "parcan_blue_wave" for entry in cue_sheet.entries)
+    render_kwargs = {
+        "fixtures": state_manager.fixtures,
+        "cue_sheet": cue_sheet,
+        "chasers": state_manager.chasers,
+        "bpm": 97.0,
+        "song_length_seconds": max(entry.time + (entry.duration or 0.0) for entry in cue_sheet.entries) + 4.0,
+        "fps": 30,
+        "apply_arm": state_manager._apply_arm,
+    }
+
+    native = render_cue_sheet_to_canvas(**render_kwargs)
+    monkeypatch.setattr("store.services.canvas_cue_expansion.PARAMETRIC_RENDERERS", {})
+    rows = render_cue_sheet_to_canvas(**render_kwargs)
+
+    assert native.buffer == rows.buffer
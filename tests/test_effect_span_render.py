@@ -0,0 +1,97 @@
+from pathlib import Path
+
+import pytest
+
+from store.state import StateManager
+
+
+BACKEND_PATH = Path(__file__).resolve().parents[1] / "backend"
+SPAN_CASES = [
+    ("flash", {}),
+    ("flash", {"color": "blue"}),
+    ("flash", {"channels": ["dim", "red"]}),
+    ("strobe", {"rate": 7.5}),
+    ("strobe", {"speed": 40}),
+    ("full", {}),
+    ("blackout", {}),
+    ("fade_in", {"easing": "ease-in-out", "red": 0.5, "dim": 120}),
+    ("fade_in", {"start_value": {"red": 10}}),
+    ("fade_out", {"easing": "ease-out", "dim": 200}),
+    ("color_fade", {"start_color": "#ff0000", "end_color": "#0000ff", "easing": "ease-in"}),
+    ("color_fade", {"end_color": "#00ff00"}),
+]
+
+
+async def _fixtures(tmp_path: Path):
+    for name in ["songs", "cues", "meta"]:
+        (tmp_path / name).mkdir()
+    state_manager = StateManager(BACKEND_PATH, tmp_path / "songs", tmp_path / "cues", tmp_path / "meta")
+    await state_manager.load_fixtures(BACKEND_PATH / "fixtures" / "fixtures.json")
+    return state_manager.fixtures
+
+
+def _frame_by_frame(fixture, universe, effect, data, first_frame, last_frame, start_frame, end_frame):
+    universe = bytearray(universe)
+    render_state = {}
+    columns = {channel: bytearray() for channel in range(len(universe))}
+    for frame_index in range(first_frame, last_frame + 1):
+        fixture.render_effect(
+            universe,
+            effect=effect,
+            frame_index=frame_index,
+            start_frame=start_frame,
+            end_frame=end_frame,
+            fps=50,
+            data=dict(data),
+            render_state=render_state,
+        )
+        for channel, value in enumerate(universe):
+            columns[channel].append(value)
+    return columns, render_state
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("effect,data", SPAN_CASES)
+async def test_span_kernel_matches_frame_by_frame_render(tmp_path: Path, effect: str, data: dict):
+    universe = bytearray((index * 37) % 256 for index in range(512))
+
+    for fixture in await _fixtures(tmp_path):
+        for first_frame, last_frame, start_frame, end_frame in [(10, 70, 10, 70), (25, 50, 10, 70), (10, 10, 10, 10)]:
+            expected, expected_state = _frame_by_frame(fixture, universe, effect, data, first_frame, last_frame, start_frame, end_frame)
+            render_state = {}
+            columns = fixture.render_effect_span(
+                universe,
+                effect=effect,
+                first_frame=first_frame,
+                last_frame=last_frame,
+                start_frame=start_frame,
+                end_frame=end_frame,
+                fps=50,
+                data=dict(data),
+                render_state=render_state,
+            )
+            if columns is None:
+                continue
+            count = last_frame - first_frame + 1
+            for channel in range(len(universe)):
+                assert columns.get(channel, bytes((universe[channel],)) * count) == bytes(expected[channel]), (fixture.id, effect, channel)
+            assert render_state == expected_state
+
+
+@pytest.mark.asyncio
+async def test_stateful_effects_fall_back_to_frame_rendering(tmp_path: Path):
+    head = next(fixture for fixture in await _fixtures(tmp_path) if fixture.id == "head_el150")
+
+    columns = head.render_effect_span(
+        bytearray(512),
+        effect="move_to",
+        first_frame=0,
+        last_frame=10,
+        start_frame=0,
+        end_frame=10,
+        fps=50,
+        data={"pan": 1000, "tilt": 2000},
+        render_state={},
+    )
+
+    assert columns is None
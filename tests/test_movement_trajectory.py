@@ -0,0 +1,73 @@
+from pathlib import Path
+
+import pytest
+
+from models.fixtures.moving_heads.trajectory import MovementTrajectory
+from store.state import StateManager
+
+
+BACKEND_PATH = Path(__file__).resolve().parents[1] / "backend"
+POIS = [
+    {"id": "subject", "location": {"x": 0.5, "y": 0.5, "z": 0.0}, "fixtures": {"head_el150": {"pan": 30000, "tilt": 36000}}},
+    {"id": "start", "fixtures": {"head_el150": {"pan": 6000, "tilt": 10000}}},
+    {"id": "ref_0_0_0", "location": {"x": 0.0, "y": 0.0, "z": 0.0}, "fixtures": {"head_el150": {"pan": 10000, "tilt": 10000}}},
+    {"id": "ref_1_1_0", "location": {"x": 1.0, "y": 1.0, "z": 0.0}, "fixtures": {"head_el150": {"pan": 52000, "tilt": 50000}}},
+]
+MOVEMENTS = [
+    ("sweep", {"subject_POI": "subject", "start_POI": "start", "easing": 0.5, "__sweep_preroll_frames": 20}),
+    ("orbit", {"subject_POI": "subject", "start_POI": "start", "orbits": 2.0, "__orbit_preroll_frames": 20}),
+    ("orbit_out", {"subject_POI": "subject", "start_POI": "start", "easing": "linear"}),
+    ("circle", {"target_poi": "subject", "radius": 0.4, "orbits": -1.0}),
+]
+
+
+async def _mover(tmp_path: Path):
+    for name in ["songs", "cues", "meta"]:
+        (tmp_path / name).mkdir()
+    state_manager = StateManager(BACKEND_PATH, tmp_path / "songs", tmp_path / "cues", tmp_path / "meta")
+    await state_manager.load_fixtures(BACKEND_PATH / "fixtures" / "fixtures.json")
+    state_manager.poi_db.pois = POIS
+    fixture = next(item for item in state_manager.fixtures if item.id == "head_el150")
+    universe = bytearray(state_manager.editor_universe)
+    universe[fixture._absolute_channel("dim") - 1] = 180
+    fixture._write_axis_u16_to_universe(universe, "pan", 60000)
+    return fixture, universe
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("effect,data", MOVEMENTS)
+async def test_trajectory_span_matches_frame_by_frame_render(tmp_path: Path, effect: str, data: dict):
+    fixture, base = await _mover(tmp_path)
+    universe = bytearray(base)
+    render_state = {}
+    frames = []
+    for frame_index in range(10, 131):
+        fixture.render_effect(universe, effect=effect, frame_index=frame_index, start_frame=10, end_frame=130, fps=50, data=data, render_state=render_state)
+        frames.append(bytes(universe))
+
+    trajectory = render_state["trajectory"]
+    assert isinstance(trajectory, MovementTrajectory)
+    assert trajectory.pan_tilt_at(130) == (fixture._read_axis_u16_from_universe(universe, "pan"), fixture._read_axis_u16_from_universe(universe, "tilt"))
+
+    columns = fixture.render_effect_span(
+        bytearray(base), effect=effect, first_frame=10, last_frame=130, start_frame=10, end_frame=130, fps=50, data=data, render_state={}
+    )
+    assert columns
+    for offset, values in columns.items():
+        assert bytes(values) == bytes(frame[offset] for frame in frames)
+    for offset in range(len(base)):
+        if offset not in columns:
+            assert all(frame[offset] == base[offset] for frame in frames)
+
+
+@pytest.mark.asyncio
+async def test_span_resumes_mid_cue_from_the_cached_trajectory(tmp_path: Path):
+    fixture, base = await _mover(tmp_path)
+    effect, data = MOVEMENTS[0]
+    render_state = {}
+    full = fixture.render_effect_span(bytearray(base), effect=effect, first_frame=0, last_frame=100, start_frame=0, end_frame=100, fps=50, data=data, render_state=render_state)
+
+    # The tail is read from the trajectory built at frame 0, whatever universe it is given.
+    tail = fixture.render_effect_span(bytearray(512), effect=effect, first_frame=60, last_frame=100, start_frame=0, end_frame=100, fps=50, data=data, render_state=render_state)
+
+    assert {offset: values[60:] for offset, values in full.items()} == tail
@@ -1,5 +1,6 @@
 import pytest
 
+from store.dmx_canvas import DMXCanvas
 from store.state import StateManager
 from store.state_manager.core import bootstrap as bootstrap_module
 from store.state_manager.playback import transport as transport_module
@@ -32,4 +33,29 @@ async def test_playback_timecode_uses_monotonic_anchor(monkeypatch, tmp_path):
 
     await state_manager.set_playback_state(False)
     paused_timecode = await state_manager.get_timecode()
-    assert abs(paused_timecode - 14.035) < 0.01
\ No newline at end of file
+    assert abs(paused_timecode - 14.035) < 0.01
+
+@pytest.mark.asyncio
+async def test_advance_timecode_reports_the_output_frame(monkeypatch, tmp_path):
+    clock = {"now": 100.0}
+    monkeypatch.setattr(bootstrap_module, "perf_counter", lambda: clock["now"])
+    monkeypatch.setattr(transport_module, "perf_counter", lambda: clock["now"])
+
+    state_manager = StateManager(backend_path=tmp_path / "backend")
+    state_manager.song_length_seconds = 2.0
+    state_manager.canvas = DMXCanvas.allocate(fps=50, total_frames=101)
+    await state_manager.set_playback_state(True)
+
+    clock["now"] += 1 / 60
+    first = await state_manager.advance_timecode(1 / 60)
+    clock["now"] += 0.002
+    repeated = await state_manager.advance_timecode(1 / 60)
+    clock["now"] += 1 / 60
+    following = await state_manager.advance_timecode(1 / 60)
+
+    # The 60 Hz ticker lands twice on the same 50 FPS frame; the ticker sends it once.
+    assert first == repeated == (state_manager.canvas_applied_seq, 1)
+    assert following == (state_manager.canvas_applied_seq, 2)
+
+    await state_manager.set_playback_state(False)
+    assert await state_manager.advance_timecode(1 / 60) is None
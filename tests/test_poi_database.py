@@ -98,3 +98,27 @@ async def test_poi_update_fixture_node_add_and_update(temp_pois_file):
         data = json.load(f)
     assert data[0]["fixtures"]["fixture_a"]["pan"] == 333
     assert data[0]["fixtures"]["fixture_a"]["tilt"] == 444
+
+
+@pytest.mark.asyncio
+async def test_fixture_pan_tilt_index_follows_every_mutation(temp_pois_file):
+    db = PoiDatabase(temp_pois_file)
+    assert db.get_fixture_pan_tilt_u16("piano", "head") == (None, None)
+
+    await db.create({"id": "Piano", "fixtures": {"Head": {"pan": 1000, "tilt": 2000}, "beam": {"pan_msb": 1, "pan_lsb": 2, "tilt": 3, "tilt_fine": 4}}})
+    assert db.get_fixture_pan_tilt_u16(" piano", "head") == (1000, 2000)
+    assert db.get_fixture_pan_tilt_u16("piano", "beam") == (258, 772)
+
+    await db.set_fixture_target("piano", "Head", {"pan": 70000, "tilt": 5})
+    assert db.get_fixture_pan_tilt_u16(" piano", "head") == (65535, 5)
+
+    await db.update("Piano", {"fixtures": {"head": {"tilt": 9}}})
+    assert db.get_fixture_pan_tilt_u16(" piano", "head") == (None, 9)
+    assert db.get_fixture_pan_tilt_u16("piano", "beam") == (None, None)
+
+    await db.delete("Piano")
+    assert db.get_fixture_pan_tilt_u16(" piano", "head") == (None, None)
+
+    db.pois = [{"id": "piano", "fixtures": {"head": {"pan": 7, "tilt": 8}}}]
+    assert db.get_fixture_pan_tilt_u16(" piano", "head") == (7, 8)
+    assert db.get_fixture_target_sync("PIANO", "Head") == {"pan": 7, "tilt": 8}
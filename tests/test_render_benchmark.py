@@ -0,0 +1,22 @@
+import pytest
+
+from tests.render_benchmark import benchmark_size, prepare_state_manager, song_seconds_for, synthetic_cue_sheet
+
+
+def test_synthetic_cue_sheet_is_deterministic_and_mixed():
+    sheet = synthetic_cue_sheet(400, song_seconds_for(400))
+
+    assert sheet == synthetic_cue_sheet(400, song_seconds_for(400))
+    assert len(sheet.entries) == 400
+    assert {entry.chaser_id for entry in sheet.entries if entry.is_chaser} == {"bench_static", "bench_dynamic"}
+    assert {entry.effect for entry in sheet.entries if not entry.is_chaser} == {"flash", "sweep", "orbit"}
+
+
+@pytest.mark.asyncio
+async def test_benchmark_reports_every_timed_renderer():
+    result = benchmark_size(await prepare_state_manager(), 100, memory=False)
+
+    for key in ["render_cue_sheet_to_canvas", "render_preview_canvas", "render_preview_chaser_canvas"]:
+        assert result[key]["frames"] > 0
+        assert result[key]["frames_per_second"] > 0
+    assert result["iter_cues_for_render"]["render_cues"] > 100